@@ -0,0 +1,70 @@
+"""
+Compares the wire codecs on a GetStatus reply and a patch message.
+
+Run from the repository root with ``python -m benchmarks.bench_codec``.
+"""
+
+import timeit
+
+from goxlr.codec import CODECS
+
+from goxlr.mock import generate_status
+
+
+def payloads() -> dict:
+    return {
+        "status": {"id": 1, "data": {"Status": generate_status()}},
+        "patch": {
+            "id": 2**64 - 1,
+            "data": {
+                "Patch": [
+                    {
+                        "op": "replace",
+                        "path": "/mixers/S210800000AAA/button_down/Fader1Mute",
+                        "value": True,
+                    }
+                ]
+            },
+        },
+    }
+
+
+def per_call(function, number: int) -> float:
+    return timeit.timeit(function, number=number) / number * 1e6
+
+
+def measure(number: int = 200) -> list:
+    """
+    Times encoding and decoding each payload with every installed codec.
+
+    :return: One result per codec and payload, in microseconds per call.
+    """
+    results = []
+
+    for name, codec in CODECS.items():
+        try:
+            codec = codec()
+        except ImportError:
+            continue
+
+        for payload_name, payload in payloads().items():
+            text = codec.encode(payload)
+            data = text.encode()
+
+            results.append(
+                {
+                    "codec": name,
+                    "payload": payload_name,
+                    "size": len(data),
+                    "encode_us": per_call(lambda: codec.encode(payload), number),
+                    "decode_str_us": per_call(lambda: codec.decode(text), number),
+                    "decode_bytes_us": per_call(lambda: codec.decode(data), number),
+                }
+            )
+
+    return results
+
+
+if __name__ == "__main__":
+    for result in measure():
+        print(result)
@@ -0,0 +1,48 @@
+"""
+Measures how long ``import goxlr`` takes in a fresh interpreter.
+
+Run from the repository root with ``python -m benchmarks.bench_import``.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+SCRIPT = (
+    "import time; start = time.perf_counter(); import goxlr; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure(number: int = 20) -> dict:
+    """
+    Imports goxlr in ``number`` new interpreters.
+
+    :return: The median and fastest import time, in milliseconds.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+
+    samples = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", SCRIPT],
+                env=env,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(number)
+    ]
+
+    return {
+        "imports": number,
+        "import_median_ms": statistics.median(samples) * 1e3,
+        "import_min_ms": min(samples) * 1e3,
+    }
+
+
+if __name__ == "__main__":
+    print(measure())
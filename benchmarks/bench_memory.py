@@ -0,0 +1,178 @@
+"""
+Measures the memory used by one status snapshot, and compares it with the
+models of an earlier revision of the library.
+
+Run from the repository root with ``python -m benchmarks.bench_memory``,
+which compares with the first commit, or pass ``--baseline <revision>``.
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+
+from goxlr.types.models import LazyModel, Status
+
+from goxlr.mock import generate_status
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run by the baseline revision's interpreter, with its goxlr importable.
+BASELINE_SCRIPT = """
+import gc, json, sys, tracemalloc
+from goxlr.types.models import Status
+
+frame, snapshots = sys.stdin.read(), int(sys.argv[1])
+gc.collect()
+tracemalloc.start()
+before = tracemalloc.get_traced_memory()[0]
+kept = [Status(json.loads(frame)) for _ in range(snapshots)]
+gc.collect()
+print((tracemalloc.get_traced_memory()[0] - before) / snapshots)
+"""
+
+
+def walk(obj, seen=None):
+    """
+    Yields every model object reachable from ``obj``.
+    """
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, dict):
+        for value in obj.values():
+            yield from walk(value, seen)
+    elif isinstance(obj, list):
+        for value in obj:
+            yield from walk(value, seen)
+    elif hasattr(obj, "__dataclass_fields__"):
+        yield obj
+        for name in obj.__dataclass_fields__:
+            yield from walk(getattr(obj, name, None), seen)
+
+
+def retained(build, snapshots: int) -> float:
+    """
+    Returns the bytes per snapshot still held once ``build`` returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / snapshots
+
+
+def baseline_retained(revision: str, frame: str, snapshots: int) -> float:
+    """
+    Measures the same snapshots built by the models of another revision,
+    checked out with ``git archive`` and run in a separate interpreter.
+    """
+    archive = subprocess.run(
+        ["git", "archive", revision, "goxlr"],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+    ).stdout
+
+    with tempfile.TemporaryDirectory() as directory:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(directory)
+
+        result = subprocess.run(
+            [sys.executable, "-c", BASELINE_SCRIPT, str(snapshots)],
+            input=frame,
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+    return float(result.stdout)
+
+
+def measure(
+    device_type: str = "Full", snapshots: int = 100, baseline: str = None
+) -> dict:
+    """
+    Builds ``snapshots`` statuses and reports the memory they hold on to:
+    a default snapshot, a live status that keeps its raw document for
+    patching (as `GoXLR` does) and the raw document alone. Documents are
+    decoded while measuring, as the reader decodes them from the socket.
+
+    :param baseline: A git revision to measure the same snapshots with.
+    """
+    document = generate_status(device_type)
+    for mixer in document["mixers"].values():
+        # older models can't read the submix levels, so every revision is
+        # given the same document without them
+        mixer["levels"]["submix"] = None
+    frame = json.dumps(document)
+
+    def snapshot():
+        return [Status(json.loads(frame)) for _ in range(snapshots)]
+
+    def live():
+        return [Status(json.loads(frame), keep_raw=True) for _ in range(snapshots)]
+
+    def raw():
+        return [json.loads(frame) for _ in range(snapshots)]
+
+    models = list(walk(Status(json.loads(frame))))
+    with_dict = [m for m in models if hasattr(m, "__dict__")]
+
+    results = {
+        "device_type": device_type,
+        "bytes_per_snapshot": retained(snapshot, snapshots),
+        "bytes_per_live_status": retained(live, snapshots),
+        "raw_bytes_per_snapshot": retained(raw, snapshots),
+        "models_per_snapshot": len(models),
+        "models_with_dict": len(with_dict),
+        "lazy_models": sum(isinstance(m, LazyModel) for m in models),
+        "instance_dict_bytes": sum(sys.getsizeof(m.__dict__) for m in with_dict),
+    }
+
+    if baseline:
+        results["baseline"] = baseline
+        results["baseline_bytes_per_snapshot"] = baseline_retained(
+            baseline, frame, snapshots
+        )
+        results["saving_vs_baseline"] = (
+            1 - results["bytes_per_snapshot"] / results["baseline_bytes_per_snapshot"]
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--baseline",
+        help="the git revision to compare with, the first commit by default",
+    )
+    args = parser.parse_args()
+
+    baseline = (
+        args.baseline
+        or subprocess.run(
+            ["git", "rev-list", "--max-parents=0", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()[0]
+    )
+
+    for device_type in ("Full", "Mini"):
+        print(measure(device_type, baseline=baseline))
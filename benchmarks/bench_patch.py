@@ -0,0 +1,113 @@
+"""
+Measures how fast patches from the daemon are handled.
+
+Run from the repository root with ``python -m benchmarks.bench_patch``.
+"""
+
+import asyncio
+import statistics
+import time
+import timeit
+
+from goxlr import GoXLR
+from goxlr.mock import MockDaemon, generate_status
+from goxlr.patch import apply_to_status
+from goxlr.types.enums import Button, Channel
+from goxlr.types.models import Patch, Status
+
+
+def apply(number: int = 10000) -> dict:
+    """
+    Times applying a patch to a status, without the network.
+    """
+    status = Status(generate_status(), keep_raw=True)
+    serial = next(iter(status.mixers))
+    values = iter(range(number))
+    patch = lambda: Patch(
+        {
+            "op": "replace",
+            "path": f"/mixers/{serial}/levels/volumes/Mic",
+            "value": next(values),
+        }
+    )
+
+    seconds = timeit.timeit(lambda: apply_to_status(status, patch()), number=number)
+    return {"patches": number, "apply_us": seconds / number * 1e6}
+
+
+async def receive(xlr: GoXLR, daemon: MockDaemon, number: int) -> dict:
+    """
+    Times the daemon sending ``number`` patches until the client has
+    applied the last one, waiting with `receive_patch`.
+    """
+    path = f"/mixers/{xlr.serial}/levels/volumes/Mic"
+    final = number - 1
+
+    async def consume():
+        while xlr.mixer.levels.volumes[Channel.Mic] != final:
+            await xlr.receive_patch()
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    for value in range(number):
+        await daemon.apply([(path, value)])
+    await consumer
+    elapsed = time.perf_counter() - start
+
+    return {"patches": number, "patches_per_second": number / elapsed}
+
+
+async def button(xlr: GoXLR, daemon: MockDaemon, number: int) -> dict:
+    """
+    Times `wait_for_button` from the button being pressed until it returns.
+    Each wait starts with the button up, so none of them returns at once.
+    """
+    path = f"/mixers/{xlr.serial}/button_down/{Button.Bleep.name}"
+    latencies = []
+
+    for _ in range(number):
+        # the previous release may not have been applied yet
+        while xlr.get_button_down(Button.Bleep):
+            await asyncio.sleep(0)
+
+        waiter = asyncio.create_task(xlr.wait_for_button([Button.Bleep]))
+        await asyncio.sleep(0)
+        assert not waiter.done(), "the button was still down"
+
+        start = time.perf_counter()
+        await daemon.apply([(path, True)])
+        await waiter
+        latencies.append(time.perf_counter() - start)
+
+        await daemon.apply([(path, False)])
+
+    return {
+        "presses": number,
+        "wait_for_button_p50_us": statistics.median(latencies) * 1e6,
+        "wait_for_button_max_us": max(latencies) * 1e6,
+    }
+
+
+async def run(patches: int = 5000, presses: int = 200) -> dict:
+    async with MockDaemon() as daemon:
+        async with GoXLR(port=daemon.port) as xlr:
+            return {
+                "apply": apply(),
+                "receive_patch": await receive(xlr, daemon, patches),
+                "wait_for_button": await button(xlr, daemon, presses),
+            }
+
+
+def measure(**kwargs) -> dict:
+    """
+    Measures applying patches locally, patch throughput from the daemon and
+    the latency of `wait_for_button`.
+    """
+    return asyncio.run(run(**kwargs))
+
+
+if __name__ == "__main__":
+    for name, result in measure().items():
+        print(name, result)
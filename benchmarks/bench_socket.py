@@ -0,0 +1,106 @@
+"""
+Measures request round trips against the mock daemon.
+
+Run from the repository root with ``python -m benchmarks.bench_socket``.
+"""
+
+import asyncio
+import statistics
+import time
+
+from goxlr import GoXLR
+from goxlr.mock import MockDaemon
+from goxlr.types.enums import Channel
+
+
+def percentile(samples: list, percent: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+async def round_trips(xlr: GoXLR, request, requests: int, concurrency: int) -> dict:
+    """
+    Sends ``requests`` requests from ``concurrency`` concurrent workers, each
+    sending its share one after the other.
+    """
+    latencies = []
+
+    async def worker(count):
+        for _ in range(count):
+            start = time.perf_counter()
+            await request(xlr)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "rtt_p50_us": statistics.median(latencies) * 1e6,
+        "rtt_p99_us": percentile(latencies, 99) * 1e6,
+    }
+
+
+async def connect(port: int, number: int) -> dict:
+    """
+    Times opening a connection, including the first status update.
+    """
+    latencies = []
+
+    for _ in range(number):
+        start = time.perf_counter()
+        xlr = GoXLR(port=port)
+        await xlr.connect()
+        latencies.append(time.perf_counter() - start)
+        await xlr.close()
+
+    return {
+        "connections": number,
+        "connect_p50_us": statistics.median(latencies) * 1e6,
+        "connect_max_us": max(latencies) * 1e6,
+    }
+
+
+REQUESTS = {
+    "ping": lambda xlr: xlr.ping(),
+    "set_volume": lambda xlr: xlr.set_volume(Channel.Mic, 200),
+}
+
+
+async def run(
+    requests: int = 2000,
+    concurrency: tuple = (1, 8, 64, 256),
+    latency: float = 0.0,
+    jitter: float = 0.0,
+) -> dict:
+    async with MockDaemon(latency=latency, jitter=jitter, seed=0) as daemon:
+        results = {"connect": await connect(daemon.port, 20), "round_trips": []}
+
+        async with GoXLR(port=daemon.port) as xlr:
+            for name, request in REQUESTS.items():
+                for workers in concurrency:
+                    result = await round_trips(xlr, request, requests, workers)
+                    results["round_trips"].append({"request": name, **result})
+
+    return results
+
+
+def measure(**kwargs) -> dict:
+    """
+    Measures connecting and the round trip time and throughput of requests
+    at several concurrency levels.
+
+    :param kwargs: Passed to `run`, e.g. ``latency=0.001`` to simulate a
+                   slower daemon.
+    """
+    return asyncio.run(run(**kwargs))
+
+
+if __name__ == "__main__":
+    results = measure()
+    print(results["connect"])
+    for result in results["round_trips"]:
+        print(result)
@@ -0,0 +1,74 @@
+"""
+Measures how long it takes to build a status from a GetStatus reply.
+
+Run from the repository root with ``python -m benchmarks.bench_status``.
+"""
+
+import timeit
+
+from goxlr.types.models import Status
+
+from goxlr.mock import generate_status
+
+
+def measure(number: int = 200) -> list:
+    """
+    Times building a `Status` for each device type, eagerly and lazily.
+
+    :return: One result per device type and mode, in microseconds per call.
+    """
+    results = []
+
+    for device_type in ("Full", "Mini"):
+        document = generate_status(device_type)
+
+        for lazy in (False, True):
+            seconds = timeit.timeit(lambda: Status(document, lazy=lazy), number=number)
+            results.append(
+                {
+                    "device_type": device_type,
+                    "lazy": lazy,
+                    "construct_us": seconds / number * 1e6,
+                }
+            )
+
+    return results
+
+
+def scaling(number: int = 20) -> list:
+    """
+    Times building a `Status` as the number of mixers and the number of
+    samples per button grow.
+
+    :return: One result per size, in microseconds per call.
+    """
+    results = []
+
+    for mixers, samples_per_button in (
+        (1, 1),
+        (4, 1),
+        (16, 1),
+        (1, 50),
+        (1, 500),
+        (4, 500),
+    ):
+        document = generate_status(
+            mixers=mixers,
+            samples_per_button=samples_per_button,
+            sample_files=samples_per_button * 4,
+        )
+        seconds = timeit.timeit(lambda: Status(document), number=number)
+        results.append(
+            {
+                "mixers": mixers,
+                "samples_per_button": samples_per_button,
+                "construct_us": seconds / number * 1e6,
+            }
+        )
+
+    return results
+
+
+if __name__ == "__main__":
+    for result in measure() + scaling():
+        print(result)
@@ -0,0 +1,126 @@
+"""
+Runs every benchmark and saves the results as JSON, so releases can be
+compared with each other.
+
+Run from the repository root with
+``python -m benchmarks.run --output results.json``, and compare two runs with
+``python -m benchmarks.run --compare old.json new.json``.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from goxlr import __version__
+
+from . import (
+    bench_codec,
+    bench_import,
+    bench_memory,
+    bench_patch,
+    bench_socket,
+    bench_status,
+)
+
+BENCHMARKS = {
+    "status": bench_status.measure,
+    "status_scaling": bench_status.scaling,
+    "memory": lambda: [bench_memory.measure(d) for d in ("Full", "Mini")],
+    "codec": bench_codec.measure,
+    "socket": bench_socket.measure,
+    "patch": bench_patch.measure,
+    "import": bench_import.measure,
+}
+
+
+def run(names: list = None) -> dict:
+    """
+    Runs the named benchmarks, or all of them.
+
+    :return: The results keyed by benchmark name, with the version and
+             platform they were measured on.
+    """
+    results = {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "results": {},
+    }
+
+    for name in names or BENCHMARKS:
+        print(f"running {name}", file=sys.stderr)
+        results["results"][name] = BENCHMARKS[name]()
+
+    return results
+
+
+def flatten(value, prefix: str = "") -> dict:
+    """
+    Flattens results to their numbers, keyed by path. List items are keyed
+    by their non-numeric fields, e.g. ``codec/codec=json,payload=status``.
+    """
+    if isinstance(value, dict):
+        flat = {}
+        for key, item in value.items():
+            flat.update(flatten(item, f"{prefix}/{key}" if prefix else key))
+        return flat
+
+    if isinstance(value, list):
+        flat = {}
+        for index, item in enumerate(value):
+            if isinstance(item, dict):
+                label = ",".join(
+                    f"{k}={v}" for k, v in item.items() if isinstance(v, (str, bool))
+                )
+            else:
+                label = str(index)
+            flat.update(flatten(item, f"{prefix}/{label or index}"))
+        return flat
+
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: value}
+
+    return {}
+
+
+def compare(old: dict, new: dict):
+    """
+    Prints every number measured in both runs with the relative change.
+    """
+    print(f"{old['version']} -> {new['version']}")
+    old, new = flatten(old["results"]), flatten(new["results"])
+
+    for key in sorted(old.keys() & new.keys()):
+        if old[key]:
+            change = (new[key] - old[key]) / old[key] * 100
+            print(f"{key}: {old[key]:.6g} -> {new[key]:.6g} ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run")
+    parser.add_argument("benchmarks", nargs="*", help=", ".join(BENCHMARKS))
+    parser.add_argument("--output", help="file to save the results to")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    args = parser.parse_args()
+
+    if args.compare:
+        old, new = (json.load(open(path)) for path in args.compare)
+        compare(old, new)
+        return
+
+    if unknown := set(args.benchmarks) - BENCHMARKS.keys():
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = run(args.benchmarks)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
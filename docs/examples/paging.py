@@ -20,12 +20,13 @@ async def main():
 
             faders = pages[str(page)]
 
-            for fader, data in faders.items():
-                channel = getattr(Channel, data["channel"])
+            async with goxlr.batch() as batch:
+                for fader, data in faders.items():
+                    channel = getattr(Channel, data["channel"])
 
-                await goxlr.set_fader(Fader[fader], channel)
-                await goxlr.set_scribble_text(Fader[fader], channel.name)
-                await goxlr.set_scribble_icon(Fader[fader], data["icon"])
+                    batch.set_fader(Fader[fader], channel)
+                    batch.set_scribble_text(Fader[fader], channel.name)
+                    batch.set_scribble_icon(Fader[fader], data["icon"])
 
             presets = [
                 Button.EffectSelect1,
@@ -0,0 +1,61 @@
+import os
+import tempfile
+
+from .codec import Codec, pack, unpack
+
+# The header of a cache file, and its version, which is bumped whenever
+# the saved form of the status changes.
+CACHE_MAGIC = b"GXST"
+CACHE_VERSION = 2
+
+
+def cache_path(directory: str | os.PathLike, host: str, port: int) -> str:
+    """
+    :return: The file the status of the daemon at host:port is cached in.
+    """
+    host = "".join(c if c.isalnum() or c in ".-" else "_" for c in str(host))
+    return os.path.join(directory, f"status-{host}-{port}.cache")
+
+
+def load_status(path: str | os.PathLike, codec: str | Codec = "json") -> dict | None:
+    """
+    Reads a status saved with `save_status()`. The file is only ever
+    decoded as JSON.
+
+    :param codec: The JSON codec to decode the status with, see
+                  `goxlr.codec.get_codec()`.
+
+    :return: The raw status document, or None if there is no usable cache.
+    """
+    try:
+        with open(path, "rb") as file:
+            version, status = unpack(file.read(), CACHE_MAGIC, codec)
+    except (OSError, ValueError):
+        return None  # missing, unreadable or not a cache file
+
+    if version != CACHE_VERSION or not isinstance(status, dict):
+        return None
+
+    return status
+
+
+def save_status(path: str | os.PathLike, status: dict, codec: str | Codec = "json"):
+    """
+    Saves a raw status document in a compact binary form, see
+    `goxlr.codec.pack()`. The file is replaced in one step, so a reader
+    never sees half of it.
+
+    :param codec: The JSON codec to encode the status with, see
+                  `goxlr.codec.get_codec()`.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(pack(status, CACHE_MAGIC, CACHE_VERSION, codec))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
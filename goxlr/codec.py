@@ -0,0 +1,169 @@
+import json
+import struct
+import warnings
+import zlib
+from typing import Any, Dict, Tuple, Type
+
+
+class Codec:
+    """
+    Encodes payloads sent to the daemon and decodes its responses.
+
+    Every codec's `decode` accepts both str and bytes, and passes bytes to
+    the underlying library as is where the library supports it. `encode`
+    always returns a str, since the daemon expects text frames.
+    """
+
+    name = None
+
+    def encode(self, obj: Any) -> str:
+        raise NotImplementedError
+
+    def decode(self, data: str | bytes) -> Any:
+        raise NotImplementedError
+
+
+class JsonCodec(Codec):
+    """
+    The standard library's json module. Always available.
+    """
+
+    name = "json"
+
+    def encode(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def decode(self, data: str | bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """
+    https://github.com/ijl/orjson
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self.dumps = orjson.dumps
+        self.loads = orjson.loads
+
+    def encode(self, obj: Any) -> str:
+        return self.dumps(obj).decode()
+
+    def decode(self, data: str | bytes) -> Any:
+        return self.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """
+    https://github.com/jcrist/msgspec
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self.encoder = msgspec.json.Encoder()
+        self.decoder = msgspec.json.Decoder()
+
+    def encode(self, obj: Any) -> str:
+        return self.encoder.encode(obj).decode()
+
+    def decode(self, data: str | bytes) -> Any:
+        return self.decoder.decode(data)
+
+
+class UjsonCodec(Codec):
+    """
+    https://github.com/ultrajson/ultrajson
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+
+        self.dumps = ujson.dumps
+        self.loads = ujson.loads
+
+    def encode(self, obj: Any) -> str:
+        return self.dumps(obj, ensure_ascii=False)
+
+    def decode(self, data: str | bytes) -> Any:
+        return self.loads(data)
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    codec.name: codec for codec in (JsonCodec, OrjsonCodec, MsgspecCodec, UjsonCodec)
+}
+
+
+def get_codec(codec: str | Codec = "json") -> Codec:
+    """
+    Returns a codec by name, falling back to the standard library's json
+    module if the library it needs is not installed.
+
+    :param codec: One of ``json``, ``orjson``, ``msgspec`` or ``ujson``, or
+                  a `Codec` instance, which is returned as is.
+
+    :return: The codec.
+
+    :raises ValueError: If the codec name is unknown.
+    """
+    if isinstance(codec, Codec):
+        return codec
+
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec: {codec}")
+
+    try:
+        return CODECS[codec]()
+    except ImportError:
+        warnings.warn(f"{codec} is not installed, falling back to json")
+        return JsonCodec()
+
+
+def pack(obj: Any, magic: bytes, version: int, codec: str | Codec = "json") -> bytes:
+    """
+    Stores a JSON document in a compact binary form: a 4 byte header saying
+    what the document is, its version as 2 bytes, then the document encoded
+    with a codec and compressed with zlib. Unlike pickle, reading it back
+    can't run any code.
+
+    :param obj: The document, made of JSON types only.
+    :param magic: The 4 byte header, e.g. ``b"GXSC"`` for a scene.
+    :param version: The version of the document's form, see `unpack()`.
+    :param codec: The codec to encode the document with, see `get_codec()`.
+
+    :return: The packed document.
+    """
+    header = magic + struct.pack(">H", version)
+    return header + zlib.compress(get_codec(codec).encode(obj).encode())
+
+
+def unpack(data: bytes, magic: bytes, codec: str | Codec = "json") -> Tuple[int, Any]:
+    """
+    Reads a document stored with `pack()`.
+
+    :param data: The packed document.
+    :param magic: The header the document must start with.
+    :param codec: The codec to decode the document with, see `get_codec()`.
+
+    :return: The version of the document's form and the document.
+
+    :raises ValueError: If the data is not a packed document of this kind,
+                        or is damaged.
+    """
+    if len(data) < 6 or data[:4] != magic:
+        raise ValueError("Not a packed document of this kind")
+
+    (version,) = struct.unpack_from(">H", data, 4)
+    try:
+        return version, get_codec(codec).decode(zlib.decompress(data[6:]))
+    except Exception as e:
+        # zlib, JSON and text decoding errors, which differ between codecs
+        raise ValueError("The packed document is damaged") from e
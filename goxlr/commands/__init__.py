@@ -1,3 +1,4 @@
+from .batch import CommandBatch, pipeline
 from .daemon import DaemonCommands
 from .goxlr import GoXLRCommands
 from .status import StatusCommands
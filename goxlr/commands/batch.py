@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any, Awaitable, Iterable, List
+
+from ..error import BatchError
+
+
+async def pipeline(commands: Iterable[Awaitable]) -> List[Any]:
+    """
+    Sends several commands back to back without waiting for each reply,
+    then collects the replies in the order the commands were given.
+
+    :param commands: The commands to send, e.g. ``xlr.set_fader(...)``
+                     without awaiting it.
+
+    :return: The result of every command, in order.
+
+    :raises BatchError: If any of the commands failed. The results of the
+                        commands that succeeded are still available on it.
+    """
+    results = await asyncio.gather(*commands, return_exceptions=True)
+
+    if errors := [r for r in results if isinstance(r, Exception)]:
+        raise BatchError(errors, results)
+
+    return results
+
+
+class CommandBatch:
+    """
+    Collects commands inside an ``async with`` block and pipelines them when
+    the block exits. Any command method of the GoXLR object can be called on
+    the batch, it is queued instead of being sent straight away.
+
+    :param xlr: The GoXLR object to send the commands with.
+
+    :Example:
+
+    >>> async with xlr.batch() as b:
+    ...     b.set_fader(Fader.A, Channel.Mic)
+    ...     b.set_scribble_text(Fader.A, "Mic")
+    >>> b.results
+    ['Ok', 'Ok']
+    """
+
+    def __init__(self, xlr):
+        self.xlr = xlr
+        self.commands = []
+        self.results = None
+
+    def __getattr__(self, name):
+        method = getattr(self.xlr, name)
+
+        if not asyncio.iscoroutinefunction(method):
+            raise AttributeError(f"{name} is not a command and can't be batched")
+
+        def queue(*args, **kwargs):
+            self.commands.append((method, args, kwargs))
+
+        return queue
+
+    def __len__(self):
+        return len(self.commands)
+
+    async def send(self) -> List[Any]:
+        """
+        Sends every queued command and clears the queue.
+
+        :return: The result of every command, in order.
+
+        :raises BatchError: If any of the commands failed.
+        """
+        commands, self.commands = self.commands, []
+        self.results = await pipeline(
+            method(*args, **kwargs) for method, args, kwargs in commands
+        )
+        return self.results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            await self.send()
+        else:
+            self.commands.clear()
@@ -0,0 +1,364 @@
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from ..types.enums import Button, ButtonColourGroup, DisplayModeComponent, Fader
+
+# A change is a JSON pointer relative to a mixer in the status, and the raw
+# value the daemon stores there, e.g. ("/levels/volumes/Mic", 200).
+Change = Tuple[str, Any]
+
+
+# Builds the arguments of a command that sets a path to its target value,
+# from the keys matched by the path's placeholders and a function returning
+# the target value at any path. Returns a key that is the same for every
+# path the one command sets, e.g. both colours of a fader, and the arguments.
+Setter = Callable[[Tuple[str, ...], Callable[[str], Any]], Tuple[tuple, Any]]
+
+
+class _Value:
+    # {"SetMicrophoneType": "Dynamic"}
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, value) -> List[Change]:
+        return [(self.path, value)]
+
+    def setters(self) -> Iterator[Tuple[str, Setter]]:
+        yield self.path, lambda keys, target: ((), target(self.path))
+
+
+class _Inverted(_Value):
+    # {"SetCoughIsHold": True}, stored as the opposite
+    def __call__(self, value) -> List[Change]:
+        return [(self.path, not value)]
+
+    def setters(self) -> Iterator[Tuple[str, Setter]]:
+        yield self.path, lambda keys, target: ((), not target(self.path))
+
+
+class _Keyed:
+    # {"SetVolume": ["Mic", 200]}, every argument but the last fills in the
+    # path, the first through ``names`` if given
+    def __init__(self, path: str, names: Dict[str, str] = None):
+        self.path = path
+        self.names = names
+
+    def __format(self, keys) -> str:
+        if self.names:
+            keys = [self.names[keys[0]], *keys[1:]]
+        return self.path.format(*keys)
+
+    def __call__(self, args) -> List[Change]:
+        return [(self.__format(args[:-1]), args[-1])]
+
+    def setters(self) -> Iterator[Tuple[str, Setter]]:
+        def setter(keys, target):
+            return keys, [*keys, target(self.__format(keys))]
+
+        if not self.names:
+            yield self.path, setter
+            return
+
+        for name, key in self.names.items():
+            path = self.path.replace("{}", key, 1)
+            yield path, lambda keys, target, name=name: setter((name, *keys), target)
+
+
+class _Colours:
+    # {"SetFaderColours": ["A", "FF0000", "00FF00"]}, colours left as None
+    # are not changed
+    def __init__(self, path: str, keys: Tuple[str, ...]):
+        self.path = path
+        self.keys = keys
+
+    def __call__(self, args) -> List[Change]:
+        target, *colours = args
+        return [
+            (f"{self.path.format(target)}/{key}", colour)
+            for key, colour in zip(self.keys, colours)
+            if colour is not None
+        ]
+
+    def setters(self) -> Iterator[Tuple[str, Setter]]:
+        def setter(keys, target):
+            path = self.path.format(keys[0])
+            return keys, [keys[0], *(target(f"{path}/{key}") for key in self.keys)]
+
+        for key in self.keys:
+            yield f"{self.path}/{key}", setter
+
+
+class _Each:
+    # {"SetAllFaderColours": ["FF0000", "00FF00"]}, applied to every target.
+    # Sets nothing another command doesn't set for a single target.
+    def __init__(self, path: str, targets: List[str], keys: Tuple[str, ...] = None):
+        self.path = path
+        self.targets = targets
+        self.keys = keys
+
+    def __call__(self, args) -> List[Change]:
+        if self.keys is None:
+            return [(self.path.format(target), args) for target in self.targets]
+        return [
+            change
+            for target in self.targets
+            for change in _Colours(self.path, self.keys)([target, *args])
+        ]
+
+    def setters(self) -> Iterator[Tuple[str, Setter]]:
+        return iter(())
+
+
+TWO_COLOURS = ("colour_one", "colour_two")
+THREE_COLOURS = ("colour_one", "colour_two", "colour_three")
+
+BUTTON_GROUPS = {
+    ButtonColourGroup.FaderMute.name: [
+        Button.Fader1Mute.name,
+        Button.Fader2Mute.name,
+        Button.Fader3Mute.name,
+        Button.Fader4Mute.name,
+    ],
+    ButtonColourGroup.EffectSelector.name: [
+        Button.EffectSelect1.name,
+        Button.EffectSelect2.name,
+        Button.EffectSelect3.name,
+        Button.EffectSelect4.name,
+        Button.EffectSelect5.name,
+        Button.EffectSelect6.name,
+    ],
+    ButtonColourGroup.EffectTypes.name: [
+        Button.EffectMegaphone.name,
+        Button.EffectRobot.name,
+        Button.EffectHardTune.name,
+        Button.EffectFx.name,
+    ],
+}
+
+DISPLAY_COMPONENTS = {
+    DisplayModeComponent.NoiseGate.name: "gate",
+    DisplayModeComponent.Equaliser.name: "equaliser",
+    DisplayModeComponent.Compressor.name: "compressor",
+    DisplayModeComponent.EqFineTune.name: "equaliser_fine",
+}
+
+ROBOT_RANGES = {"Low": "low", "Medium": "mid", "High": "high"}
+
+FADERS = [fader.name for fader in Fader]
+
+
+# Commands whose effect on the status is known, keyed by command name.
+COMMAND_CHANGES: Dict[str, Callable[[Any], List[Change]]] = {
+    "SetShutdownCommands": _Value("/shutdown_commands"),
+    "SetSamplerPreBufferDuration": _Value("/sampler/record_buffer"),
+    # Faders
+    "SetFader": _Keyed("/fader_status/{}/channel"),
+    "SetFaderMuteFunction": _Keyed("/fader_status/{}/mute_type"),
+    "SetFaderMuteState": _Keyed("/fader_status/{}/mute_state"),
+    "SetScribbleIcon": _Keyed("/fader_status/{}/scribble/file_name"),
+    "SetScribbleText": _Keyed("/fader_status/{}/scribble/bottom_text"),
+    "SetScribbleNumber": _Keyed("/fader_status/{}/scribble/left_text"),
+    "SetScribbleInvert": _Keyed("/fader_status/{}/scribble/inverted"),
+    # Levels
+    "SetVolume": _Keyed("/levels/volumes/{}"),
+    "SetSwearButtonVolume": _Value("/levels/bleep"),
+    "SetDeesser": _Value("/levels/deess"),
+    "SetMonitorMix": _Value("/levels/output_monitor"),
+    "SetSubMixVolume": _Keyed("/levels/submix/inputs/{}/volume"),
+    "SetSubMixLinked": _Keyed("/levels/submix/inputs/{}/linked"),
+    "SetSubMixOutputMix": _Keyed("/levels/submix/outputs/{}"),
+    # Microphone
+    "SetMicrophoneType": _Value("/mic_status/mic_type"),
+    "SetMicrophoneGain": _Keyed("/mic_status/mic_gains/{}"),
+    "SetEqGain": _Keyed("/mic_status/equaliser/gain/{}"),
+    "SetEqFrequency": _Keyed("/mic_status/equaliser/frequency/{}"),
+    "SetEqMiniGain": _Keyed("/mic_status/equaliser_mini/gain/{}"),
+    "SetEqMiniFrequency": _Keyed("/mic_status/equaliser_mini/frequency/{}"),
+    "SetGateThreshold": _Value("/mic_status/noise_gate/threshold"),
+    "SetGateAttenuation": _Value("/mic_status/noise_gate/attenuation"),
+    "SetGateActive": _Value("/mic_status/noise_gate/enabled"),
+    "SetCompressorThreshold": _Value("/mic_status/compressor/threshold"),
+    "SetCompressorMakeupGain": _Value("/mic_status/compressor/makeup_gain"),
+    # Router
+    "SetRouter": _Keyed("/router/{}/{}"),
+    # Cough button
+    "SetCoughMuteFunction": _Value("/cough_button/mute_type"),
+    "SetCoughIsHold": _Inverted("/cough_button/is_toggle"),
+    "SetCoughMuteState": _Value("/cough_button/state"),
+    # Lighting
+    "SetAnimationMode": _Value("/lighting/animation/mode"),
+    "SetAnimationMod1": _Value("/lighting/animation/mod1"),
+    "SetAnimationMod2": _Value("/lighting/animation/mod2"),
+    "SetAnimationWaterfall": _Value("/lighting/animation/waterfall_direction"),
+    "SetGlobalColour": _Value("/lighting/simple/Global/colour_one"),
+    "SetFaderDisplayStyle": _Keyed("/lighting/faders/{}/style"),
+    "SetFaderColours": _Colours("/lighting/faders/{}/colours", TWO_COLOURS),
+    "SetAllFaderColours": _Each("/lighting/faders/{}/colours", FADERS, TWO_COLOURS),
+    "SetAllFaderDisplayStyle": _Each("/lighting/faders/{}/style", FADERS),
+    "SetButtonColours": _Colours("/lighting/buttons/{}/colours", TWO_COLOURS),
+    "SetButtonOffStyle": _Keyed("/lighting/buttons/{}/off_style"),
+    "SetButtonGroupColours": lambda args: _Each(
+        "/lighting/buttons/{}/colours", BUTTON_GROUPS[args[0]], TWO_COLOURS
+    )(args[1:]),
+    "SetButtonGroupOffStyle": lambda args: _Each(
+        "/lighting/buttons/{}/off_style", BUTTON_GROUPS[args[0]]
+    )(args[1]),
+    "SetSimpleColour": _Keyed("/lighting/simple/{}/colour_one"),
+    "SetEncoderColour": _Colours("/lighting/encoders/{}", THREE_COLOURS),
+    "SetSampleColour": _Colours("/lighting/sampler/{}/colours", THREE_COLOURS),
+    "SetSampleOffStyle": _Keyed("/lighting/sampler/{}/off_style"),
+    # Effects
+    "SetActiveEffectPreset": _Value("/effects/active_preset"),
+    "SetFXEnabled": _Value("/effects/is_enabled"),
+    "SetReverbStyle": _Value("/effects/current/reverb/style"),
+    "SetReverbAmount": _Value("/effects/current/reverb/amount"),
+    "SetReverbDecay": _Value("/effects/current/reverb/decay"),
+    "SetReverbEarlyLevel": _Value("/effects/current/reverb/early_level"),
+    "SetReverbTailLevel": _Value("/effects/current/reverb/tail_level"),
+    "SetReverbPreDelay": _Value("/effects/current/reverb/pre_delay"),
+    "SetReverbLowColour": _Value("/effects/current/reverb/lo_colour"),
+    "SetReverbHighColour": _Value("/effects/current/reverb/hi_colour"),
+    "SetReverbHighFactor": _Value("/effects/current/reverb/hi_factor"),
+    "SetReverbDiffuse": _Value("/effects/current/reverb/diffuse"),
+    "SetReverbModSpeed": _Value("/effects/current/reverb/mod_speed"),
+    "SetReverbModDepth": _Value("/effects/current/reverb/mod_depth"),
+    "SetEchoStyle": _Value("/effects/current/echo/style"),
+    "SetEchoAmount": _Value("/effects/current/echo/amount"),
+    "SetEchoFeedback": _Value("/effects/current/echo/feedback"),
+    "SetEchoTempo": _Value("/effects/current/echo/tempo"),
+    "SetEchoDelayLeft": _Value("/effects/current/echo/delay_left"),
+    "SetEchoDelayRight": _Value("/effects/current/echo/delay_right"),
+    "SetEchoFeedbackLeft": _Value("/effects/current/echo/feedback_left"),
+    "SetEchoFeedbackRight": _Value("/effects/current/echo/feedback_right"),
+    "SetEchoFeedbackXFBLtoR": _Value("/effects/current/echo/feedback_xfb_l_to_r"),
+    "SetEchoFeedbackXFBRtoL": _Value("/effects/current/echo/feedback_xfb_r_to_l"),
+    "SetPitchStyle": _Value("/effects/current/pitch/style"),
+    "SetPitchAmount": _Value("/effects/current/pitch/amount"),
+    "SetPitchCharacter": _Value("/effects/current/pitch/character"),
+    "SetGenderStyle": _Value("/effects/current/gender/style"),
+    "SetGenderAmount": _Value("/effects/current/gender/amount"),
+    "SetMegaphoneEnabled": _Value("/effects/current/megaphone/is_enabled"),
+    "SetMegaphoneStyle": _Value("/effects/current/megaphone/style"),
+    "SetMegaphoneAmount": _Value("/effects/current/megaphone/amount"),
+    "SetMegaphonePostGain": _Value("/effects/current/megaphone/post_gain"),
+    "SetRobotEnabled": _Value("/effects/current/robot/is_enabled"),
+    "SetRobotStyle": _Value("/effects/current/robot/style"),
+    "SetRobotGain": _Keyed("/effects/current/robot/{}_gain", ROBOT_RANGES),
+    "SetRobotFreq": _Keyed("/effects/current/robot/{}_freq", ROBOT_RANGES),
+    "SetRobotWidth": _Keyed("/effects/current/robot/{}_width", ROBOT_RANGES),
+    "SetRobotWaveform": _Value("/effects/current/robot/waveform"),
+    "SetRobotPulseWidth": _Value("/effects/current/robot/pulse_width"),
+    "SetRobotThreshold": _Value("/effects/current/robot/threshold"),
+    "SetRobotDryMix": _Value("/effects/current/robot/dry_mix"),
+    "SetHardTuneEnabled": _Value("/effects/current/hard_tune/is_enabled"),
+    "SetHardTuneStyle": _Value("/effects/current/hard_tune/style"),
+    "SetHardTuneAmount": _Value("/effects/current/hard_tune/amount"),
+    "SetHardTuneRate": _Value("/effects/current/hard_tune/rate"),
+    "SetHardTuneWindow": _Value("/effects/current/hard_tune/window"),
+    "SetHardTuneSource": _Value("/effects/current/hard_tune/source"),
+    # Sampler
+    "SetActiveSamplerBank": _Value("/sampler/active_bank"),
+    "SetSamplerFunction": _Keyed("/sampler/banks/{}/{}/function"),
+    "SetSamplerOrder": _Keyed("/sampler/banks/{}/{}/order"),
+    "SetSampleStartPercent": _Keyed("/sampler/banks/{}/{}/samples/{}/start_pct"),
+    "SetSampleStopPercent": _Keyed("/sampler/banks/{}/{}/samples/{}/stop_pct"),
+    # Display and settings
+    "SetElementDisplayMode": _Keyed("/settings/display/{}", DISPLAY_COMPONENTS),
+    "SetMuteHoldDuration": _Value("/settings/mute_hold_duration"),
+    "SetVCMuteAlsoMuteCM": _Value("/settings/vc_mute_also_mute_cm"),
+    # Profiles
+    "LoadProfile": lambda args: [("/profile_name", args[0])],
+    "LoadMicProfile": lambda args: [("/mic_profile_name", args[0])],
+}
+
+
+def command_changes(payload: dict) -> List[Change]:
+    """
+    Returns the changes a command makes to its mixer in the status, as far
+    as they can be known without the daemon.
+
+    :param payload: The command payload, e.g. ``{"SetVolume": ["Mic", 200]}``.
+
+    :return: A list of (path, value) pairs, where path is a JSON pointer
+             relative to the mixer, e.g. ``[("/levels/volumes/Mic", 200)]``.
+             Empty if the command's effect is not known.
+    """
+    (command, args), *_ = payload.items()
+
+    if changes := COMMAND_CHANGES.get(command):
+        return changes(args)
+
+    return []
+
+
+def _setter_index() -> dict:
+    index = {}
+    for command, changes in COMMAND_CHANGES.items():
+        for path, setter in changes.setters() if hasattr(changes, "setters") else ():
+            node = index
+            for token in path.strip("/").split("/"):
+                node = node.setdefault("*" if token == "{}" else token, {})
+            node[None] = (command, setter)
+    return index
+
+
+# The command that sets each path of a mixer, as a tree keyed by path token
+# with "*" for any key. Commands that set many paths at once (such as
+# SetAllFaderColours) and loading profiles are left out.
+COMMAND_SETTERS = _setter_index()
+
+
+def command_setter(tokens: List[str]) -> Tuple[str, Setter, Tuple[str, ...]] | None:
+    """
+    Finds the command that sets a path of a mixer.
+
+    :param tokens: The path relative to the mixer, e.g.
+                   ``["levels", "volumes", "Mic"]``.
+
+    :return: The command name, its `Setter` and the keys the path's
+             placeholders matched, or None if no command sets the path.
+    """
+    node, keys = COMMAND_SETTERS, ()
+    for token in tokens:
+        if token in node:
+            node = node[token]
+        elif "*" in node:
+            node, keys = node["*"], (*keys, token)
+        else:
+            return None
+
+    if setter := node.get(None):
+        command, build = setter
+        return command, build, keys
+
+    return None
+
+
+# Daemon commands whose effect on the status is known, keyed by command name.
+# Their paths are relative to the daemon config rather than a mixer.
+DAEMON_CHANGES: Dict[str, Callable[[Any], List[Change]]] = {
+    "SetLogLevel": _Value("/log_level"),
+    "SetShowTrayIcon": _Value("/show_tray_icon"),
+    "SetTTSEnabled": _Value("/tts_enabled"),
+    "SetAutoStartEnabled": _Value("/autostart_enabled"),
+    "SetAllowNetworkAccess": _Value("/allow_network_access"),
+}
+
+
+def daemon_changes(payload: dict) -> List[Change]:
+    """
+    Returns the changes a daemon command makes to the daemon config in the
+    status.
+
+    :param payload: The daemon command payload, e.g.
+                    ``{"SetShowTrayIcon": False}``.
+
+    :return: A list of (path, value) pairs, where path is a JSON pointer
+             relative to the config, e.g. ``[("/show_tray_icon", False)]``.
+             Empty if the command's effect is not known.
+    """
+    (command, args), *_ = payload.items()
+
+    if changes := DAEMON_CHANGES.get(command):
+        return changes(args)
+
+    return []
@@ -0,0 +1,109 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Continuous parameters, usually driven by faders, knobs or sliders, where
+# only the most recent value matters.
+COALESCED_COMMANDS = {
+    "SetVolume",
+    "SetSubMixVolume",
+    "SetMicrophoneGain",
+    "SetEqGain",
+    "SetEqFrequency",
+    "SetEqMiniGain",
+    "SetEqMiniFrequency",
+    "SetGateThreshold",
+    "SetGateAttenuation",
+    "SetCompressorThreshold",
+    "SetCompressorMakeupGain",
+    "SetSwearButtonVolume",
+    "SetDeesser",
+    "SetReverbAmount",
+    "SetEchoAmount",
+    "SetPitchAmount",
+    "SetGenderAmount",
+    "SetMegaphoneAmount",
+    "SetHardTuneAmount",
+}
+
+
+def coalesce_key(serial: str, payload: dict) -> tuple | None:
+    """
+    Returns the key that identifies what a command writes to, or None if the
+    command should never be coalesced.
+
+    The key is made of the serial, the command name and every argument except
+    the last one, e.g. ``SetVolume: [Mic, 200]`` becomes
+    ``(serial, "SetVolume", ("Mic",))``.
+    """
+    (command, args), *_ = payload.items()
+
+    if command not in COALESCED_COMMANDS:
+        return None
+
+    target = tuple(args[:-1]) if isinstance(args, list) else ()
+    return serial, command, target
+
+
+@dataclass
+class PendingWrite:
+    payload: Any
+    waiters: List[asyncio.Future] = field(default_factory=list)
+
+
+class WriteCoalescer:
+    """
+    Last-write-wins coalescing for continuous parameters. While a write for
+    a key is queued or in flight, newer values replace the queued one, and
+    every replaced caller resolves with the result of the write that
+    superseded it.
+    """
+
+    def __init__(self):
+        self.pending: Dict[tuple, PendingWrite] = {}
+        self.coalesced = 0  # writes that were replaced before being sent
+
+    async def send(
+        self, key: tuple, payload: Any, send: Callable[[Any], Awaitable]
+    ) -> Any:
+        """
+        Queues a write and waits until it, or a newer write for the same key,
+        has been acknowledged.
+
+        :param key: The key from `coalesce_key`.
+        :param payload: The command payload.
+        :param send: Called with the payload to actually send it.
+
+        :return: The response to the write that carried the latest value.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        if write := self.pending.get(key):
+            if write.waiters:
+                self.coalesced += 1
+            write.payload = payload
+            write.waiters.append(future)
+        else:
+            write = self.pending[key] = PendingWrite(payload, [future])
+            asyncio.create_task(self.__flush(key, write, send))
+
+        return await future
+
+    async def __flush(self, key, write: PendingWrite, send):
+        try:
+            while write.waiters:
+                payload, waiters = write.payload, write.waiters
+                write.waiters = []
+
+                try:
+                    result = await send(payload)
+                except Exception as e:
+                    for future in waiters:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for future in waiters:
+                        if not future.done():
+                            future.set_result(result)
+        finally:
+            del self.pending[key]
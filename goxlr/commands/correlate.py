@@ -0,0 +1,104 @@
+import asyncio
+from typing import List
+
+from .changes import Change
+from .reconcile import DEPENDENT_PATHS
+from ..types.models import Patch
+
+
+class CommandResult(str):
+    """
+    The daemon's reply to a command, usually "Ok", along with the patches
+    the command caused. Returned by commands when ``correlate`` is enabled
+    on the GoXLR object, and compares equal to the plain reply. Commands
+    whose changes aren't known have no patches, unless ``correlate_unknown``
+    is enabled too.
+
+    :param result: The daemon's reply.
+    :param patches: The patches the command caused, in order.
+    """
+
+    patches: List[Patch]
+
+    def __new__(cls, result: str, patches: List[Patch]):
+        self = super().__new__(cls, result)
+        self.patches = patches
+        return self
+
+
+class PatchCorrelator:
+    """
+    Picks out the patches a command causes from the patches of a mixer,
+    by path and by when they arrive.
+
+    A command whose changes are known (see `goxlr.commands.changes`) is
+    waited on until a patch has arrived for every value it changes, taking
+    only patches above or below those values. Values that already held the
+    target are not waited for, as the daemon sends no patch for them. Any
+    other command takes every patch of the mixer that arrives in the window,
+    so the GoXLR object only correlates those with ``correlate_unknown``.
+
+    :param root: The pointer to the mixer, e.g. ``/mixers/S123``.
+    :param mixer: The raw mixer dict from the status, before the command.
+    :param changes: The command's changes, None if they are not known.
+    """
+
+    def __init__(self, root: str, mixer: dict, changes: List[Change] | None):
+        self.root = root
+        self.patches: List[Patch] = []
+        self.done = asyncio.Event()
+        self.paths = None
+        self.pending = set()
+
+        if changes is not None:
+            self.paths = [path for path, _ in changes]
+            self.paths += [
+                DEPENDENT_PATHS[path] for path in self.paths if path in DEPENDENT_PATHS
+            ]
+
+            for path, value in changes:
+                node = mixer
+                for token in path.strip("/").split("/"):
+                    node = node.get(token) if isinstance(node, dict) else None
+                if node != value:
+                    self.pending.add(path)
+
+    def __matches(self, path: str, expected: str) -> bool:
+        return (
+            path == expected
+            or path.startswith(f"{expected}/")
+            or expected.startswith(f"{path}/")
+        )
+
+    def put(self, patch: Patch):
+        """
+        Takes a patch to the mixer if the command caused it.
+        """
+        # a patch above the mixer, e.g. to every mixer, covers everything
+        path = patch.path.removeprefix(self.root) if patch.path != "/mixers" else ""
+        if self.paths is not None:
+            if not any(self.__matches(path, expected) for expected in self.paths):
+                return
+            self.pending = {p for p in self.pending if not self.__matches(path, p)}
+            if not self.pending:
+                self.done.set()
+
+        self.patches.append(patch)
+
+    async def wait(self, window: float) -> List[Patch]:
+        """
+        Waits for the command's patches, for no longer than the window.
+
+        :param window: Seconds to wait after the command was answered.
+
+        :return: The patches the command caused, in order.
+        """
+        if self.paths is not None and not self.pending:
+            return self.patches
+
+        try:
+            await asyncio.wait_for(self.done.wait(), window)
+        except asyncio.TimeoutError:
+            pass
+
+        return self.patches
@@ -1,3 +1,4 @@
+from .changes import daemon_changes
 from ..types import LogLevel, PathType
 
 
@@ -7,8 +8,14 @@ class DaemonCommands:
     """
 
     async def __send_daemon(self, payload):
-        payload = {"Daemon": payload}
-        return await self.send(payload)
+        # show the change on "Ok" rather than when the daemon's patch arrives
+        changes = None
+        if isinstance(payload, dict) and self.optimistic:
+            changes = [
+                (f"/config{path}", value) for path, value in daemon_changes(payload)
+            ]
+
+        return await self.send({"Daemon": payload}, changes=changes)
 
     async def open_ui(self):
         return await self.__send_daemon("OpenUi")
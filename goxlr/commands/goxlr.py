@@ -1,10 +1,77 @@
 import ctypes
-
-from ..error import MissingFeatureError
-
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Iterable, List
+
+from .batch import CommandBatch, pipeline
+from .changes import COMMAND_CHANGES, command_changes
+from .correlate import CommandResult, PatchCorrelator
+from .coalesce import coalesce_key
+from .reconcile import StateReport, plan_state
+from ..error import MissingFeatureError, MixerNotFoundError
+
+from ..scene import Scene, capture
 from ..types.models import Colours
 from ..types.enums import *
 
+# Default lane for each command, anything not listed is sent as Audio.
+COMMAND_PRIORITIES = {
+    "SetFaderMuteState": CommandPriority.Mute,
+    "SetCoughMuteState": CommandPriority.Mute,
+    "SetAnimationMode": CommandPriority.Lighting,
+    "SetAnimationMod1": CommandPriority.Lighting,
+    "SetAnimationMod2": CommandPriority.Lighting,
+    "SetAnimationWaterfall": CommandPriority.Lighting,
+    "SetGlobalColour": CommandPriority.Lighting,
+    "SetFaderDisplayStyle": CommandPriority.Lighting,
+    "SetFaderColours": CommandPriority.Lighting,
+    "SetAllFaderColours": CommandPriority.Lighting,
+    "SetAllFaderDisplayStyle": CommandPriority.Lighting,
+    "SetButtonColours": CommandPriority.Lighting,
+    "SetButtonOffStyle": CommandPriority.Lighting,
+    "SetButtonGroupColours": CommandPriority.Lighting,
+    "SetButtonGroupOffStyle": CommandPriority.Lighting,
+    "SetSimpleColour": CommandPriority.Lighting,
+    "SetEncoderColour": CommandPriority.Lighting,
+    "SetSampleColour": CommandPriority.Lighting,
+    "SetSampleOffStyle": CommandPriority.Lighting,
+    "LoadProfileColours": CommandPriority.Lighting,
+    "SetScribbleIcon": CommandPriority.Lighting,
+    "SetScribbleText": CommandPriority.Lighting,
+    "SetScribbleNumber": CommandPriority.Lighting,
+    "SetScribbleInvert": CommandPriority.Lighting,
+}
+
+# Commands sent even when the status already holds the values they set,
+# because they do more than set them, e.g. reading a profile from disk or
+# loading the values of an effect preset again, or because the status may
+# lag behind the hardware, e.g. a mute button pressed a moment ago, and a
+# mute has to go out whatever the status says. Anything sent in the Mute
+# lane is always sent as well.
+ALWAYS_SENT = {
+    "LoadProfile",
+    "LoadMicProfile",
+    "SetActiveEffectPreset",
+    "SetFaderMuteState",
+    "SetCoughMuteState",
+}
+
+# Commands whose changes are applied to the local status on "Ok" even when
+# optimistic updates are disabled, so that set_router() has updated
+# Mixer.router and Mixer.routing by the time it returns.
+ALWAYS_APPLIED = {"SetRouter"}
+
+# Set by GoXLRCommands.priority() to override the lane of every command
+# sent from the current task.
+priority_override: ContextVar[CommandPriority | None] = ContextVar(
+    "priority_override", default=None
+)
+
+# Set by GoXLRCommands.force() to send every command from the current task,
+# even those that would change nothing.
+force_override: ContextVar[bool] = ContextVar("force_override", default=False)
+
 
 class GoXLRCommands:
     """
@@ -12,8 +79,325 @@ class GoXLRCommands:
     """
 
     async def __send_command(self, payload, serial=None):
-        payload = {"Command": [serial or self.serial, payload]}
-        return await self.send(payload)
+        serial = serial or self.serial
+        priority = self.get_command_priority(payload)
+
+        async def send(payload):
+            # mutes are never rate limited
+            if priority is not CommandPriority.Mute:
+                if limiter := self.get_rate_limiter(serial):
+                    await limiter.acquire()
+
+            # show the change on "Ok" rather than when the daemon's patch
+            # arrives
+            changes = None
+            if self.optimistic or next(iter(payload)) in ALWAYS_APPLIED:
+                changes = [
+                    (f"/mixers/{serial}{path}", value)
+                    for path, value in command_changes(payload)
+                ]
+
+            if not self.correlate:
+                return await self.send(
+                    {"Command": [serial, payload]}, priority=priority, changes=changes
+                )
+
+            return await self.__send_correlated(serial, payload, priority, changes)
+
+        async def write():
+            if self.coalescer and (key := coalesce_key(serial, payload)):
+                return await self.coalescer.send(key, payload, send)
+
+            return await send(payload)
+
+        if (
+            self.skip_unchanged
+            and not force_override.get()
+            and priority is not CommandPriority.Mute
+        ):
+            if next(iter(payload)) in COMMAND_CHANGES.keys() - ALWAYS_SENT:
+                return await self.__send_unless_unchanged(payload, serial, write)
+
+        return await write()
+
+    async def __send_unless_unchanged(self, payload, serial, write):
+        changes = command_changes(payload)
+        paths = [f"/mixers/{serial}{path}" for path, _ in changes]
+        values = [value for _, value in changes]
+
+        if self.__holds(paths, values):
+            self.write_cache_hits += 1
+            return CommandResult("Ok", []) if self.correlate else "Ok"
+
+        self.write_cache_misses += 1
+
+        # until it is answered, the status may not show what this command
+        # leaves the mixer at
+        self.unanswered_writes.update(paths)
+        try:
+            return await write()
+        finally:
+            self.unanswered_writes.subtract(paths)
+            for path in set(paths):
+                if not self.unanswered_writes[path]:
+                    del self.unanswered_writes[path]
+
+    def __holds(self, paths: List[str], values: List[Any]) -> bool:
+        # only trust a status the daemon's patches keep current
+        if not (
+            self.optimistic
+            and self.apply_patches
+            and self.status
+            and not self.status_stale
+            and self.reader_task
+            and not self.reader_task.done()
+            and not (self.update_task and not self.update_task.done())
+        ):
+            return False
+
+        for path, value in zip(paths, values):
+            for pending in self.unanswered_writes:
+                if (
+                    pending == path
+                    or pending.startswith(f"{path}/")
+                    or path.startswith(f"{pending}/")
+                ):
+                    return False
+
+            node = self.status.raw
+            for token in path.strip("/").split("/"):
+                if not isinstance(node, dict) or token not in node:
+                    return False
+                node = node[token]
+            if node != value:
+                return False
+
+        return bool(paths)
+
+    async def __send_correlated(
+        self, serial, payload, priority, changes
+    ) -> CommandResult:
+        root = f"/mixers/{serial}"
+        known = next(iter(payload)) in COMMAND_CHANGES
+
+        if not known and not self.correlate_unknown:
+            # nothing to tell its patches apart by, don't hold it up
+            result = await self.send(
+                {"Command": [serial, payload]}, priority=priority, changes=changes
+            )
+            return CommandResult(result, [])
+
+        correlator = PatchCorrelator(
+            root,
+            self.status.raw["mixers"].get(serial) if self.status else None,
+            command_changes(payload) if known else None,
+        )
+
+        subscription = self.subscribe(f"{root}/**", correlator.put, maxsize=sys.maxsize)
+        try:
+            result = await self.send(
+                {"Command": [serial, payload]}, priority=priority, changes=changes
+            )
+            return CommandResult(result, await correlator.wait(self.correlate_window))
+        finally:
+            self.unsubscribe(subscription)
+
+    async def __send_settled(self, payload, settle: bool, serial=None):
+        if not settle:
+            return await self.__send_command(payload, serial)
+
+        return await self.settle(
+            serial=serial, command=self.__send_command(payload, serial)
+        )
+
+    def get_command_priority(self, payload: dict) -> CommandPriority:
+        """
+        Returns the lane a command will be sent in. A `priority()` block
+        takes precedence over ``command_priorities``, which defaults to
+        `COMMAND_PRIORITIES`.
+
+        :param payload: The command payload, e.g. ``{"SetVolume": [...]}``.
+        """
+        if priority := priority_override.get():
+            return priority
+
+        command = next(iter(payload))
+        return self.command_priorities.get(command, CommandPriority.Audio)
+
+    @contextmanager
+    def priority(self, priority: CommandPriority):
+        """
+        Sends every command in the ``with`` block in the given lane.
+
+        :param priority: The lane to send the commands in.
+
+        :Example:
+
+        >>> with xlr.priority(CommandPriority.Mute):
+        ...     await xlr.set_volume(Channel.Mic, 0)
+        """
+        token = priority_override.set(priority)
+        try:
+            yield
+        finally:
+            priority_override.reset(token)
+
+    @contextmanager
+    def force(self):
+        """
+        Sends every command in the ``with`` block, even one that would not
+        change anything, when ``skip_unchanged`` is enabled.
+
+        :Example:
+
+        >>> with xlr.force():
+        ...     await xlr.set_volume(Channel.Mic, 200)
+        """
+        token = force_override.set(True)
+        try:
+            yield
+        finally:
+            force_override.reset(token)
+
+    def batch(self) -> CommandBatch:
+        """
+        Collects commands and pipelines them when the ``async with`` block
+        exits, so a whole group of commands costs about one round trip.
+
+        :return: The batch to queue commands on.
+
+        :raises BatchError: On exit, if any of the queued commands failed.
+
+        :Example:
+
+        >>> async with xlr.batch() as b:
+        ...     b.set_fader(Fader.A, Channel.Mic)
+        ...     b.set_scribble_text(Fader.A, "Mic")
+        ...     b.set_scribble_icon(Fader.A, "mic.png")
+        """
+        return CommandBatch(self)
+
+    async def pipeline(self, commands: Iterable[Awaitable]) -> List[Any]:
+        """
+        Sends several commands back to back and collects their results in
+        order.
+
+        :param commands: The commands to send, without awaiting them.
+
+        :return: The result of every command, in order.
+
+        :raises BatchError: If any of the commands failed.
+
+        :Example:
+
+        >>> await xlr.pipeline([
+        ...     xlr.set_fader(Fader.A, Channel.Mic),
+        ...     xlr.set_scribble_text(Fader.A, "Mic"),
+        ... ])
+        """
+        return await pipeline(commands)
+
+    async def apply_state(
+        self, desired: dict, serial: str = None, dry_run: bool = False
+    ) -> StateReport:
+        """
+        Brings a mixer to the desired state, sending only the commands for
+        the values that differ from the cached status.
+
+        The commands are pipelined in stages, one after another: mutes, then
+        the settings others depend on (faders, microphone type, effect
+        preset, sampler bank), then the remaining values, then unmutes and
+        lastly lighting. A command that sets several values, such as
+        `set_fader_colours()`, is sent once with the desired values filled
+        in around the current ones.
+
+        :param desired: The values wanted, shaped like the mixer in the
+                        status (see `Mixer.raw`). Only the values given are
+                        compared, and enums may be used for keys or values.
+        :param serial: The serial number of the mixer to change.
+                       If not specified, the currently selected mixer is used.
+        :param dry_run: Work out the changes and commands without sending
+                        anything.
+
+        :return: The values that changed and the commands sent.
+
+        :raises MixerNotFoundError: If the specified mixer is not found.
+        :raises BatchError: If any of the commands failed. Later stages are
+                            not sent.
+
+        :Example:
+
+        >>> report = await xlr.apply_state({
+        ...     "fader_status": {Fader.A: {"channel": Channel.Mic}},
+        ...     "levels": {"volumes": {Channel.Mic: 200, Channel.Music: 120}},
+        ...     "router": {InputDevice.Music: {OutputDevice.BroadcastMix: False}},
+        ... })
+        >>> report.commands
+        [{'SetFader': ['A', 'Mic']},
+         {'SetVolume': ['Music', 120]},
+         {'SetRouter': ['Music', 'BroadcastMix', False]}]
+        """
+        serial = serial or self.serial
+        mixers = self.status.raw["mixers"]
+        if serial not in mixers:
+            raise MixerNotFoundError(f"Mixer {serial} not found.")
+
+        report, stages = plan_state(mixers[serial], desired, self.command_priorities)
+        if dry_run:
+            return report
+
+        for stage in stages:
+            await pipeline(self.__send_command(payload, serial) for payload in stage)
+
+        return report
+
+    def capture_scene(
+        self, include: Iterable[SceneSection] = tuple(SceneSection), serial: str = None
+    ) -> Scene:
+        """
+        Takes a snapshot of parts of a mixer from the cached status, to put
+        back later with `restore_scene()`.
+
+        :param include: The sections to capture, all of them by default.
+        :param serial: The serial number of the mixer to capture.
+                       If not specified, the currently selected mixer is used.
+
+        :return: The scene, which can be saved with `Scene.save()`.
+
+        :raises MixerNotFoundError: If the specified mixer is not found.
+
+        :Example:
+
+        >>> scene = xlr.capture_scene([SceneSection.Levels, SceneSection.Router])
+        >>> scene.save("intro.scene")
+        """
+        serial = serial or self.serial
+        mixers = self.status.raw["mixers"]
+        if serial not in mixers:
+            raise MixerNotFoundError(f"Mixer {serial} not found.")
+
+        return capture(mixers[serial], include)
+
+    async def restore_scene(
+        self, scene: Scene, serial: str = None, dry_run: bool = False
+    ) -> StateReport:
+        """
+        Puts a mixer back to a scene, sending only the commands for the
+        values that differ, see `apply_state()`.
+
+        :param scene: The scene from `capture_scene()` or `Scene.load()`.
+        :param serial: The serial number of the mixer to change, which need
+                       not be the one the scene was captured from.
+                       If not specified, the currently selected mixer is used.
+        :param dry_run: Work out the changes and commands without sending
+                        anything.
+
+        :return: The values that changed and the commands sent.
+
+        :raises MixerNotFoundError: If the specified mixer is not found.
+        :raises BatchError: If any of the commands failed.
+        """
+        return await self.apply_state(scene.state, serial, dry_run)
 
     async def set_shutdown_commands(self, *methods) -> dict | str:
         """
@@ -295,8 +679,12 @@ class GoXLRCommands:
         )
 
     # Effect Related Settings
-    async def load_effect(self, effect_name: str):
-        return await self.__send_command({"LoadEffect": effect_name})
+    async def load_effect(self, effect_name: str, settle: bool = False):
+        """
+        :param settle: Wait for the daemon to finish sending the changes,
+                       see `settle()`, and return them instead.
+        """
+        return await self.__send_settled({"LoadEffect": effect_name}, settle)
 
     async def rename_active_preset(self, new_name: str):
         return await self.__send_command({"RenameActivePreset": new_name})
@@ -590,8 +978,16 @@ class GoXLRCommands:
     async def new_profile(self, profile_name: str):
         return await self.__send_command({"NewProfile": profile_name})
 
-    async def load_profile(self, profile_name: str, save_changes: bool = False):
-        return await self.__send_command({"LoadProfile": [profile_name, save_changes]})
+    async def load_profile(
+        self, profile_name: str, save_changes: bool = False, settle: bool = False
+    ):
+        """
+        :param settle: Wait for the daemon to finish sending the changes,
+                       see `settle()`, and return them instead.
+        """
+        return await self.__send_settled(
+            {"LoadProfile": [profile_name, save_changes]}, settle
+        )
 
     async def load_profile_colours(self, profile_name: str):
         return await self.__send_command({"LoadProfileColours": profile_name})
@@ -608,9 +1004,15 @@ class GoXLRCommands:
     async def new_mic_profile(self, profile_name: str):
         return await self.__send_command({"NewMicProfile": profile_name})
 
-    async def load_mic_profile(self, profile_name: str, save_changes: bool = False):
-        return await self.__send_command(
-            {"LoadMicProfile": [profile_name, save_changes]}
+    async def load_mic_profile(
+        self, profile_name: str, save_changes: bool = False, settle: bool = False
+    ):
+        """
+        :param settle: Wait for the daemon to finish sending the changes,
+                       see `settle()`, and return them instead.
+        """
+        return await self.__send_settled(
+            {"LoadMicProfile": [profile_name, save_changes]}, settle
         )
 
     async def save_mic_profile(self):
@@ -0,0 +1,159 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Tuple
+
+from .changes import command_setter
+from ..types.enums import CommandPriority, MuteState
+
+# Commands other values depend on, sent before the rest: the effect preset
+# and sampler bank pick which values the daemon reports under them, the
+# microphone type picks the gain that applies, and a fader's channel picks
+# what its mute function acts on.
+FIRST_COMMANDS = {
+    "SetActiveEffectPreset",
+    "SetActiveSamplerBank",
+    "SetMicrophoneType",
+    "SetFader",
+    "SetFaderMuteFunction",
+    "SetCoughMuteFunction",
+    "SetCoughIsHold",
+}
+
+# The order commands are sent in, one pipelined stage at a time. Muting
+# first and unmuting late means nothing is heard half way through.
+STAGE_MUTE = 0
+STAGE_FIRST = 1
+STAGE_VALUES = 2
+STAGE_UNMUTE = 3
+STAGE_LIGHTING = 4
+
+# Values that are replaced when another value changes, e.g. the current
+# effect values are loaded from the newly active preset. The cached values
+# say nothing about them then, so every one wanted is sent.
+DEPENDENT_PATHS = {"/effects/active_preset": "/effects/current"}
+
+
+@dataclass(slots=True)
+class StateReport:
+    """
+    What `GoXLRCommands.apply_state()` changed.
+    """
+
+    # (path, old value, new value) for every value that differed, with the
+    # path relative to the mixer, e.g. "/levels/volumes/Mic"
+    changes: List[Tuple[str, Any, Any]] = field(default_factory=list)
+
+    # the command payloads sent, in the order they were sent
+    commands: List[dict] = field(default_factory=list)
+
+    # paths with a different value that no command can set, and paths this
+    # mixer does not have
+    unsupported: List[str] = field(default_factory=list)
+
+
+def _raw(value):
+    # enums are stored by name, the same as the daemon's JSON
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {_raw(k): _raw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_raw(v) for v in value]
+    return value
+
+
+def _diff(
+    desired: dict,
+    current: dict,
+    path: str,
+    changes: list,
+    missing: list,
+    force: bool = False,
+):
+    for key, value in desired.items():
+        child = f"{path}/{key}"
+        if not isinstance(current, dict) or key not in current:
+            missing.append(child)
+        elif isinstance(value, dict) and isinstance(current[key], dict):
+            _diff(value, current[key], child, changes, missing, force)
+        elif force or value != current[key]:
+            changes.append((child, current[key], value))
+
+
+def _lookup(tree: dict, path: str):
+    for token in path.strip("/").split("/"):
+        if not isinstance(tree, dict) or token not in tree:
+            return None, False
+        tree = tree[token]
+    return tree, True
+
+
+def _stage(payload: dict, priorities: Dict[str, CommandPriority]) -> int:
+    (command, args), *_ = payload.items()
+    lane = priorities.get(command, CommandPriority.Audio)
+
+    if lane is CommandPriority.Mute:
+        state = args[-1] if isinstance(args, list) else args
+        return STAGE_UNMUTE if state == MuteState.Unmuted.name else STAGE_MUTE
+    if lane is CommandPriority.Lighting:
+        return STAGE_LIGHTING
+    if command in FIRST_COMMANDS:
+        return STAGE_FIRST
+    return STAGE_VALUES
+
+
+def plan_state(
+    current: dict, desired: dict, priorities: Dict[str, CommandPriority]
+) -> Tuple[StateReport, List[List[dict]]]:
+    """
+    Works out the commands that take a mixer from its current state to the
+    desired one.
+
+    :param current: The raw mixer dict from the status.
+    :param desired: Part of a raw mixer dict with the values wanted, see
+                    `GoXLRCommands.apply_state()`.
+    :param priorities: The lane of each command, to tell mutes and lighting
+                       from the rest.
+
+    :return: The report, with every command in send order, and the
+             commands split into the stages to send one after another.
+    """
+    desired = _raw(desired)
+    report = StateReport()
+    differences = []
+    _diff(desired, current, "", differences, report.unsupported)
+
+    for path, dependent in DEPENDENT_PATHS.items():
+        wanted = _lookup(desired, dependent)[0]
+        if isinstance(wanted, dict) and any(c[0] == path for c in differences):
+            differences = [
+                change
+                for change in differences
+                if not change[0].startswith(f"{dependent}/")
+            ]
+            cached = _lookup(current, dependent)[0]
+            _diff(wanted, cached, dependent, differences, [], force=True)
+
+    def target(path: str):
+        value, found = _lookup(desired, path)
+        return value if found else _lookup(current, path)[0]
+
+    commands: Dict[Tuple[str, Any], dict] = {}
+    for change in differences:
+        path = change[0]
+        if not (setter := command_setter(path.strip("/").split("/"))):
+            report.unsupported.append(path)
+            continue
+
+        report.changes.append(change)
+
+        command, build, keys = setter
+        group, args = build(keys, target)
+        commands.setdefault((command, tuple(group)), {command: args})
+
+    stages = [[] for _ in range(STAGE_LIGHTING + 1)]
+    for payload in commands.values():
+        stages[_stage(payload, priorities)].append(payload)
+
+    report.commands = [payload for stage in stages for payload in stage]
+    return report, [stage for stage in stages if stage]
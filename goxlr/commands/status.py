@@ -1,6 +1,15 @@
-from typing import Union
+import asyncio
+from typing import Callable, Union
 from ..error import DaemonError, MixerNotFoundError
+from ..events import (
+    ButtonPressed,
+    ButtonReleased,
+    MuteStateChanged,
+    SamplePlaying,
+    VolumeChanged,
+)
 from ..types.models import *
+from ..types.packed import PackedState, button_mask
 
 
 class StatusCommands:
@@ -23,7 +32,7 @@ class StatusCommands:
         if not status:
             raise DaemonError("Failed to get status from daemon.")
 
-        return Status(status)
+        return Status(status, lazy=self.lazy)
 
     # ------------------------------------------------------------
     # Config
@@ -254,11 +263,14 @@ class StatusCommands:
         return self.get_routed_outputs(input).get(output)
 
     def get_routed_inputs(self, output: OutputDevice) -> List[InputDevice]:
-        inputs = []
-        for input, outputs in self.get_routing_table().items():
-            if outputs.get(output):
-                inputs.append(input)
-        return inputs
+        return sorted(self.mixer.routing.inputs[output], key=lambda i: i.value)
+
+    def get_routing_index(self) -> RoutingIndex:
+        """
+        :return: The inputs routed to each output and the outputs each input
+                 is routed to, as sets kept up to date by router patches.
+        """
+        return self.mixer.routing
 
     # Cough button
 
@@ -617,11 +629,43 @@ class StatusCommands:
     def get_button_down(self, button: Button) -> bool:
         return self.mixer.button_down[button]
 
+    def get_packed_state(self, serial: str = None) -> PackedState | None:
+        """
+        :param serial: The serial number of the mixer. If not specified, the
+                       currently selected mixer is used.
+
+        :return: The mixer's buttons, routing and volumes as bitmasks and
+                 arrays, kept up to date by patches. None unless the GoXLR
+                 was created with ``packed=True``.
+        """
+        return self.packed_states.get(serial or self.serial)
+
+    async def __wait_for_events(
+        self, types: tuple, check: Callable, timeout: float = None
+    ):
+        """
+        Calls ``check`` with None and then with each event of one of
+        ``types`` from the selected mixer, until it returns anything but None.
+        """
+        async with self.events(*types, serial=self.serial) as events:
+            if (result := check(None)) is not None:
+                return result
+
+            async def wait():
+                async for event in events:
+                    if (result := check(event)) is not None:
+                        return result
+
+                raise ConnectionError("The connection to the daemon was closed.")
+
+            return await asyncio.wait_for(wait(), timeout)
+
     async def wait_for_button(
         self,
         buttons: Union[List[Button], Dict[Button, bool]],
         all_values: bool = False,
         invert: bool = False,
+        timeout: float = None,
     ) -> Dict[Button, bool]:
         """
         Waits for the specified button states to be achieved.
@@ -629,8 +673,13 @@ class StatusCommands:
         :param buttons: List of buttons or dictionary specifying the button states to wait for.
                         - If a list, all buttons are assumed to have the desired state as True (down).
                         - If a dictionary, Key: Button, Value: Desired button state (True for down, False for up).
-        :param all: Whether to wait for all (instead of any) of the buttons to achieve the desired state.
+        :param all_values: Whether to wait for all (instead of any) of the buttons to achieve the desired state.
         :param invert: Whether to check for the opposite button states.
+        :param timeout: The maximum number of seconds to wait, forever if not specified.
+
+        :return: The state of each of the buttons.
+
+        :raises asyncio.TimeoutError: If the timeout expires first.
         """
         if isinstance(buttons, dict):
             button_states = buttons
@@ -642,22 +691,133 @@ class StatusCommands:
                 button: not state for button, state in button_states.items()
             }
 
-        if all_values:
-            while not all(
-                self.get_button_down(button) == state
-                for button, state in button_states.items()
+        # bitmasks of the buttons to wait for, and of the ones that are down
+        down = button_mask(*(b for b, state in button_states.items() if state))
+        up = button_mask(*(b for b, state in button_states.items() if not state))
+        pressed = button_mask(*(b for b in button_states if self.get_button_down(b)))
+
+        def check(event):
+            nonlocal pressed
+            if event:
+                if isinstance(event, ButtonPressed):
+                    pressed |= button_mask(event.button)
+                else:
+                    pressed &= ~button_mask(event.button)
+
+            if all_values:
+                achieved = pressed & down == down and not pressed & up
+            else:
+                achieved = pressed & down or ~pressed & up
+
+            if achieved:
+                return {b: bool(pressed & button_mask(b)) for b in button_states}
+
+        return await self.__wait_for_events(
+            (ButtonPressed, ButtonReleased), check, timeout
+        )
+
+    async def wait_for_volume(
+        self,
+        channel: Channel,
+        above: int = None,
+        below: int = None,
+        timeout: float = None,
+    ) -> int:
+        """
+        Waits for the volume of a channel to reach a threshold.
+
+        :param channel: The channel to watch.
+        :param above: Return once the volume is at least this.
+        :param below: Return once the volume is at most this.
+        :param timeout: The maximum number of seconds to wait, forever if not specified.
+
+        :return: The volume that reached the threshold.
+
+        :raises ValueError: If neither threshold is given.
+        :raises asyncio.TimeoutError: If the timeout expires first.
+        """
+        if above is None and below is None:
+            raise ValueError("Either above or below must be given.")
+
+        volume = self.get_volume(channel)
+
+        def check(event):
+            nonlocal volume
+            if event and event.channel == channel:
+                volume = event.volume
+
+            if (above is not None and volume >= above) or (
+                below is not None and volume <= below
             ):
-                await self.receive_patch()
+                return volume
+
+        return await self.__wait_for_events((VolumeChanged,), check, timeout)
+
+    async def wait_for_mute_state(
+        self,
+        states: MuteState | List[MuteState],
+        fader: Fader = None,
+        timeout: float = None,
+    ) -> MuteState:
+        """
+        Waits for a fader or the cough button to reach a mute state.
+
+        :param states: The mute state, or any of several mute states, to wait for.
+        :param fader: The fader to watch. The cough button if not specified.
+        :param timeout: The maximum number of seconds to wait, forever if not specified.
+
+        :return: The mute state that was reached.
+
+        :raises asyncio.TimeoutError: If the timeout expires first.
+        """
+        if isinstance(states, MuteState):
+            states = [states]
+
+        if fader:
+            current = self.get_fader_mute_state(fader)
         else:
-            while not any(
-                self.get_button_down(button) == state
-                for button, state in button_states.items()
-            ):
-                await self.receive_patch()
+            current = self.get_cough_mute_state()
+
+        def check(event):
+            nonlocal current
+            if event and event.fader == fader:
+                current = event.mute_state
+
+            if current in states:
+                return current
+
+        return await self.__wait_for_events((MuteStateChanged,), check, timeout)
+
+    async def wait_for_sample_playing(
+        self,
+        bank: SampleBank,
+        button: SampleButton,
+        playing: bool = True,
+        timeout: float = None,
+    ) -> bool:
+        """
+        Waits for a sample button to start or stop playing.
+
+        :param bank: The bank of the sample button.
+        :param button: The sample button to watch.
+        :param playing: Whether to wait for it to be playing or to be stopped.
+        :param timeout: The maximum number of seconds to wait, forever if not specified.
+
+        :return: Whether the sample button is playing.
+
+        :raises asyncio.TimeoutError: If the timeout expires first.
+        """
+        current = self.get_sample_is_playing(bank, button)
+
+        def check(event):
+            nonlocal current
+            if event and (event.bank, event.button) == (bank, button):
+                current = event.playing
 
-        await self.update()  # be sure it's up to date
+            if current == playing:
+                return current
 
-        return {button: self.get_button_down(button) for button in button_states.keys()}
+        return await self.__wait_for_events((SamplePlaying,), check, timeout)
 
     # Profile name
 
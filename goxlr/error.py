@@ -20,3 +20,46 @@ class MissingFeatureError(Exception):
     """
 
     pass
+
+
+class BatchError(Exception):
+    """
+    Raised when one or more commands in a batch or pipeline fail.
+
+    :param errors: The exceptions raised by the failed commands, in the
+                   order the commands were queued.
+    :param results: The result of every command in the batch, with the
+                    exception in place of the result for failed commands.
+    """
+
+    def __init__(self, errors: list, results: list):
+        super().__init__(f"{len(errors)} of {len(results)} commands failed")
+        self.errors = errors
+        self.results = results
+
+
+class PatchError(Exception):
+    """
+    Raised when a JSON patch from the daemon can't be applied to the local
+    copy of the status.
+    """
+
+    pass
+
+
+class EventOverflowError(Exception):
+    """
+    Raised by an event stream with the `OverflowPolicy.Raise` policy when
+    events were dropped because its buffer was full.
+    """
+
+    pass
+
+
+class StatusNotReadyError(Exception):
+    """
+    Raised when the status is read before the first fetch of it finished,
+    see `GoXLR.ready()`.
+    """
+
+    pass
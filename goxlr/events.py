@@ -0,0 +1,300 @@
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from .error import EventOverflowError
+from .patch import parse_pointer
+from .types.enums import (
+    Button,
+    Channel,
+    EffectBankPreset,
+    Fader,
+    MuteState,
+    OverflowPolicy,
+    PatchOperation,
+    SampleBank,
+    SampleButton,
+)
+from .types.models import Patch
+
+# --------------------------------------------------
+# Events
+# --------------------------------------------------
+
+
+@dataclass(slots=True)
+class Event:
+    serial: str  # the mixer the event happened on
+
+
+@dataclass(slots=True)
+class MixerConnected(Event):
+    pass
+
+
+@dataclass(slots=True)
+class MixerDisconnected(Event):
+    pass
+
+
+@dataclass(slots=True)
+class ButtonPressed(Event):
+    button: Button
+
+
+@dataclass(slots=True)
+class ButtonReleased(Event):
+    button: Button
+
+
+@dataclass(slots=True)
+class VolumeChanged(Event):
+    channel: Channel
+    volume: int
+
+
+@dataclass(slots=True)
+class FaderAssigned(Event):
+    fader: Fader
+    channel: Channel
+
+
+@dataclass(slots=True)
+class MuteStateChanged(Event):
+    fader: Optional[Fader]  # None for the cough button
+    mute_state: MuteState
+
+
+@dataclass(slots=True)
+class ProfileLoaded(Event):
+    name: str
+
+
+@dataclass(slots=True)
+class MicProfileLoaded(Event):
+    name: str
+
+
+@dataclass(slots=True)
+class EffectPresetChanged(Event):
+    preset: EffectBankPreset
+
+
+@dataclass(slots=True)
+class SamplePlaying(Event):
+    bank: SampleBank
+    button: SampleButton
+    playing: bool
+
+
+# --------------------------------------------------
+# Decoding
+# --------------------------------------------------
+
+# Decoders keyed by path below a mixer, "*" matches any key. Each decoder is
+# called with the serial, the keys matched by wildcards and the new value.
+DECODERS = {
+    "button_down": {
+        "*": lambda serial, keys, down: (ButtonPressed if down else ButtonReleased)(
+            serial, Button[keys[0]]
+        )
+    },
+    "levels": {
+        "volumes": {
+            "*": lambda serial, keys, volume: VolumeChanged(
+                serial, Channel[keys[0]], volume
+            )
+        }
+    },
+    "fader_status": {
+        "*": {
+            "channel": lambda serial, keys, channel: FaderAssigned(
+                serial, Fader[keys[0]], Channel[channel]
+            ),
+            "mute_state": lambda serial, keys, state: MuteStateChanged(
+                serial, Fader[keys[0]], MuteState[state]
+            ),
+        }
+    },
+    "cough_button": {
+        "state": lambda serial, keys, state: MuteStateChanged(
+            serial, None, MuteState[state]
+        )
+    },
+    "profile_name": lambda serial, keys, name: ProfileLoaded(serial, name),
+    "mic_profile_name": lambda serial, keys, name: MicProfileLoaded(serial, name),
+    "effects": {
+        "active_preset": lambda serial, keys, preset: EffectPresetChanged(
+            serial, EffectBankPreset[preset]
+        )
+    },
+    "sampler": {
+        "banks": {
+            "*": {
+                "*": {
+                    "is_playing": lambda serial, keys, playing: SamplePlaying(
+                        serial, SampleBank[keys[0]], SampleButton[keys[1]], playing
+                    )
+                }
+            }
+        }
+    },
+}
+
+
+def _decode_value(node, serial: str, keys: Tuple[str, ...], value, events: list):
+    if callable(node):
+        events.append(node(serial, keys, value))
+    elif isinstance(value, dict):
+        # a whole subtree was replaced, decode each value in it
+        for key, child in value.items():
+            if key in node:
+                _decode_value(node[key], serial, keys, child, events)
+            elif "*" in node:
+                _decode_value(node["*"], serial, (*keys, key), child, events)
+
+
+def decode(patch: Patch) -> List[Event]:
+    """
+    Decodes the events a patch from the daemon represents, straight from its
+    path and value.
+
+    :param patch: The patch to decode.
+
+    :return: The events, empty if the patch changes nothing with an event.
+    """
+    tokens = parse_pointer(patch.path)
+    if len(tokens) < 2 or tokens[0] != "mixers":
+        return []
+
+    serial, *path = tokens[1:]
+
+    if not path:
+        if patch.operation == PatchOperation.Add:
+            return [MixerConnected(serial)]
+        if patch.operation == PatchOperation.Remove:
+            return [MixerDisconnected(serial)]
+        return []
+
+    if patch.operation not in (PatchOperation.Add, PatchOperation.Replace):
+        return []
+
+    node, keys = DECODERS, ()
+    for token in path:
+        if callable(node):
+            return []  # below a value we decode, e.g. a colour in a button
+        if token in node:
+            node = node[token]
+        elif "*" in node:
+            node, keys = node["*"], (*keys, token)
+        else:
+            return []
+
+    events = []
+    try:
+        _decode_value(node, serial, keys, patch.value, events)
+    except (KeyError, TypeError):
+        return []  # a value this version of the library doesn't know about
+
+    return events
+
+
+def decode_patches(patches: List[Patch]) -> List[Event]:
+    """
+    Decodes the events of every patch in a patch message, in order.
+    """
+    return [event for patch in patches for event in decode(patch)]
+
+
+# --------------------------------------------------
+# Streams
+# --------------------------------------------------
+
+
+class EventStream:
+    """
+    An async iterator over events from the daemon, with a bounded buffer.
+    Created by `GoXLR.events()`.
+
+    :param types: Only buffer events of these types. All events if empty.
+    :param serial: Only buffer events from this mixer. All mixers if None.
+    :param maxsize: The maximum number of events to buffer.
+    :param overflow: What to do with a new event while the buffer is full.
+    :param on_close: Called with the stream when it is closed.
+    """
+
+    def __init__(
+        self,
+        types: Tuple[type, ...] = (),
+        serial: str = None,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DropOldest,
+        on_close: Callable[["EventStream"], Any] = None,
+    ):
+        self.types = types or (Event,)
+        self.serial = serial
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.on_close = on_close
+        self.buffer: Deque[Event] = deque()
+        self.wakeup = asyncio.Event()
+        self.dropped = 0  # events lost to overflow
+        self.overflowed = False
+        self.closed = False
+
+    def put(self, events: List[Event]):
+        """
+        Buffers the events this stream is interested in. Never blocks.
+        """
+        for event in events:
+            if not isinstance(event, self.types):
+                continue
+            if self.serial and event.serial != self.serial:
+                continue
+
+            if len(self.buffer) >= self.maxsize:
+                self.dropped += 1
+                if self.overflow == OverflowPolicy.DropNewest:
+                    continue
+                if self.overflow == OverflowPolicy.Raise:
+                    self.overflowed = True
+                    continue
+                self.buffer.popleft()
+
+            self.buffer.append(event)
+
+        if self.buffer:
+            self.wakeup.set()
+
+    def close(self):
+        """
+        Stops the stream. Iteration ends once the buffer is drained.
+        """
+        if not self.closed:
+            self.closed = True
+            self.wakeup.set()
+            if self.on_close:
+                self.on_close(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Event:
+        if self.overflowed:
+            self.overflowed = False
+            raise EventOverflowError(f"{self.dropped} events were dropped")
+
+        while not self.buffer:
+            if self.closed:
+                raise StopAsyncIteration
+            self.wakeup.clear()
+            await self.wakeup.wait()
+
+        return self.buffer.popleft()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,2 @@
+from .daemon import MockDaemon
+from .status import generate_status
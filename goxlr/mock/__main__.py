@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+
+from .daemon import MockDaemon
+from .status import generate_status
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m goxlr.mock",
+        description="Runs a mock GoXLR Utility daemon.",
+    )
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=14564)
+    parser.add_argument("--device-type", choices=["Full", "Mini"], default="Full")
+    parser.add_argument("--mixers", type=int, default=1)
+    parser.add_argument("--samples-per-button", type=int, default=1)
+    parser.add_argument("--sample-files", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--patch-delay", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    daemon = MockDaemon(
+        host=args.host,
+        port=args.port,
+        status=generate_status(
+            args.device_type,
+            mixers=args.mixers,
+            samples_per_button=args.samples_per_button,
+            sample_files=args.sample_files,
+        ),
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        patch_delay=args.patch_delay,
+        seed=args.seed,
+    )
+
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
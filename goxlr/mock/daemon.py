@@ -0,0 +1,227 @@
+import asyncio
+import json
+import random
+from collections import Counter
+from typing import Dict, List, Set
+import websockets
+
+from ..commands.changes import Change, command_changes, daemon_changes
+from ..error import PatchError
+from ..patch import apply_patch, parse_pointer
+from ..types.enums import IDType
+from ..types.models import Patch
+from .status import generate_status
+
+
+class MockDaemon:
+    """
+    A stand-in for the GoXLR Utility daemon, for tests and benchmarks that
+    should not need a device. It serves the same websocket API, keeps the
+    status in memory and updates it for every command whose effect is known
+    (see `goxlr.commands.changes`), broadcasting the changes to every client
+    as JSON Patch messages like the daemon does.
+
+    :param host: The host/IP address to listen on.
+    :param port: The port to listen on, 0 picks a free one.
+    :param status: The initial status, generated with `generate_status` if
+                   not given.
+    :param latency: Seconds to wait before answering each request.
+    :param jitter: Up to this many seconds are randomly added to or taken
+                   off the latency.
+    :param error_rate: The chance (0 to 1) that a request is answered with
+                       an error instead.
+    :param errors: Error messages to answer specific commands with, keyed
+                   by command name.
+    :param patch_delay: Seconds between answering a command and sending the
+                        patch for the changes it made.
+    :param seed: Seed for the jitter and error injection.
+
+    :Example:
+
+        async with MockDaemon(latency=0.001) as daemon:
+            async with GoXLR(port=daemon.port) as xlr:
+                await xlr.set_volume(Channel.Mic, 200)
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 0,
+        status: dict = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        errors: Dict[str, str] = None,
+        patch_delay: float = 0.0,
+        seed: int = None,
+    ):
+        self.host = host
+        self.port = port
+        self.status = status if status is not None else generate_status()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.errors = errors or {}
+        self.patch_delay = patch_delay
+        self.random = random.Random(seed)
+        self.server = None
+        self.clients: Set = set()
+        self.tasks: Set[asyncio.Task] = set()
+
+        # requests received by kind (Ping, GetStatus, Command, Daemon)
+        self.received = Counter()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    @property
+    def uri(self) -> str:
+        return f"ws://{self.host}:{self.port}/api/websocket"
+
+    async def start(self):
+        """
+        Starts listening for clients.
+        """
+        self.server = await websockets.serve(self.__handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """
+        Disconnects every client and stops listening.
+        """
+        self.server.close()
+        await self.server.wait_closed()
+
+        for task in self.tasks:
+            task.cancel()
+
+    async def serve_forever(self):
+        """
+        Starts listening for clients and serves them until cancelled.
+        """
+        await self.start()
+        try:
+            await asyncio.Future()
+        finally:
+            await self.stop()
+
+    async def apply(self, changes: List[Change]):
+        """
+        Changes the status and sends a patch for the changes to every client,
+        as the daemon does when the device changes. This is how tests
+        simulate the hardware, e.g. a button being pressed.
+
+        :param changes: A list of (path, value) pairs, where path is a JSON
+                        pointer into the status.
+        """
+        operations = []
+        for path, value in changes:
+            try:
+                parent, key = self.__locate(path)
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue  # not in this status, e.g. a Full only setting on a Mini
+
+            if parent[key] == value:
+                continue
+
+            operation = {"op": "replace", "path": path, "value": value}
+            try:
+                apply_patch(self.status, Patch(operation))
+            except PatchError:
+                continue
+            operations.append(operation)
+
+        if operations:
+            await self.__broadcast(
+                {"id": IDType.Patch.value, "data": {"Patch": operations}}
+            )
+
+    def __locate(self, path: str):
+        *parents, key = parse_pointer(path)
+        node = self.status
+        for token in parents:
+            node = node[int(token)] if isinstance(node, list) else node[token]
+        if isinstance(node, list):
+            key = int(key)
+        node[key]  # raises if the value does not exist
+        return node, key
+
+    async def __broadcast(self, message: dict):
+        frame = json.dumps(message)
+        for client in list(self.clients):
+            try:
+                await client.send(frame)
+            except websockets.ConnectionClosed:
+                pass
+
+    async def __handle(self, websocket):
+        self.clients.add(websocket)
+        try:
+            async for message in websocket:
+                request = json.loads(message)
+                if self.latency or self.jitter or self.patch_delay:
+                    # answer concurrently, so a slow request does not hold
+                    # up the ones behind it
+                    task = asyncio.create_task(self.__respond(websocket, request))
+                    self.tasks.add(task)
+                    task.add_done_callback(self.tasks.discard)
+                else:
+                    await self.__respond(websocket, request)
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(websocket)
+
+    async def __respond(self, websocket, request: dict):
+        if delay := max(0.0, self.latency + self.random.uniform(-1, 1) * self.jitter):
+            await asyncio.sleep(delay)
+
+        data, changes = self.__process(request.get("data"))
+
+        try:
+            await websocket.send(json.dumps({"id": request.get("id"), "data": data}))
+        except websockets.ConnectionClosed:
+            return
+
+        if changes:
+            if self.patch_delay:
+                await asyncio.sleep(self.patch_delay)
+            await self.apply(changes)
+
+    def __process(self, data) -> tuple:
+        kind = data if isinstance(data, str) else next(iter(data), None)
+        self.received[kind] += 1
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            return {"Error": "Injected error"}, []
+
+        if data == "Ping":
+            return "Ok", []
+
+        if data == "GetStatus":
+            return {"Status": self.status}, []
+
+        if kind == "Daemon":
+            command = data["Daemon"]
+            if error := self.errors.get(next(iter(command))):
+                return {"Error": error}, []
+            return "Ok", [
+                (f"/config{path}", value) for path, value in daemon_changes(command)
+            ]
+
+        if kind == "Command":
+            serial, command = data["Command"]
+            if error := self.errors.get(next(iter(command))):
+                return {"Error": error}, []
+            if serial not in self.status["mixers"]:
+                return {"Error": f"Mixer {serial} not found"}, []
+            return "Ok", [
+                (f"/mixers/{serial}{path}", value)
+                for path, value in command_changes(command)
+            ]
+
+        return {"Error": f"Unknown request {kind}"}, []
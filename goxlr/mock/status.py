@@ -0,0 +1,363 @@
+import itertools
+from typing import List
+
+from ..types.enums import (
+    Button,
+    Channel,
+    EffectBankPreset,
+    Encoder,
+    EqFrequency,
+    Fader,
+    InputDevice,
+    MicrophoneType,
+    MiniEqFrequency,
+    Mix,
+    OutputDevice,
+    SampleBank,
+    SampleButton,
+    SamplerColourTarget,
+    SimpleColourTarget,
+    SubMixChannel,
+)
+
+
+def file_list(first: str, prefix: str, count: int, suffix: str = "") -> List[str]:
+    names = [f"{prefix} {i}{suffix}" for i in range(count)]
+    if first and names:
+        names[0] = first
+    return names
+
+
+def colours(*c):
+    keys = ("colour_one", "colour_two", "colour_three")
+    return dict(zip(keys, c))
+
+
+def serial_number(index: int) -> str:
+    """
+    Returns a made up serial number for the ``index``th generated mixer.
+    """
+    return f"S2108{index:05d}AAA"
+
+
+def generate_mixer(
+    device_type: str = "Full",
+    serial: str = "S210800000AAA",
+    samples_per_button: int = 1,
+    sample_files: List[str] = None,
+) -> dict:
+    """
+    Generates a mixer as it appears in the daemon's status.
+
+    :param device_type: ``Full`` or ``Mini``. Minis have no scribbles,
+                        effects or sampler.
+    :param serial: The serial number of the mixer.
+    :param samples_per_button: The number of samples assigned to each sample
+                               button in each bank.
+    :param sample_files: The sample files to assign, in turn. Made up names
+                         are used if not given.
+
+    :return: The raw mixer dictionary.
+    """
+    full = device_type == "Full"
+    sample_files = sample_files or [f"sample{i}.wav" for i in range(8)]
+    sample_names = itertools.cycle(sample_files)
+    mixer = {
+        "hardware": {
+            "versions": {
+                "firmware": [1, 4, 2, 107],
+                "fpga_count": 22,
+                "dice": [1, 0, 0, 0],
+            },
+            "serial_number": serial,
+            "manufactured_date": "2021-08-12",
+            "device_type": device_type,
+            "usb_device": {
+                "manufacturer_name": "TC-Helicon",
+                "product_name": "GoXLR" if full else "GoXLR Mini",
+                "version": [1, 0, 0],
+                "bus_number": 1,
+                "address": 5,
+                "identifier": None,
+            },
+        },
+        "shutdown_commands": [],
+        "fader_status": {
+            f.name: {
+                "channel": c,
+                "mute_type": "All",
+                "scribble": (
+                    {
+                        "file_name": None,
+                        "bottom_text": c,
+                        "left_text": None,
+                        "inverted": False,
+                    }
+                    if full
+                    else None
+                ),
+                "mute_state": "Unmuted",
+            }
+            for f, c in zip(Fader, ("Mic", "Music", "Game", "Chat"))
+        },
+        "mic_status": {
+            "mic_type": "Dynamic",
+            "mic_gains": {m.name: 30 for m in MicrophoneType},
+            "equaliser": {
+                "gain": {f.name: 0 for f in EqFrequency},
+                "frequency": {f.name: 100.0 * f.value for f in EqFrequency},
+            },
+            "equaliser_mini": {
+                "gain": {f.name: 0 for f in MiniEqFrequency},
+                "frequency": {f.name: 100.0 * f.value for f in MiniEqFrequency},
+            },
+            "noise_gate": {
+                "threshold": -30,
+                "attack": 10,
+                "release": 100,
+                "enabled": True,
+                "attenuation": 100,
+            },
+            "compressor": {
+                "threshold": -20,
+                "ratio": 4,
+                "attack": 2,
+                "release": 10,
+                "makeup_gain": 5,
+            },
+        },
+        "levels": {
+            "submix_supported": True,
+            "output_monitor": "Headphones",
+            "volumes": {c.name: 200 for c in Channel},
+            "submix": {
+                "inputs": {
+                    c.name: {"volume": 200, "linked": True, "ratio": 1.0}
+                    for c in SubMixChannel
+                },
+                "outputs": {o.name: Mix.A.name for o in OutputDevice},
+            },
+            "bleep": -20,
+            "deess": 0,
+        },
+        "router": {i.name: {o.name: True for o in OutputDevice} for i in InputDevice},
+        "cough_button": {"is_toggle": False, "mute_type": "All", "state": "Unmuted"},
+        "lighting": {
+            "animation": {
+                "supported": full,
+                "mode": "None",
+                "mod1": 0,
+                "mod2": 0,
+                "waterfall_direction": "Off",
+            },
+            "faders": {
+                f.name: {"style": "Gradient", "colours": colours("00FFFF", "000000")}
+                for f in Fader
+            },
+            "buttons": {
+                b.name: {"off_style": "Dimmed", "colours": colours("00FFFF", "000000")}
+                for b in Button
+            },
+            "simple": {t.name: colours("00FFFF") for t in SimpleColourTarget},
+            "sampler": {
+                t.name: {
+                    "off_style": "Dimmed",
+                    "colours": colours("00FFFF", "000000", "FFFFFF"),
+                }
+                for t in SamplerColourTarget
+            },
+            "encoders": {
+                e.name: colours("00FFFF", "000000", "FFFFFF") for e in Encoder
+            },
+        },
+        "effects": (
+            {
+                "is_enabled": True,
+                "active_preset": "Preset1",
+                "preset_names": {p.name: f"Preset {p.value}" for p in EffectBankPreset},
+                "current": {
+                    "reverb": {
+                        "style": "Library",
+                        "amount": 0,
+                        "decay": 1000,
+                        "early_level": 0,
+                        "tail_level": 0,
+                        "pre_delay": 0,
+                        "lo_colour": 0,
+                        "hi_colour": 0,
+                        "hi_factor": 0,
+                        "diffuse": 0,
+                        "mod_speed": 0,
+                        "mod_depth": 0,
+                    },
+                    "echo": {
+                        "style": "Quarter",
+                        "amount": 0,
+                        "feedback": 0,
+                        "tempo": 120,
+                        "delay_left": 0,
+                        "delay_right": 0,
+                        "feedback_left": 0,
+                        "feedback_right": 0,
+                        "feedback_xfb_l_to_r": 0,
+                        "feedback_xfb_r_to_l": 0,
+                    },
+                    "pitch": {"style": "Narrow", "amount": 0, "character": 0},
+                    "gender": {"style": "Narrow", "amount": 0},
+                    "megaphone": {
+                        "is_enabled": False,
+                        "style": "Megaphone",
+                        "amount": 0,
+                        "post_gain": 0,
+                    },
+                    "robot": {
+                        "is_enabled": False,
+                        "style": "Robot1",
+                        "low_gain": 0,
+                        "low_freq": 0,
+                        "low_width": 0,
+                        "mid_gain": 0,
+                        "mid_freq": 0,
+                        "mid_width": 0,
+                        "high_gain": 0,
+                        "high_freq": 0,
+                        "high_width": 0,
+                        "waveform": 0,
+                        "pulse_width": 0,
+                        "threshold": 0,
+                        "dry_mix": 0,
+                    },
+                    "hard_tune": {
+                        "is_enabled": False,
+                        "style": "Natural",
+                        "amount": 0,
+                        "rate": 0,
+                        "window": 0,
+                        "source": "All",
+                    },
+                },
+            }
+            if full
+            else None
+        ),
+        "sampler": (
+            {
+                "processing_state": {"progress": None, "last_error": None},
+                "active_bank": "A",
+                "clear_active": False,
+                "record_buffer": 0,
+                "banks": {
+                    b.name: {
+                        s.name: {
+                            "function": "PlayNext",
+                            "order": "Sequential",
+                            "samples": [
+                                {
+                                    "name": next(sample_names),
+                                    "start_pct": 0.0,
+                                    "stop_pct": 100.0,
+                                }
+                                for _ in range(samples_per_button)
+                            ],
+                            "is_playing": False,
+                            "is_recording": False,
+                        }
+                        for s in SampleButton
+                    }
+                    for b in SampleBank
+                },
+            }
+            if full
+            else None
+        ),
+        "settings": {
+            "display": {
+                "gate": "Simple",
+                "compressor": "Simple",
+                "equaliser": "Simple",
+                "equaliser_fine": "Simple",
+            },
+            "mute_hold_duration": 500,
+            "vc_mute_also_mute_cm": True,
+        },
+        "button_down": {b.name: False for b in Button},
+        "profile_name": "Default",
+        "mic_profile_name": "Default",
+    }
+    return mixer
+
+
+def generate_status(
+    device_type: str = "Full",
+    mixers: int = 1,
+    samples_per_button: int = 1,
+    profiles: int = 1,
+    mic_profiles: int = 1,
+    presets: int = 0,
+    icons: int = 0,
+    sample_files: int = 0,
+    serials: List[str] = None,
+) -> dict:
+    """
+    Generates a status document shaped like the daemon's reply to
+    ``GetStatus``, which `goxlr.types.models.Status` can parse.
+
+    :param device_type: The device type of every mixer, ``Full`` or
+                        ``Mini``.
+    :param mixers: The number of mixers.
+    :param samples_per_button: The number of samples assigned to each sample
+                               button in each bank.
+    :param profiles: The number of profiles in the file list.
+    :param mic_profiles: The number of mic profiles in the file list.
+    :param presets: The number of effect presets in the file list.
+    :param icons: The number of icons in the file list.
+    :param sample_files: The number of samples in the file list, which are
+                         assigned to the sample buttons in turn.
+    :param serials: The serial numbers of the mixers, made up if not given.
+
+    :return: The raw status dictionary.
+
+    :Example:
+
+        status = Status(generate_status(mixers=4, samples_per_button=50))
+    """
+    serials = serials or [serial_number(i) for i in range(mixers)]
+    samples = {f"sample{i:05d}.wav": f"sample{i:05d}.wav" for i in range(sample_files)}
+
+    return {
+        "config": {
+            "http_settings": {
+                "enabled": True,
+                "bind_address": "localhost",
+                "cors_enabled": False,
+                "port": 14564,
+            },
+            "daemon_version": "1.0.0",
+            "autostart_enabled": True,
+            "show_tray_icon": True,
+            "tts_enabled": False,
+            "allow_network_access": False,
+            "log_level": "Info",
+        },
+        "mixers": {
+            serial: generate_mixer(
+                device_type, serial, samples_per_button, list(samples)
+            )
+            for serial in serials
+        },
+        "paths": {
+            "profile_directory": "/p",
+            "mic_profile_directory": "/m",
+            "samples_directory": "/s",
+            "presets_directory": "/pr",
+            "icons_directory": "/i",
+            "logs_directory": "/l",
+        },
+        "files": {
+            "profiles": file_list("Default", "Profile", profiles),
+            "mic_profiles": file_list("Default", "Mic Profile", mic_profiles),
+            "samples": samples,
+            "presets": file_list(None, "Preset", presets),
+            "icons": file_list(None, "icon", icons, ".png"),
+        },
+    }
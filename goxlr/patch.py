@@ -0,0 +1,156 @@
+import copy
+from typing import Any, List
+
+from .error import PatchError
+from .types.enums import PatchOperation
+from .types.models import Patch, Status
+
+
+def parse_pointer(path: str) -> List[str]:
+    """
+    Splits a JSON pointer (RFC 6901) into its reference tokens.
+
+    :param path: The pointer, e.g. ``/mixers/S123/button_down/Fader1Mute``.
+
+    :return: The unescaped tokens, e.g.
+             ``["mixers", "S123", "button_down", "Fader1Mute"]``.
+
+    :raises PatchError: If the pointer is not empty and doesn't start with /.
+    """
+    if not path:
+        return []
+
+    if not path.startswith("/"):
+        raise PatchError(f"Invalid JSON pointer: {path}")
+
+    return [t.replace("~1", "/").replace("~0", "~") for t in path[1:].split("/")]
+
+
+def _index(container: list, token: str, append: bool = False) -> int:
+    if append and token == "-":
+        return len(container)
+
+    if not token.isdigit():
+        raise PatchError(f"Invalid array index: {token}")
+
+    index = int(token)
+    if index > len(container) or (not append and index == len(container)):
+        raise PatchError(f"Array index out of range: {token}")
+
+    return index
+
+
+def _resolve(document: Any, tokens: List[str]) -> Any:
+    for token in tokens:
+        try:
+            if isinstance(document, list):
+                document = document[_index(document, token)]
+            else:
+                document = document[token]
+        except (KeyError, TypeError):
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+
+    return document
+
+
+def _add(document: Any, tokens: List[str], value: Any) -> Any:
+    if not tokens:
+        return value
+
+    parent = _resolve(document, tokens[:-1])
+
+    if isinstance(parent, list):
+        parent.insert(_index(parent, tokens[-1], append=True), value)
+    elif isinstance(parent, dict):
+        parent[tokens[-1]] = value
+    else:
+        raise PatchError(f"Can't add to /{'/'.join(tokens[:-1])}")
+
+    return document
+
+
+def _remove(document: Any, tokens: List[str]) -> Any:
+    if not tokens:
+        raise PatchError("Can't remove the whole document")
+
+    parent = _resolve(document, tokens[:-1])
+
+    try:
+        if isinstance(parent, list):
+            return parent.pop(_index(parent, tokens[-1]))
+        return parent.pop(tokens[-1])
+    except (KeyError, AttributeError):
+        raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """
+    Applies one JSON patch (RFC 6902) operation to a document in place.
+
+    :param document: The document to patch, e.g. the raw status.
+    :param patch: The operation to apply.
+
+    :return: The patched document. This is only a different object if the
+             operation replaced the whole document.
+
+    :raises PatchError: If the operation can't be applied.
+    """
+    tokens = parse_pointer(patch.path)
+
+    match patch.operation:
+        case PatchOperation.Add:
+            return _add(document, tokens, patch.value)
+        case PatchOperation.Remove:
+            _remove(document, tokens)
+            return document
+        case PatchOperation.Replace:
+            if tokens:
+                _resolve(document, tokens)  # must already exist
+                _remove(document, tokens)
+            return _add(document, tokens, patch.value)
+        case PatchOperation.Move:
+            source = parse_pointer(patch.from_path)
+            if tokens[: len(source)] == source and tokens != source:
+                raise PatchError("Can't move a value into one of its children")
+            return _add(document, tokens, _remove(document, source))
+        case PatchOperation.Copy:
+            value = copy.deepcopy(_resolve(document, parse_pointer(patch.from_path)))
+            return _add(document, tokens, value)
+        case PatchOperation.Test:
+            if _resolve(document, tokens) != patch.value:
+                raise PatchError(f"Test failed: {patch.path}")
+            return document
+
+
+def apply_to_status(status: Status, patch: Patch):
+    """
+    Applies a patch to the raw document of a status and invalidates only the
+    part of the model tree it touched, e.g. a patch to
+    ``/mixers/S123/button_down/Fader1Mute`` only causes
+    ``status.mixers["S123"].button_down`` to be built again.
+
+    :param status: The status to patch.
+    :param patch: The operation to apply.
+
+    :raises PatchError: If the operation can't be applied. The status may be
+                        partially patched and should be fetched again.
+                        Also raised for a status made without its raw
+                        document, see ``Status(keep_raw=...)``.
+    """
+    if status.raw is None:
+        raise PatchError("The status does not keep its raw document")
+
+    raw = apply_patch(status.raw, patch)
+
+    if raw is not status.raw:
+        status.raw = raw
+        status.invalidate()
+        return
+
+    if patch.operation is PatchOperation.Test:
+        return
+
+    status.invalidate(parse_pointer(patch.path))
+
+    if patch.operation is PatchOperation.Move:
+        status.invalidate(parse_pointer(patch.from_path))
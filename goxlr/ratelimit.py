@@ -0,0 +1,194 @@
+import asyncio
+import statistics
+from typing import Awaitable, Callable, Dict
+
+
+class TokenBucket:
+    """
+    A token bucket that limits how many commands are sent per second.
+    Commands may burst up to ``burst`` at once, after which they are spaced
+    out at ``rate`` per second in the order they arrived.
+
+    In adaptive mode the rate follows the round-trip time of the commands:
+    it is cut when the smoothed round-trip time rises well above the fastest
+    one seen, and grows back slowly while the daemon keeps up.
+
+    :param rate: The number of commands allowed per second.
+    :param burst: The number of commands that may be sent at once. Defaults
+                  to one second's worth.
+    :param adaptive: Whether to adjust the rate from the observed round-trip
+                     times.
+    :param min_rate: The lowest rate adaptive mode will back off to.
+    :param max_rate: The highest rate adaptive mode will grow to. Defaults to
+                     the starting rate.
+    :param backoff_factor: How many times the fastest round-trip time the
+                           smoothed round-trip time may reach before the rate
+                           is cut.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = None,
+        adaptive: bool = False,
+        min_rate: float = 5,
+        max_rate: float = None,
+        backoff_factor: float = 2.0,
+    ):
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.tokens = float(self.burst)
+        self.updated = None
+
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate
+        self.backoff_factor = backoff_factor
+        self.smoothed_rtt = None
+        self.fastest_rtt = None
+        self.last_backoff = 0.0
+
+        # counters
+        self.acquired = 0  # commands let through
+        self.throttled = 0  # commands that had to wait for a token
+        self.wait_time = 0.0  # total seconds spent waiting for tokens
+        self.backoffs = 0  # times adaptive mode cut the rate
+
+    def __refill(self, now: float):
+        if self.updated is not None:
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+        self.updated = now
+
+    async def acquire(self):
+        """
+        Waits until a command may be sent.
+        """
+        now = asyncio.get_running_loop().time()
+        self.__refill(now)
+
+        # take the token now, even if it puts the bucket in debt, so that
+        # callers are let through in the order they arrived
+        self.tokens -= 1
+        self.acquired += 1
+
+        if self.tokens < 0:
+            delay = -self.tokens / self.rate
+            self.throttled += 1
+            self.wait_time += delay
+            await asyncio.sleep(delay)
+
+    def set_rate(self, rate: float):
+        """
+        Changes the rate, and the highest rate adaptive mode will grow to.
+        The burst is scaled with it, so that it still holds as many seconds
+        of commands as before.
+
+        :param rate: The number of commands allowed per second.
+        """
+        self.burst = max(1, round(self.burst * rate / self.max_rate))
+        self.tokens = min(self.tokens, self.burst)
+        self.rate = self.max_rate = rate
+
+    def observe(self, rtt: float):
+        """
+        Feeds a round-trip time in seconds to adaptive mode.
+
+        :param rtt: The round-trip time of a command.
+        """
+        if not self.adaptive:
+            return
+
+        if self.smoothed_rtt is None:
+            self.smoothed_rtt = rtt
+        else:
+            self.smoothed_rtt += (rtt - self.smoothed_rtt) / 8
+
+        if self.fastest_rtt is None or rtt < self.fastest_rtt:
+            self.fastest_rtt = rtt
+
+        now = asyncio.get_running_loop().time()
+
+        if self.smoothed_rtt > self.fastest_rtt * self.backoff_factor:
+            # only cut once per round trip, the commands already in flight
+            # were sent at the old rate
+            if now - self.last_backoff > self.smoothed_rtt:
+                self.rate = max(self.min_rate, self.rate * 0.7)
+                self.last_backoff = now
+                self.backoffs += 1
+        else:
+            self.rate = min(self.max_rate, self.rate + 1)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        :return: The current rate and the counters of the bucket.
+        """
+        return {
+            "rate": self.rate,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "wait_time": self.wait_time,
+            "backoffs": self.backoffs,
+            "smoothed_rtt": self.smoothed_rtt,
+        }
+
+
+async def calibrate(
+    send: Callable[[], Awaitable],
+    start_rate: float = 50,
+    max_rate: float = 5000,
+    step: float = 1.5,
+    duration: float = 1.0,
+    tolerance: float = 2.0,
+) -> float:
+    """
+    Finds the highest command rate the daemon can sustain. The rate is raised
+    by ``step`` each round until the median round-trip time exceeds
+    ``tolerance`` times the median of the first round, or the commands can
+    no longer be sent as fast as requested.
+
+    :param send: Sends one harmless command, e.g. a ping.
+    :param start_rate: The rate of the first round, in commands per second.
+    :param max_rate: The rate to stop at.
+    :param step: The factor the rate is raised by each round.
+    :param duration: How long each round lasts, in seconds.
+    :param tolerance: How much the round-trip time may grow over the first
+                      round before the rate is considered unsustainable.
+
+    :return: The highest sustainable rate, in commands per second.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def timed():
+        sent = loop.time()
+        await send()
+        return loop.time() - sent
+
+    baseline = None
+    sustainable = 0.0
+    rate = start_rate
+
+    while rate <= max_rate:
+        count = max(1, int(rate * duration))
+        started = loop.time()
+        tasks = []
+
+        for i in range(count):
+            # keep to the schedule even if the loop falls behind
+            if (delay := started + i / rate - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(timed()))
+
+        achieved = count / (loop.time() - started + 1 / rate)
+        rtt = statistics.median(await asyncio.gather(*tasks))
+
+        if baseline is None:
+            baseline = rtt
+        elif rtt > baseline * tolerance or achieved < rate * 0.9:
+            break
+
+        sustainable = rate
+        rate *= step
+
+    return sustainable
@@ -0,0 +1,115 @@
+import json
+import os
+from dataclasses import dataclass
+from typing import Iterable, Tuple
+
+from .codec import Codec, pack, unpack
+from .types.enums import SceneSection
+
+# The header of a saved scene, and its version, which is bumped whenever
+# the saved form of a scene changes.
+SCENE_MAGIC = b"GXSC"
+SCENE_VERSION = 2
+
+# The paths of a raw mixer dict each section captures. Effects keep the
+# active preset with the current values, since the values belong to it.
+SECTION_PATHS = {
+    SceneSection.FaderStatus: [("fader_status",)],
+    SceneSection.Levels: [("levels",)],
+    SceneSection.Router: [("router",)],
+    SceneSection.MicStatus: [("mic_status",)],
+    SceneSection.Lighting: [("lighting",)],
+    SceneSection.Effects: [("effects", "active_preset"), ("effects", "current")],
+}
+
+
+@dataclass(slots=True)
+class Scene:
+    """
+    A snapshot of parts of a mixer, taken by `GoXLR.capture_scene()` and
+    put back with `GoXLR.restore_scene()`.
+
+    :param sections: The sections captured.
+    :param state: The captured values, shaped like the mixer in the status.
+    """
+
+    sections: Tuple[SceneSection, ...]
+    state: dict
+
+    def dumps(self, codec: str | Codec = "json") -> bytes:
+        """
+        :param codec: The JSON codec to encode the scene with, see
+                      `goxlr.codec.get_codec()`.
+
+        :return: The scene in a compact binary form, see `loads()`.
+        """
+        document = {"sections": [s.name for s in self.sections], "state": self.state}
+        return pack(document, SCENE_MAGIC, SCENE_VERSION, codec)
+
+    @classmethod
+    def loads(cls, data: bytes, codec: str | Codec = "json") -> "Scene":
+        """
+        Reads a scene from `dumps()`. The data is only ever decoded as
+        JSON, so scenes can be shared safely.
+
+        :param codec: The JSON codec to decode the scene with, see
+                      `goxlr.codec.get_codec()`.
+
+        :raises ValueError: If the data is not a scene, or the scene was
+                            saved in a form this version of the library
+                            can't read.
+        """
+        version, document = unpack(data, SCENE_MAGIC, codec)
+        if version != SCENE_VERSION:
+            raise ValueError(f"Unsupported scene version {version}")
+
+        try:
+            sections = tuple(SceneSection[s] for s in document["sections"])
+            state = document["state"]
+        except (KeyError, TypeError) as e:
+            raise ValueError("Not a valid scene") from e
+
+        if not isinstance(state, dict):
+            raise ValueError("Not a valid scene")
+
+        return cls(sections, state)
+
+    def save(self, path: str | os.PathLike, codec: str | Codec = "json"):
+        """
+        Saves the scene to a file, see `load()`.
+        """
+        with open(path, "wb") as file:
+            file.write(self.dumps(codec))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, codec: str | Codec = "json") -> "Scene":
+        """
+        Loads a scene saved with `save()`.
+        """
+        with open(path, "rb") as file:
+            return cls.loads(file.read(), codec)
+
+
+def capture(mixer: dict, sections: Iterable[SceneSection]) -> Scene:
+    """
+    Copies the given sections out of a raw mixer dict.
+
+    :param mixer: The raw mixer dict from the status.
+    :param sections: The sections to copy.
+
+    :return: The scene, sharing nothing with the mixer dict.
+    """
+    sections = tuple(sections)
+    state = {}
+
+    for section in sections:
+        for path in SECTION_PATHS[section]:
+            source, target = mixer, state
+            for token in path[:-1]:
+                source = source.get(token) or {}
+                target = target.setdefault(token, {})
+            if path[-1] in source:
+                target[path[-1]] = source[path[-1]]
+
+    # a JSON round trip copies plain JSON data faster than deepcopy
+    return Scene(sections, json.loads(json.dumps(state)))
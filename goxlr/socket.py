@@ -1,35 +1,97 @@
 import asyncio
-from typing import List
+import os
+import sys
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List
+from weakref import WeakSet
 import websockets
-import json
 
+from .types.enums import CommandPriority, OverflowPolicy
 from .types.models import Mixer, Patch, Status, IDType
+from .types.packed import PackedState
 
 from .commands import DaemonCommands, GoXLRCommands, StatusCommands
-
-from .error import DaemonError, MixerNotFoundError
+from .commands.changes import Change
+from .commands.coalesce import WriteCoalescer
+from .commands.goxlr import COMMAND_PRIORITIES
+from .codec import Codec, get_codec
+
+from .cache import cache_path, load_status, save_status
+from .error import DaemonError, MixerNotFoundError, PatchError, StatusNotReadyError
+from .events import EventStream, decode_patches
+from .subscriptions import Subscription, Subscriptions
+from .patch import apply_to_status, parse_pointer
+from .ratelimit import TokenBucket, calibrate
+
+
+@dataclass(eq=False)
+class OutboundRequest:
+    id: int
+    frame: str
+    priority: CommandPriority
+    holds_slot: bool = False
+    sent_at: float = None
+    on_response: Callable[[dict], Any] = None
+    changes: List[Change] = None  # absolute paths, see Socket.send()
 
 
 class Socket:
     """
     A class for handling the websocket connection to the daemon.
-    It also handles the heartbeat task and the response queue. The response
-    queue is used to ensure that the correct response is returned for a
-    specific request.
+    It also handles the heartbeat, reader and writer tasks. The reader task
+    is the only consumer of the websocket and hands every response to the
+    future waiting on its ID, so any number of requests can be in flight at
+    the same time. The writer task sends queued requests from the highest
+    priority lane first.
 
     :param host: The host/IP address of the daemon.
     :param port: The port of the daemon.
+    :param max_in_flight: The maximum number of requests that may be waiting
+                          for a response at once. Further requests wait in
+                          their lane for a free slot before they are sent.
+                          Requests in the `CommandPriority.Mute` lane are
+                          never held back by this limit.
+    :param codec: The JSON codec for the wire, either a `Codec` or the name
+                  of one (``json``, ``orjson``, ``msgspec`` or ``ujson``).
+                  Falls back to ``json`` if the library is not installed.
     """
 
-    def __init__(self, host, port):
+    def __init__(
+        self, host, port, max_in_flight: int = 256, codec: str | Codec = "json"
+    ):
         self.host = host
         self.port = port
         self.uri = f"ws://{self.host}:{self.port}/api/websocket"
+        self.codec = get_codec(codec)
         self.socket = None
         self.heartbeat_interval = 5
         self.heartbeat_task = None
         self.heartbeat_payload = {"id": 0, "data": "Ping"}
-        self.response_queue = []
+        self.reader_task = None
+        self.writer_task = None
+        self.next_id = 1
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+        # requests waiting to be written, one lane per priority
+        self.lanes: Dict[CommandPriority, Deque[OutboundRequest]] = {
+            priority: deque() for priority in CommandPriority
+        }
+        self.wakeup = asyncio.Event()  # set when the writer may have work
+
+        # responses nobody was waiting for, either because the caller gave up
+        # (cancelled, timed out) or because the ID was never ours
+        self.orphaned_responses = 0
+
+        # futures for responses to requests we have sent, and the requests
+        # themselves, keyed by ID
+        self.response_futures: Dict[int, asyncio.Future] = {}
+        self.requests: Dict[int, OutboundRequest] = {}
+
+        # futures for anything else (heartbeat, patches or any message when
+        # the key is None), several callers may be waiting on the same ID
+        self.message_waiters: Dict[int | None, List[asyncio.Future]] = {}
 
     async def open(self):
         """
@@ -38,15 +100,177 @@ class Socket:
         :return: True if the connection was successful, False otherwise.
         """
         self.socket = await websockets.connect(self.uri)
+        self.reader_task = asyncio.create_task(self.__read_responses())
+        self.writer_task = asyncio.create_task(self.__write_requests())
         self.heartbeat_task = asyncio.create_task(self.__send_heartbeat())
         return self.socket.open
 
     async def __send_heartbeat(self):
         while True:
             await asyncio.sleep(self.heartbeat_interval)
-            await self.socket.send(json.dumps(self.heartbeat_payload))
+            await self.socket.send(self.codec.encode(self.heartbeat_payload))
+
+    async def __read_responses(self):
+        try:
+            while True:
+                message = await self.socket.recv()
+                try:
+                    self.__dispatch(self.codec.decode(message))
+                except Exception as e:
+                    # one bad message must not stop every later response
+                    self.__report_error("Failed to read a message", e)
+        except Exception as e:
+            # wake everyone up, nothing else is going to arrive
+            self.__fail_waiters(e)
+            self.on_disconnect(e)
+
+    def __report_error(self, message: str, exception: Exception):
+        asyncio.get_running_loop().call_exception_handler(
+            {"message": message, "exception": exception, "socket": self.socket}
+        )
+
+    async def __write_requests(self):
+        while True:
+            if not (request := self.__next_request()):
+                self.wakeup.clear()
+                await self.wakeup.wait()
+                continue
+
+            try:
+                request.sent_at = asyncio.get_running_loop().time()
+                await self.socket.send(request.frame)
+            except Exception as e:
+                if future := self.response_futures.pop(request.id, None):
+                    if not future.done():
+                        future.set_exception(e)
+
+    def __next_request(self) -> OutboundRequest | None:
+        for priority, lane in self.lanes.items():
+            if not lane:
+                continue
+
+            if priority is not CommandPriority.Mute:
+                if self.in_flight >= self.max_in_flight:
+                    # every lower lane needs a slot too
+                    return None
+
+                self.in_flight += 1
+                lane[0].holds_slot = True
+
+            return lane.popleft()
+
+        return None
+
+    def on_patch(self, patches: List[Patch]):
+        """
+        Called by the reader task with every patch message, before anyone
+        waiting for it is woken up. Does nothing by default.
+        """
+        pass
+
+    def on_round_trip(self, payload, rtt: float):
+        """
+        Called with every payload that got a response and its round-trip
+        time in seconds, measured from when it was written to the socket.
+        Does nothing by default.
+        """
+        pass
 
-    async def send(self, payload, id=None):
+    def apply_changes(self, root: str, changes: List[Change]):
+        """
+        Called by the reader task with the changes of a request the daemon
+        answered with "Ok", see `send()`. Does nothing by default.
+        """
+        pass
+
+    def on_disconnect(self, exception: Exception):
+        """
+        Called by the reader task when the connection to the daemon is
+        closed or can't be read from any more, after every waiter has been
+        failed. Does nothing by default.
+        """
+        pass
+
+    def lane_depths(self) -> Dict[CommandPriority, int]:
+        """
+        :return: The number of requests waiting to be sent in each lane.
+        """
+        return {priority: len(lane) for priority, lane in self.lanes.items()}
+
+    def __dispatch(self, response: dict):
+        id = response.get("id")
+
+        if id == IDType.Patch.value:
+            try:
+                self.on_patch([Patch(p) for p in response.get("data").get("Patch")])
+            except Exception as e:
+                # still wake up whoever is waiting for the message
+                self.__report_error("Failed to handle a patch", e)
+
+        for future in self.message_waiters.pop(None, []):
+            if not future.done():
+                future.set_result(response)
+
+        if future := self.response_futures.pop(id, None):
+            request = self.requests.pop(id, None)
+            if not future.done():
+                try:
+                    if request and request.changes and response.get("data") == "Ok":
+                        self.apply_changes("", request.changes)
+                    if request and request.on_response:
+                        request.on_response(response)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(response)
+            return
+
+        if waiters := self.message_waiters.pop(id, None):
+            for future in waiters:
+                if not future.done():
+                    future.set_result(response)
+            return
+
+        if id not in (IDType.Heartbeat.value, IDType.Patch.value):
+            # count it and drop it, keeping it around would leak memory
+            self.orphaned_responses += 1
+
+    def __allocate_id(self) -> int:
+        """
+        Returns the next free request ID. IDs wrap around before reaching the
+        patch ID, never hand out the heartbeat ID and skip any ID that is
+        still waiting for a response.
+        """
+        reserved = (IDType.Heartbeat.value, IDType.Patch.value)
+
+        while True:
+            id = self.next_id
+            self.next_id = id + 1 if id + 1 < IDType.Patch.value else 1
+
+            if id not in reserved and id not in self.response_futures:
+                return id
+
+    def __fail_waiters(self, exception: Exception):
+        futures = list(self.response_futures.values())
+        for waiters in self.message_waiters.values():
+            futures.extend(waiters)
+
+        self.response_futures.clear()
+        self.requests.clear()
+        self.message_waiters.clear()
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(exception)
+
+    async def send(
+        self,
+        payload,
+        id=None,
+        priority: CommandPriority = CommandPriority.Audio,
+        on_response: Callable[[dict], Any] = None,
+        changes: List[Change] = None,
+    ):
         """
         Sends a payload to the daemon and waits for a response.
 
@@ -55,15 +279,60 @@ class Socket:
                    automatically generate one. Used purely for identifying
                    the correct response, considering that this is an async
                    function and responses may come in out of order.
+        :param priority: The lane to queue the payload in. Queued payloads
+                         in a higher priority lane are always sent first.
+        :param on_response: Called by the reader task with the response
+                            before the next message is read, so nothing the
+                            daemon sent after it is handled first. If it
+                            raises, the exception is raised from here.
+        :param changes: The changes the payload makes to the status, as
+                        (path, value) pairs with absolute paths. Passed to
+                        `apply_changes()` by the reader task if the daemon
+                        answers "Ok", so they land before any patch the
+                        daemon sends after its answer.
 
         :return: The response from the daemon.
+
+        :raises ConnectionError: If the connection is not open, or was lost.
         """
-        id = id or self.response_queue[-1].get("id") + 1 if self.response_queue else 1
+        if not self.reader_task or self.reader_task.done():
+            # nothing would ever read the response
+            raise ConnectionError("Not connected to the daemon")
+
+        if not id:
+            id = self.__allocate_id()
+        elif id in self.response_futures:
+            raise ValueError(f"A request with ID {id} is already in flight")
 
-        payload = {"id": id, "data": payload}
-        await self.socket.send(json.dumps(payload))
+        future = asyncio.get_running_loop().create_future()
+        self.response_futures[id] = future
+
+        frame = self.codec.encode({"id": id, "data": payload})
+        request = OutboundRequest(
+            id, frame, priority, on_response=on_response, changes=changes
+        )
+        self.requests[id] = request
+        self.lanes[priority].append(request)
+        self.wakeup.set()
+
+        try:
+            response = await future
+            self.on_round_trip(
+                payload, asyncio.get_running_loop().time() - request.sent_at
+            )
+        finally:
+            if self.response_futures.get(id) is future:
+                del self.response_futures[id]
+            if self.requests.get(id) is request:
+                del self.requests[id]
+
+            if request.holds_slot:
+                self.in_flight -= 1
+                self.wakeup.set()
+            elif request in self.lanes[priority]:
+                # gave up before it was sent
+                self.lanes[priority].remove(request)
 
-        response = await self.receive(id)
         data = response.get("data")
 
         if data == "Ok":
@@ -78,45 +347,27 @@ class Socket:
 
     async def receive(self, id: IDType | int = None):
         """
-        Waits for a response from the daemon. If an ID is specified, it will
-        wait until it receives a response with the same ID and queue all other
-        responses.
+        Waits for a response from the daemon. Responses are read by a
+        background task, so this only waits for the reader to hand over the
+        next response with the matching ID. Responses that arrived before
+        anyone was waiting for them are not kept.
 
         :param id: The ID of the response to wait for. If not specified, it
-                   will wait for the first response and will not add it to
-                   the queue.
+                   will wait for the next message of any kind.
 
         :return: The response from the daemon.
-
-        :raises: `DaemonError` if the daemon returns an error.
         """
-        if not id:
-            response = await self.socket.recv()
-            response = json.loads(response)
-            return response
-        elif isinstance(id, IDType):
+        if isinstance(id, IDType):
             id = id.value
 
-        # if we already have the response, return it
-        for r in self.response_queue:
-            if r.get("id") == id:
-                self.response_queue.remove(r)
-                return r
+        future = asyncio.get_running_loop().create_future()
 
-        # keep receiving until we get a response with the same id
-        while True:
-            response = await self.socket.recv()
-            response = json.loads(response)
-
-            if response.get("id") == id:
-                return response
-            else:
-                if response.get("id") in (0, 2**64 - 1):
-                    # no need to queue heartbeat and patch responses
-                    # if we want to do something with them, either specify
-                    # the id or don't specify one at all
-                    continue
-                self.response_queue.append(response)
+        if id in self.response_futures:
+            future = self.response_futures[id]
+        else:
+            self.message_waiters.setdefault(id, []).append(future)
+
+        return await future
 
     async def receive_patch(self) -> List[Patch]:
         """
@@ -137,6 +388,8 @@ class Socket:
         """
         await self.socket.close()
         self.heartbeat_task.cancel()
+        self.reader_task.cancel()
+        self.writer_task.cancel()
         return self.socket.closed
 
     async def connect(self):
@@ -163,20 +416,161 @@ class Socket:
         await self.close()
 
 
+class _NotReady:
+    # Stands in for the status and mixer while open() fetches them in the
+    # background. Falsy, so code that checks for a status skips it.
+
+    def __bool__(self):
+        return False
+
+    def __getattr__(self, name):
+        raise StatusNotReadyError(
+            "The status has not been fetched yet, await GoXLR.ready() first"
+        )
+
+
 class GoXLR(Socket, DaemonCommands, GoXLRCommands, StatusCommands):
     """
     A class for interacting with the GoXLR Utility daemon.
+
+    :param host: The host/IP address of the daemon.
+    :param port: The port of the daemon.
+    :param serial: The serial number of the mixer to interact with. If not
+                   specified, the first mixer is used.
+    :param max_in_flight: The maximum number of requests that may be waiting
+                          for a response at once.
+    :param codec: The JSON codec for the wire, see `Socket`.
+    :param coalesce: Whether to coalesce writes to continuous parameters, so
+                     that only the latest value is sent while an earlier
+                     write for the same target is still queued or in flight.
+    :param rate_limit: The maximum number of commands per second to send to
+                       each mixer. Mute commands are never limited. If not
+                       specified, commands are not rate limited.
+    :param rate_limit_burst: The number of commands that may be sent to a
+                             mixer at once before the rate limit applies.
+    :param adaptive_rate_limit: Whether to lower the rate limit while the
+                                daemon's round-trip time is rising and raise
+                                it back up to ``rate_limit`` as it recovers.
+    :param apply_patches: Whether to apply patches from the daemon to the
+                          local status as they arrive, instead of fetching
+                          the whole status again after each one.
+    :param lazy: Whether to build each part of the status the first time it
+                 is accessed, instead of building the whole tree on every
+                 `update()`.
+    :param packed: Whether to also keep each mixer's buttons, routing and
+                   volumes as a `PackedState`, for cheap checks.
+    :param optimistic: Whether to update the local status as soon as the
+                       daemon acknowledges a command, instead of when its
+                       patch arrives, see `apply_changes()`. `set_router()`
+                       always updates the router and its routing index.
+    :param correlate: Whether commands should return the patches they
+                      caused with the daemon's reply, as a `CommandResult`.
+    :param correlate_window: The most seconds to wait for a command's
+                             patches after the daemon answered it.
+    :param correlate_unknown: Whether commands whose changes aren't known,
+                              e.g. loading a profile, wait the whole
+                              ``correlate_window`` and take every patch to
+                              the mixer in it. If not, they return no
+                              patches as soon as they are answered; use
+                              `settle()` to collect theirs.
+    :param background_update: Whether `open()` returns as soon as it is
+                              connected and fetches the status in the
+                              background, see `ready()`. Commands can be
+                              sent straight away if ``serial`` is given.
+                              Getters are not coroutines, so they can't
+                              wait for the status: until it has arrived
+                              they raise `StatusNotReadyError`, and
+                              ``await xlr.ready()`` waits for it.
+    :param status_cache: A directory to keep a copy of the status in, one
+                         file per host and port. If there is a copy,
+                         `open()` loads it and returns at once, fetching
+                         the live status in the background, see
+                         ``status_stale``.
+    :param skip_unchanged: Whether commands that would only set values the
+                           status already holds return "Ok" at once instead
+                           of being sent. Only done while the daemon's
+                           patches keep the status current, and never for a
+                           value a command still waiting for its answer may
+                           change. Mutes and the commands in
+                           `goxlr.commands.goxlr.ALWAYS_SENT` are always
+                           sent. Send anyway in a `force()` block. Counted
+                           in ``write_cache_hits`` and ``write_cache_misses``.
     """
 
-    def __init__(self, host="localhost", port=14564, serial=None):
-        super().__init__(host, port)
+    def __init__(
+        self,
+        host="localhost",
+        port=14564,
+        serial=None,
+        max_in_flight: int = 256,
+        codec: str | Codec = "json",
+        coalesce: bool = False,
+        rate_limit: float = None,
+        rate_limit_burst: int = None,
+        adaptive_rate_limit: bool = False,
+        apply_patches: bool = True,
+        lazy: bool = False,
+        packed: bool = False,
+        optimistic: bool = True,
+        correlate: bool = False,
+        correlate_window: float = 0.1,
+        correlate_unknown: bool = False,
+        background_update: bool = False,
+        status_cache: str | os.PathLike = None,
+        skip_unchanged: bool = False,
+    ):
+        super().__init__(host, port, max_in_flight, codec)
+
+        # last-write-wins for continuous parameters such as volumes, see
+        # goxlr.commands.coalesce.COALESCED_COMMANDS
+        self.coalescer = WriteCoalescer() if coalesce else None
+
+        # lane for each command name, change it to override the defaults
+        self.command_priorities = dict(COMMAND_PRIORITIES)
+
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.adaptive_rate_limit = adaptive_rate_limit
+        self.rate_limiters: Dict[str, TokenBucket] = {}  # keyed by serial
 
         self.status: Status = None
+        self.apply_patches = apply_patches
+        self.lazy = lazy
+        self.update_task = None  # refetch after a patch failed to apply
+
+        # streams returned by events(), forgotten once nobody holds them
+        self.event_streams: WeakSet[EventStream] = WeakSet()
+        self.subscriptions = Subscriptions()  # see subscribe()
+
+        # bitmask copies of button, routing and volume state, keyed by serial
+        self.packed = packed
+        self.packed_states: Dict[str, PackedState] = {}
+
+        self.optimistic = optimistic  # see apply_changes()
+
+        # see goxlr.commands.correlate.PatchCorrelator
+        self.correlate = correlate
+        self.correlate_window = correlate_window
+        self.correlate_unknown = correlate_unknown
+
+        self.background_update = background_update
+        self.ready_task: asyncio.Task = None  # the first fetch, see ready()
+
+        self.status_cache = status_cache
+        self.status_generation = 0  # live statuses fetched so far
+        self.status_stale = False  # whether the status came from the cache
+
+        # commands answered from the status and sent, see skip_unchanged
+        self.skip_unchanged = skip_unchanged
+        self.write_cache_hits = 0
+        self.write_cache_misses = 0
+        self.unanswered_writes: Counter[str] = Counter()  # by absolute path
 
         self.mixer: Mixer = None  # the currently selected mixer
         self.serial: str = (
             serial  # shorthand for self.mixer.hardware_info.serial_number
         )
+        self.requested_serial = serial  # None if the first mixer was picked
 
     async def ping(self):
         """
@@ -186,6 +580,68 @@ class GoXLR(Socket, DaemonCommands, GoXLRCommands, StatusCommands):
         """
         return await self.send("Ping")
 
+    def get_rate_limiter(self, serial: str = None) -> TokenBucket | None:
+        """
+        Returns the rate limiter of a mixer, creating it on first use.
+
+        :param serial: The serial number of the mixer. If not specified, the
+                       currently selected mixer is used.
+
+        :return: The rate limiter, or None if rate limiting is disabled.
+        """
+        if not self.rate_limit:
+            return None
+
+        serial = serial or self.serial
+
+        if not (limiter := self.rate_limiters.get(serial)):
+            limiter = self.rate_limiters[serial] = TokenBucket(
+                self.rate_limit,
+                self.rate_limit_burst,
+                adaptive=self.adaptive_rate_limit,
+            )
+
+        return limiter
+
+    def rate_limit_stats(self) -> Dict[str, dict]:
+        """
+        :return: The current rate and counters of each mixer's rate limiter,
+                 keyed by serial number.
+        """
+        return {
+            serial: limiter.stats() for serial, limiter in self.rate_limiters.items()
+        }
+
+    def on_round_trip(self, payload, rtt: float):
+        if isinstance(payload, dict) and (command := payload.get("Command")):
+            if limiter := self.rate_limiters.get(command[0]):
+                limiter.observe(rtt)
+
+    async def calibrate_rate_limit(self, apply: bool = True, **kwargs) -> float:
+        """
+        Finds the highest command rate the daemon can sustain by sending
+        pings at increasing rates. See `goxlr.ratelimit.calibrate` for the
+        accepted keyword arguments.
+
+        :param apply: Whether to use the result as the rate limit from now on.
+                      The burst of each rate limiter is scaled with it.
+
+        :return: The highest sustainable rate, in commands per second.
+        """
+        rate = await calibrate(self.ping, **kwargs)
+
+        if apply and rate:
+            if self.rate_limit_burst and self.rate_limit:
+                # keep the burst the same share of a second's commands
+                self.rate_limit_burst = max(
+                    1, round(self.rate_limit_burst * rate / self.rate_limit)
+                )
+            self.rate_limit = rate
+            for limiter in self.rate_limiters.values():
+                limiter.set_rate(rate)
+
+        return rate
+
     async def update(self):
         """
         Gets the latest data from the GoXLR Utility daemon and updates the status
@@ -200,26 +656,283 @@ class GoXLR(Socket, DaemonCommands, GoXLRCommands, StatusCommands):
             You should manually call this method periodically to ensure that the data
             is up to date.
         """
-        self.status = await self.get_status()
+        if not await self.send("GetStatus", on_response=self.__receive_status):
+            raise DaemonError("Failed to get status from daemon.")
 
         if self.serial:
             self.mixer = self.select_mixer(self.serial)
 
         return self.status
 
+    def __receive_status(self, response: dict):
+        # installed by the reader task, so a patch sent right after the
+        # status is applied to it rather than to the one it replaces
+        data = response.get("data")
+        if not (isinstance(data, dict) and (raw := data.get("Status"))):
+            return
+
+        self.__use_status(Status(raw, lazy=self.lazy, keep_raw=True))
+        self.status_generation += 1
+        self.status_stale = False
+
+        if self.serial not in self.status.mixers and not self.requested_serial:
+            # picked for the user, e.g. from the cache, so pick again
+            self.serial = next(iter(self.status.mixers), None)
+
+        if self.serial:
+            self.mixer = self.status.mixers.get(self.serial)
+
+    def __use_status(self, status: Status):
+        self.status = status
+
+        if self.packed:
+            self.packed_states = {
+                serial: PackedState(mixer)
+                for serial, mixer in self.status.raw["mixers"].items()
+            }
+
+    def on_patch(self, patches: List[Patch]):
+        if self.apply_patches and self.status:
+            try:
+                for patch in patches:
+                    apply_to_status(self.status, patch)
+            except PatchError:
+                # our copy has drifted from the daemon's, fetch it again
+                if not self.update_task or self.update_task.done():
+                    self.update_task = asyncio.create_task(self.update())
+
+            if self.serial:
+                self.mixer = self.status.mixers.get(self.serial)
+
+        if self.packed:
+            self.__update_packed_states(patches)
+
+        if self.event_streams:
+            events = decode_patches(patches)
+            for stream in list(self.event_streams):
+                stream.put(events)
+
+        if self.subscriptions:
+            self.subscriptions.dispatch(patches)
+
+    def __update_packed_states(self, patches: List[Patch]):
+        updated = set()
+
+        for patch in patches:
+            tokens = parse_pointer(patch.path)
+            if len(tokens) < 2 or tokens[0] != "mixers":
+                continue
+
+            serial = tokens[1]
+            if serial not in updated:
+                updated.add(serial)
+                state = self.packed_states.setdefault(serial, PackedState())
+                state.changed = 0  # only what this message changed
+
+            if not self.packed_states[serial].apply(tokens[2:], patch):
+                # a move or copy, read the result from the patched status
+                if self.apply_patches and self.status:
+                    mixer = self.status.raw["mixers"].get(serial)
+                    self.packed_states[serial].load(mixer or {})
+
+    def apply_changes(self, root: str, changes: List[Change]):
+        """
+        Updates the local status with the changes of a command the daemon
+        acknowledged, so getters read the new values without waiting for
+        the daemon's patch. Called by the reader task as it reads the
+        acknowledgement, so any patch sent after it is applied over them.
+        Only the daemon's patches are seen by events and subscriptions.
+        Commands only pass their changes here if ``optimistic`` is enabled,
+        apart from those in `goxlr.commands.goxlr.ALWAYS_APPLIED`.
+
+        :param root: The JSON pointer the changes are relative to, e.g.
+                     ``/mixers/S123``.
+        :param changes: (path, value) pairs, see `goxlr.commands.changes`.
+        """
+        if not self.status:
+            return
+
+        for path, value in changes:
+            patch = Patch({"op": "replace", "path": root + path, "value": value})
+            try:
+                apply_to_status(self.status, patch)
+            except PatchError:
+                continue  # not in this status, e.g. a Full only setting on a Mini
+
+            if self.packed:
+                tokens = parse_pointer(patch.path)
+                if tokens[0] == "mixers" and tokens[1] in self.packed_states:
+                    self.packed_states[tokens[1]].apply(tokens[2:], patch)
+
+        if self.serial:
+            self.mixer = self.status.mixers.get(self.serial)
+
+    def on_disconnect(self, exception: Exception):
+        for stream in list(self.event_streams):
+            stream.close()
+
+    def events(
+        self,
+        *types: type,
+        serial: str = None,
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DropOldest,
+    ) -> EventStream:
+        """
+        Returns an async iterator over events decoded from the daemon's
+        patches, such as `ButtonPressed` or `VolumeChanged`. Events are
+        buffered from the moment this is called until the stream is closed,
+        either with ``close()``, by leaving its ``async with`` block or when
+        the connection is closed.
+
+        :param types: Only yield events of these types (see `goxlr.events`).
+                      All events if none are given.
+        :param serial: Only yield events from this mixer. All mixers if not
+                       specified.
+        :param maxsize: The maximum number of events to buffer.
+        :param overflow: What to do with new events while the buffer is
+                         full: drop the oldest, drop the newest or raise
+                         `EventOverflowError` from the iterator.
+
+        :return: The event stream.
+
+        :Example:
+
+            async with xlr.events(ButtonPressed) as events:
+                async for event in events:
+                    print(event.serial, event.button)
+        """
+        stream = EventStream(
+            types, serial, maxsize, overflow, on_close=self.event_streams.discard
+        )
+        self.event_streams.add(stream)
+        return stream
+
+    def subscribe(
+        self,
+        pattern: str,
+        callback: Callable[[Patch], Any],
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DropOldest,
+    ) -> Subscription:
+        """
+        Calls a function with every patch from the daemon whose path matches
+        a pattern. ``*`` in the pattern matches any one key and a trailing
+        ``**`` matches anything below. A patch also matches if it replaces
+        something above the pattern, e.g. a whole mixer.
+
+        Each subscription has its own queue, so a slow callback does not
+        hold up the others.
+
+        :param pattern: A JSON pointer pattern, e.g.
+                        ``/mixers/*/levels/volumes/*``.
+        :param callback: Called with each matching `Patch`. May be a
+                         coroutine function.
+        :param maxsize: The maximum number of patches to queue for the
+                        callback.
+        :param overflow: Whether to drop the oldest or the newest patch when
+                         the queue is full.
+
+        :return: The subscription, pass it to `unsubscribe()` to stop.
+
+        :Example:
+
+            xlr.subscribe(
+                "/mixers/*/button_down/*",
+                lambda patch: print(patch.path, patch.value),
+            )
+        """
+        return self.subscriptions.add(
+            Subscription(pattern, callback, maxsize, overflow)
+        )
+
+    def unsubscribe(self, subscription: Subscription):
+        """
+        Stops calling a subscription's callback.
+
+        :param subscription: The subscription returned by `subscribe()`.
+        """
+        self.subscriptions.remove(subscription)
+
+    async def settle(
+        self,
+        quiet_ms: float = 100,
+        timeout: float = 5.0,
+        serial: str = None,
+        command: Awaitable = None,
+    ) -> List[Patch]:
+        """
+        Waits until the daemon stops sending patches for a mixer, e.g. after
+        loading a profile, which changes the status in a burst of patches.
+        The patches are applied to the status as usual while waiting.
+
+        :param quiet_ms: How long no patch may arrive for, in milliseconds.
+        :param timeout: The most seconds to wait for the patches to stop.
+        :param serial: The serial number of the mixer to watch.
+                       If not specified, the currently selected mixer is used.
+        :param command: A command to send once watching, so that none of its
+                        patches are missed. The quiet time starts once it has
+                        been answered.
+
+        :return: The patches that arrived, in order.
+
+        :raises asyncio.TimeoutError: If patches were still arriving after
+                                      ``timeout`` seconds.
+
+        :Example:
+
+        >>> await xlr.set_active_effect_preset(EffectBankPreset.Preset2)
+        >>> patches = await xlr.settle(quiet_ms=50)
+        """
+        serial = serial or self.serial
+        patches: List[Patch] = []
+        arrived = asyncio.Event()
+
+        def collect(patch: Patch):
+            patches.append(patch)
+            arrived.set()
+
+        # the callback only appends, so nothing needs to be dropped
+        subscription = self.subscribe(
+            f"/mixers/{serial}/**", collect, maxsize=sys.maxsize
+        )
+        loop = asyncio.get_running_loop()
+        quiet = quiet_ms / 1000
+
+        try:
+            if command is not None:
+                await command
+
+            deadline = loop.time() + timeout
+            while True:
+                arrived.clear()
+                remaining = deadline - loop.time()
+                try:
+                    await asyncio.wait_for(
+                        arrived.wait(), max(0, min(quiet, remaining))
+                    )
+                except asyncio.TimeoutError:
+                    if quiet <= remaining:
+                        return patches
+                    raise
+        finally:
+            self.unsubscribe(subscription)
+
     async def receive_patch(self, update: bool = True) -> List[Patch]:
         """
         Helper method to wait for a patch message from the daemon.
 
         :param update: Whether or not to update the status and mixers attributes
-                       after receiving the patch.
+                       after receiving the patch. Patches are applied to the
+                       local status as they arrive, so this only fetches the
+                       whole status if ``apply_patches`` is disabled.
 
         :return: The patch from the daemon.
         """
 
         patches = await Socket.receive_patch(self)
 
-        if update:
+        if update and not self.apply_patches:
             await self.update()
 
         return patches
@@ -261,12 +974,83 @@ class GoXLR(Socket, DaemonCommands, GoXLRCommands, StatusCommands):
         :raises DaemonError: If no mixers are found.
         """
         connected = await super().open()
-        if connected:
-            await self.update()
-            self.select_mixer()  # select the first mixer by default
+        if not connected:
+            return connected
+
+        if self.status_cache and self.__load_cached_status():
+            # serve the cached status while the live one is fetched
+            self.ready_task = asyncio.create_task(self.__first_update())
+        elif self.background_update:
+            self.status = self.mixer = _NotReady()
+            self.ready_task = asyncio.create_task(self.__first_update())
+        else:
+            await self.__first_update()
 
         return connected
 
+    async def __first_update(self):
+        await self.update()
+
+        # the given mixer, or the first one by default
+        self.select_mixer(self.serial)
+        self.__save_cached_status()
+
+    def __load_cached_status(self) -> bool:
+        raw = load_status(
+            cache_path(self.status_cache, self.host, self.port), self.codec
+        )
+        if not raw:
+            return False
+
+        self.__use_status(Status(raw, lazy=self.lazy, keep_raw=True))
+        try:
+            self.select_mixer(self.serial)
+        except (DaemonError, MixerNotFoundError):
+            # not the mixers we want, wait for the live status instead
+            self.status = self.mixer = None
+            return False
+
+        self.status_stale = True
+        return True
+
+    def __save_cached_status(self):
+        if not (self.status_cache and self.status and not self.status_stale):
+            return
+
+        try:
+            save_status(
+                cache_path(self.status_cache, self.host, self.port),
+                self.status.raw,
+                self.codec,
+            )
+        except OSError:
+            pass  # the cache only makes starting faster
+
+    async def ready(self) -> Status:
+        """
+        Waits for the status to be fetched, when `open()` fetches it in the
+        background (see ``background_update`` and ``status_cache``). Returns
+        at once otherwise.
+
+        :return: The status of the daemon.
+
+        :raises DaemonError: If no mixers are found.
+        :raises MixerNotFoundError: If the specified mixer is not found.
+        """
+        if self.ready_task:
+            await asyncio.shield(self.ready_task)
+
+        return self.status
+
+    async def close(self):
+        if self.ready_task and not self.ready_task.done():
+            self.ready_task.cancel()
+
+        # keep the status as patched since it was fetched
+        self.__save_cached_status()
+
+        return await super().close()
+
     async def connect(self):
         """
         Alias for `open()`.
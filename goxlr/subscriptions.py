@@ -0,0 +1,208 @@
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Set, Tuple
+
+from .patch import parse_pointer
+from .types.enums import OverflowPolicy, PatchOperation
+from .types.models import Patch
+
+
+class Subscription:
+    """
+    A callback subscribed to the patches matching a path pattern. Each
+    subscription has its own queue and task, so a slow callback only holds
+    up its own patches. Created by `GoXLR.subscribe()`.
+
+    :param pattern: The JSON pointer pattern, see `GoXLR.subscribe()`.
+    :param callback: Called with each matching `Patch`, may be a coroutine
+                     function.
+    :param maxsize: The maximum number of patches to queue.
+    :param overflow: What to do with a new patch while the queue is full,
+                     `OverflowPolicy.DropOldest` or `OverflowPolicy.DropNewest`.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        callback: Callable[[Patch], Any],
+        maxsize: int = 1024,
+        overflow: OverflowPolicy = OverflowPolicy.DropOldest,
+    ):
+        if overflow == OverflowPolicy.Raise:
+            raise ValueError("subscriptions can only drop patches on overflow")
+
+        self.pattern = pattern
+        self.tokens = tuple(parse_pointer(pattern))
+        if "**" in self.tokens[:-1]:
+            raise ValueError(f"** can only end a pattern: {pattern}")
+        self.callback = callback
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.queue: Deque[Patch] = deque()
+        self.wakeup = asyncio.Event()
+        self.task: asyncio.Task = None
+        self.dropped = 0  # patches lost to overflow
+        self.cancelled = False
+
+    def put(self, patch: Patch):
+        """
+        Queues a patch for the callback. Never blocks.
+        """
+        if self.cancelled:
+            return
+
+        if len(self.queue) >= self.maxsize:
+            self.dropped += 1
+            if self.overflow == OverflowPolicy.DropNewest:
+                return
+            self.queue.popleft()
+
+        self.queue.append(patch)
+        self.wakeup.set()
+
+        if not self.task:
+            self.task = asyncio.create_task(self.__run())
+
+    def cancel(self):
+        """
+        Stops calling the callback. Queued patches are discarded.
+        """
+        self.cancelled = True
+        self.queue.clear()
+        if self.task:
+            self.task.cancel()
+
+    async def __run(self):
+        while True:
+            while not self.queue:
+                self.wakeup.clear()
+                await self.wakeup.wait()
+
+            patch = self.queue.popleft()
+            try:
+                result = self.callback(patch)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                asyncio.get_running_loop().call_exception_handler(
+                    {
+                        "message": f"Subscriber to {self.pattern} failed",
+                        "exception": e,
+                    }
+                )
+
+
+class _Node:
+    __slots__ = ("children", "wildcard", "subscriptions", "deep")
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = {}
+        self.wildcard: _Node = None  # "*", any one key
+        self.subscriptions: Set[Subscription] = set()  # the pattern ends here
+        self.deep: Set[Subscription] = set()  # "**", anything below here
+
+
+class PatternTrie:
+    """
+    Subscriptions stored by their path pattern, so that finding the ones a
+    patch matches takes one walk down the path instead of testing every
+    pattern.
+    """
+
+    def __init__(self):
+        self.root = _Node()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __node(self, tokens: Tuple[str, ...], create: bool) -> Tuple[_Node, bool]:
+        node = self.root
+        for token in tokens[:-1] if tokens and tokens[-1] == "**" else tokens:
+            if token == "*":
+                if not node.wildcard:
+                    if not create:
+                        return None, False
+                    node.wildcard = _Node()
+                node = node.wildcard
+            else:
+                if token not in node.children:
+                    if not create:
+                        return None, False
+                    node.children[token] = _Node()
+                node = node.children[token]
+
+        return node, bool(tokens) and tokens[-1] == "**"
+
+    def add(self, subscription: Subscription):
+        node, deep = self.__node(subscription.tokens, create=True)
+        (node.deep if deep else node.subscriptions).add(subscription)
+        self.count += 1
+
+    def remove(self, subscription: Subscription):
+        node, deep = self.__node(subscription.tokens, create=False)
+        if node:
+            bucket = node.deep if deep else node.subscriptions
+            if subscription in bucket:
+                bucket.remove(subscription)
+                self.count -= 1
+
+    def match(self, path: str) -> Set[Subscription]:
+        """
+        Finds the subscriptions whose pattern matches a path, or lies below
+        it, since replacing a value replaces everything below it too.
+        """
+        matches = set()
+        nodes = [self.root]
+
+        for token in parse_pointer(path):
+            following = []
+            for node in nodes:
+                matches |= node.deep
+                if child := node.children.get(token):
+                    following.append(child)
+                if node.wildcard:
+                    following.append(node.wildcard)
+            if not (nodes := following):
+                return matches
+
+        stack = nodes
+        while stack:
+            node = stack.pop()
+            matches |= node.subscriptions
+            matches |= node.deep
+            stack.extend(node.children.values())
+            if node.wildcard:
+                stack.append(node.wildcard)
+
+        return matches
+
+
+class Subscriptions:
+    """
+    Hands patches from the daemon to the subscriptions they match.
+    """
+
+    def __init__(self):
+        self.trie = PatternTrie()
+
+    def __len__(self):
+        return len(self.trie)
+
+    def add(self, subscription: Subscription) -> Subscription:
+        self.trie.add(subscription)
+        return subscription
+
+    def remove(self, subscription: Subscription):
+        subscription.cancel()
+        self.trie.remove(subscription)
+
+    def dispatch(self, patches: List[Patch]):
+        for patch in patches:
+            matches = self.trie.match(patch.path)
+            if patch.operation == PatchOperation.Move:
+                matches |= self.trie.match(patch.from_path)
+
+            for subscription in matches:
+                subscription.put(patch)
@@ -604,3 +604,27 @@ class PatchOperation(Enum):
     Copy = 4
     Move = 5
     Test = 6
+
+
+class CommandPriority(Enum):
+    # Outbound lanes, lower values are always sent first.
+    Mute = 1
+    Audio = 2
+    Lighting = 3
+
+
+class OverflowPolicy(Enum):
+    # What an event stream does with new events while its buffer is full.
+    DropOldest = 1
+    DropNewest = 2
+    Raise = 3
+
+
+class SceneSection(Enum):
+    # The parts of a mixer a scene can capture, see GoXLR.capture_scene().
+    FaderStatus = 1
+    Levels = 2
+    Router = 3
+    MicStatus = 4
+    Lighting = 5
+    Effects = 6
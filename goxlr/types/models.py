@@ -1,14 +1,154 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 from .enums import *
 
+# --------------------------------------------------
+# Lazy models
+# --------------------------------------------------
+
+
+class LazyField:
+    """
+    A model attribute that is built from a key of the model's raw dict the
+    first time it is accessed, and cached on the instance until the model is
+    invalidated.
+
+    :param key: The key of the raw dict the attribute is built from.
+    :param build: Called with the raw value to build the attribute. If not
+                  specified, the raw value is used as is.
+    :param derived: Whether the attribute is an index built from the rest
+                    of the model, in which case ``build`` is called with the
+                    model. Derived attributes are only built when accessed,
+                    never by `LazyModel.materialise()`, and are forgotten
+                    along with ``key``.
+    """
+
+    def __init__(
+        self, key: str, build: Callable[[Any], Any] = None, derived: bool = False
+    ):
+        self.key = key
+        self.build = build
+        self.derived = derived
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        if self.derived:
+            value = self.build(instance)
+        else:
+            value = instance.raw.get(self.key)
+            if self.build:
+                value = self.build(value)
+
+        # cached in the instance dict, which takes precedence over this
+        # descriptor, so later accesses are plain attribute lookups
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyModel:
+    """
+    Base class for models that keep their raw dict and build their
+    attributes (see `LazyField`) on first access.
+    """
+
+    lazy_fields: Dict[str, LazyField] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.lazy_fields = {
+            name: attr
+            for klass in reversed(cls.__mro__)
+            for name, attr in vars(klass).items()
+            if isinstance(attr, LazyField)
+        }
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+
+    def materialise(self):
+        """
+        Builds every attribute of this model and of the lazy models inside
+        it, as if the whole tree had been built eagerly.
+        """
+        if self.raw is None:
+            return
+
+        for name, field in self.lazy_fields.items():
+            if field.derived:
+                continue
+
+            value = getattr(self, name)
+            for child in value.values() if isinstance(value, dict) else (value,):
+                if isinstance(child, LazyModel):
+                    child.materialise()
+
+    def detach(self):
+        """
+        Builds every attribute, as `materialise()` does, then lets go of the
+        raw dicts of this model and of the lazy models inside it, so a
+        snapshot kept around only holds on to the model tree. A detached
+        model can't be patched or invalidated. Derived attributes can still
+        be accessed, as they are built from the model.
+        """
+        self.materialise()
+
+        for name in self.lazy_fields:
+            value = self.__dict__.get(name)
+            for child in value.values() if isinstance(value, dict) else (value,):
+                if isinstance(child, LazyModel):
+                    child.detach()
+
+        self.raw = None
+
+    def invalidate(self, tokens: List[str] = None):
+        """
+        Forgets the cached attributes that a change in the raw dict affects,
+        so they are built again on their next access. A change deep inside a
+        lazy child model only invalidates that part of the child.
+
+        :param tokens: The path of the change, relative to this model's raw
+                       dict, e.g. ``["buttons", "Bleep", "colours"]``. If not
+                       specified, every attribute is forgotten.
+        """
+        if not tokens:
+            for name in self.lazy_fields:
+                self.__dict__.pop(name, None)
+            return
+
+        key, *rest = tokens
+        raw = self.raw.get(key) if self.raw else None
+
+        for name, field in self.lazy_fields.items():
+            if field.key != key or name not in self.__dict__:
+                continue
+
+            value = self.__dict__[name]
+            if rest and isinstance(value, LazyModel) and value.raw is raw:
+                value.invalidate(rest)
+                continue
+
+            # e.g. Status.mixers, a dict of lazy models keyed by raw key
+            if len(rest) > 1 and isinstance(value, dict):
+                child = value.get(rest[0])
+                if isinstance(child, LazyModel) and child.raw is raw.get(rest[0]):
+                    child.invalidate(rest[1:])
+                    continue
+
+            del self.__dict__[name]
+
+
 # --------------------------------------------------
 # Config
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HttpSettings:
     enabled: bool
     bind_address: str
@@ -22,7 +162,7 @@ class HttpSettings:
         self.port = http_settings.get("port")
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     http_settings: HttpSettings
     daemon_version: str
@@ -47,7 +187,7 @@ class Config:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerVersions:
     firmware: List[int]
     fpga_count: int
@@ -59,7 +199,7 @@ class MixerVersions:
         self.dice = mixer_version.get("dice")
 
 
-@dataclass
+@dataclass(slots=True)
 class USBDevice:
     manufacturer_name: str
     product_name: str
@@ -77,7 +217,7 @@ class USBDevice:
         self.identifier = usb_device.get("identifier")
 
 
-@dataclass
+@dataclass(slots=True)
 class HardwareInfo:
     versions: MixerVersions
     serial_number: str
@@ -100,7 +240,7 @@ class HardwareInfo:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Scribble:
     file_name: str
     bottom_text: str
@@ -115,7 +255,7 @@ class Scribble:
             self.inverted = scribble.get("inverted")
 
 
-@dataclass
+@dataclass(slots=True)
 class FaderStatus:
     channel: Channel
     mute_type: MuteFunction
@@ -134,7 +274,7 @@ class FaderStatus:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Equaliser:
     gain: Dict[EqFrequency, int]
     frequency: Dict[EqFrequency, float]
@@ -146,7 +286,7 @@ class Equaliser:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EqMini(Equaliser):
     gain: Dict[MiniEqFrequency, int]
     frequency: Dict[MiniEqFrequency, float]
@@ -158,7 +298,7 @@ class EqMini(Equaliser):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class NoiseGate:
     threshold: int
     attack: int
@@ -174,7 +314,7 @@ class NoiseGate:
         self.attenuation = noise_gate.get("attenuation")
 
 
-@dataclass
+@dataclass(slots=True)
 class Compressor:
     threshold: int
     ratio: int
@@ -190,28 +330,20 @@ class Compressor:
         self.makeup_gain = compressor.get("makeup_gain")
 
 
-@dataclass
-class MicStatus:
-    mic_type: MicrophoneType
-    mic_gains: Dict[MicrophoneType, int]
-    equaliser: Equaliser
-    equaliser_mini: EqMini
-    noise_gate: NoiseGate
-    compressor: Compressor
-
-    def __init__(self, mic_status: dict):
-        self.mic_type = MicrophoneType[mic_status.get("mic_type")]
+@dataclass(init=False)
+class MicStatus(LazyModel):
+    mic_type: MicrophoneType = LazyField("mic_type", lambda v: MicrophoneType[v])
 
-        # example: {"Dynamic": 30, "Condenser": 40, "Jack": 30}
-        self.mic_gains = {
-            MicrophoneType[k]: v for k, v in mic_status.get("mic_gains").items()
-        }
+    # example: {"Dynamic": 30, "Condenser": 40, "Jack": 30}
+    mic_gains: Dict[MicrophoneType, int] = LazyField(
+        "mic_gains", lambda gains: {MicrophoneType[k]: v for k, v in gains.items()}
+    )
 
-        self.equaliser = Equaliser(mic_status.get("equaliser"))
-        self.equaliser_mini = EqMini(mic_status.get("equaliser_mini"))
+    equaliser: Equaliser = LazyField("equaliser", Equaliser)
+    equaliser_mini: EqMini = LazyField("equaliser_mini", EqMini)
 
-        self.noise_gate = NoiseGate(mic_status.get("noise_gate"))
-        self.compressor = Compressor(mic_status.get("compressor"))
+    noise_gate: NoiseGate = LazyField("noise_gate", NoiseGate)
+    compressor: Compressor = LazyField("compressor", Compressor)
 
 
 # --------------------------------------------------
@@ -219,7 +351,7 @@ class MicStatus:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Submix:
     volume: int
     linked: bool
@@ -231,7 +363,7 @@ class Submix:
         self.ratio = submix.get("ratio")
 
 
-@dataclass
+@dataclass(slots=True)
 class Submixes:
     inputs: Dict[SubMixChannel, Submix]
     outputs: Dict[OutputDevice, Mix]
@@ -245,7 +377,7 @@ class Submixes:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Levels:
     submix_supported: bool
     output_monitor: OutputDevice
@@ -259,23 +391,71 @@ class Levels:
         self.output_monitor = OutputDevice[levels.get("output_monitor")]
         self.volumes = {Channel[k]: v for k, v in levels.get("volumes").items()}
         if submix := levels.get("submix"):
-            self.submix = {Channel[k]: v for k, v in submix.items()}
+            self.submix = Submixes(submix)
         else:
             self.submix = None
         self.bleep = levels.get("bleep")
         self.deess = levels.get("deess")
 
 
+# --------------------------------------------------
+# Mixer - Router
+# --------------------------------------------------
+
+
+@dataclass(slots=True)
+class RoutingIndex:
+    outputs: Dict[InputDevice, Set[OutputDevice]]  # what each input feeds
+    inputs: Dict[OutputDevice, Set[InputDevice]]  # what feeds each output
+
+    def __init__(self, router: Dict[InputDevice, Dict[OutputDevice, bool]]):
+        self.outputs = {input: set() for input in InputDevice}
+        self.inputs = {output: set() for output in OutputDevice}
+
+        for input, outputs in router.items():
+            for output, enabled in outputs.items():
+                self.set(input, output, enabled)
+
+    def set(self, input: InputDevice, output: OutputDevice, enabled: bool):
+        if enabled:
+            self.outputs[input].add(output)
+            self.inputs[output].add(input)
+        else:
+            self.outputs[input].discard(output)
+            self.inputs[output].discard(input)
+
+    def update(self, tokens: List[str], router: dict):
+        """
+        Brings the index up to date after a change to the raw router.
+
+        :param tokens: The path of the change, relative to the router, e.g.
+                       ``["Microphone", "Headphones"]``. Empty if the whole
+                       router changed.
+        :param router: The raw router after the change.
+        """
+        router = router or {}
+        inputs = [tokens[0]] if tokens else InputDevice.__members__
+
+        for name in inputs:
+            # skip devices this version of the library doesn't know
+            if (input := InputDevice.__members__.get(name)) is None:
+                continue
+            outputs = router.get(name) or {}
+            for output in [tokens[1]] if len(tokens) > 1 else OutputDevice.__members__:
+                if output in OutputDevice.__members__:
+                    self.set(input, OutputDevice[output], outputs.get(output))
+
+
 # --------------------------------------------------
 # Mixer - Cough Button
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class CoughButton:
     is_toggle: bool
     mute_type: MuteFunction
-    state: MuteState
+    mute_state: MuteState
 
     def __init__(self, cough_button: dict):
         self.is_toggle = cough_button.get("is_toggle")
@@ -288,7 +468,7 @@ class CoughButton:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Animation:
     supported: bool
     mode: AnimationMode
@@ -314,7 +494,7 @@ class Animation:
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Colours:
     """
     Store up to three colours for a lighting style.
@@ -337,7 +517,7 @@ class Colours:
             self.colour_three = colour1.get("colour_three")
 
 
-@dataclass
+@dataclass(slots=True)
 class FaderLighting:
     style: FaderDisplayStyle
     colours: Colours
@@ -347,7 +527,7 @@ class FaderLighting:
         self.colours = Colours(lighting.get("colours"))
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonLighting:
     off_style: ButtonColourOffStyle
     colours: Colours
@@ -357,33 +537,30 @@ class ButtonLighting:
         self.colours = Colours(lighting.get("colours"))
 
 
-@dataclass
-class Lighting:
-    animation: Animation
-    faders: Dict[Fader, FaderLighting]
-    buttons: Dict[Button, ButtonLighting]
-    simple: Dict[SimpleColourTarget, Colours]
-    sampler: Dict[SamplerColourTarget, ButtonLighting]
-    encoders: Dict[Encoder, Colours]
-
-    def __init__(self, lighting: dict):
-        self.animation = Animation(lighting.get("animation"))
-        self.faders = {
-            Fader[k]: FaderLighting(v) for k, v in lighting.get("faders").items()
-        }
-        self.buttons = {
-            Button[k]: ButtonLighting(v) for k, v in lighting.get("buttons").items()
-        }
-        self.simple = {
-            SimpleColourTarget[k]: Colours(v) for k, v in lighting.get("simple").items()
-        }
-        self.sampler = {
-            SamplerColourTarget[k]: ButtonLighting(v)
-            for k, v in lighting.get("sampler").items()
-        }
-        self.encoders = {
-            Encoder[k]: Colours(v) for k, v in lighting.get("encoders").items()
-        }
+@dataclass(init=False)
+class Lighting(LazyModel):
+    animation: Animation = LazyField("animation", Animation)
+    faders: Dict[Fader, FaderLighting] = LazyField(
+        "faders", lambda faders: {Fader[k]: FaderLighting(v) for k, v in faders.items()}
+    )
+    buttons: Dict[Button, ButtonLighting] = LazyField(
+        "buttons",
+        lambda buttons: {Button[k]: ButtonLighting(v) for k, v in buttons.items()},
+    )
+    simple: Dict[SimpleColourTarget, Colours] = LazyField(
+        "simple",
+        lambda simple: {SimpleColourTarget[k]: Colours(v) for k, v in simple.items()},
+    )
+    sampler: Dict[SamplerColourTarget, ButtonLighting] = LazyField(
+        "sampler",
+        lambda sampler: {
+            SamplerColourTarget[k]: ButtonLighting(v) for k, v in sampler.items()
+        },
+    )
+    encoders: Dict[Encoder, Colours] = LazyField(
+        "encoders",
+        lambda encoders: {Encoder[k]: Colours(v) for k, v in encoders.items()},
+    )
 
 
 # --------------------------------------------------
@@ -391,7 +568,7 @@ class Lighting:
 # --------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Reverb:
     style: ReverbStyle
     amount: int
@@ -421,7 +598,7 @@ class Reverb:
         self.mod_depth = reverb.get("mod_depth")
 
 
-@dataclass
+@dataclass(slots=True)
 class Echo:
     style: EchoStyle
     amount: int
@@ -447,7 +624,7 @@ class Echo:
         self.feedback_xfb_r_to_l = echo.get("feedback_xfb_r_to_l")
 
 
-@dataclass
+@dataclass(slots=True)
 class Pitch:
     style: PitchStyle
     amount: int
@@ -459,7 +636,7 @@ class Pitch:
         self.character = pitch.get("character")
 
 
-@dataclass
+@dataclass(slots=True)
 class Gender:
     style: GenderStyle
     amount: int
@@ -469,7 +646,7 @@ class Gender:
         self.amount = gender.get("amount")
 
 
-@dataclass
+@dataclass(slots=True)
 class Megaphone:
     is_enabled: bool
     style: MegaphoneStyle
@@ -483,7 +660,7 @@ class Megaphone:
         self.post_gain = megaphone.get("post_gain")
 
 
-@dataclass
+@dataclass(slots=True)
 class Robot:
     is_enabled: bool
     style: RobotStyle
@@ -519,7 +696,7 @@ class Robot:
         self.dry_mix = robot.get("dry_mix")
 
 
-@dataclass
+@dataclass(slots=True)
 class HardTune:
     is_enabled: bool
     style: HardTuneStyle
@@ -537,39 +714,26 @@ class HardTune:
         self.source = HardTuneSource[hard_tune.get("source")]
 
 
-@dataclass
-class CurrentEffects:
-    reverb: Reverb
-    echo: Echo
-    pitch: Pitch
-    gender: Gender
-    megaphone: Megaphone
-    robot: Robot
-    hard_tune: HardTune
-
-    def __init__(self, effects: dict):
-        self.reverb = Reverb(effects.get("reverb"))
-        self.echo = Echo(effects.get("echo"))
-        self.pitch = Pitch(effects.get("pitch"))
-        self.gender = Gender(effects.get("gender"))
-        self.megaphone = Megaphone(effects.get("megaphone"))
-        self.robot = Robot(effects.get("robot"))
-        self.hard_tune = HardTune(effects.get("hard_tune"))
-
-
-@dataclass
-class Effects:
-    is_enabled: bool
-    active_preset: EffectBankPreset
-    preset_names: Dict[EffectBankPreset, str]
-    current: CurrentEffects
+@dataclass(init=False)
+class CurrentEffects(LazyModel):
+    reverb: Reverb = LazyField("reverb", Reverb)
+    echo: Echo = LazyField("echo", Echo)
+    pitch: Pitch = LazyField("pitch", Pitch)
+    gender: Gender = LazyField("gender", Gender)
+    megaphone: Megaphone = LazyField("megaphone", Megaphone)
+    robot: Robot = LazyField("robot", Robot)
+    hard_tune: HardTune = LazyField("hard_tune", HardTune)
+
 
-    def __init__(self, effects: dict):
-        if effects:  # GoXLR Minis don't have effects
-            self.is_enabled = effects.get("is_enabled")
-            self.active_preset = EffectBankPreset[effects.get("active_preset")]
-            self.preset_names = effects.get("preset_names")
-            self.current = CurrentEffects(effects.get("current"))
+@dataclass(init=False)
+class Effects(LazyModel):
+    # GoXLR Minis don't have effects, the raw dict is None for them
+    is_enabled: bool = LazyField("is_enabled")
+    active_preset: EffectBankPreset = LazyField(
+        "active_preset", lambda v: EffectBankPreset[v]
+    )
+    preset_names: Dict[EffectBankPreset, str] = LazyField("preset_names")
+    current: CurrentEffects = LazyField("current", CurrentEffects)
 
 
 # -------------------------------------------------------
@@ -577,7 +741,7 @@ class Effects:
 # -------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Sample:
     name: str
     start_pct: float
@@ -589,7 +753,7 @@ class Sample:
         self.stop_pct = sample.get("stop_pct")
 
 
-@dataclass
+@dataclass(slots=True)
 class SampleMetadata:
     function: SamplePlaybackMode
     order: SamplePlayOrder
@@ -605,7 +769,7 @@ class SampleMetadata:
         self.is_recording = sample_button.get("is_recording")
 
 
-@dataclass
+@dataclass(slots=True)
 class SamplerProcessState:
     progress: Optional[int]
     last_error: Optional[str]
@@ -615,21 +779,25 @@ class SamplerProcessState:
         self.last_error = process_state.get("last_error")
 
 
-@dataclass
-class Sampler:
-    processing_state: SamplerProcessState
-    active_bank: SampleBank
-    clear_active: bool
-    record_buffer: int
-    banks: Dict[SampleBank, Dict[SampleButton, SampleMetadata]]
-
-    def __init__(self, sampler: dict):
-        if sampler:  # GoXLR Minis don't have a sampler
-            self.processing_state = SamplerProcessState(sampler.get("processing_state"))
-            self.active_bank = SampleBank[sampler.get("active_bank")]
-            self.clear_active = sampler.get("clear_active")
-            self.record_buffer = sampler.get("record_buffer")
-            self.banks = sampler.get("banks")
+@dataclass(init=False)
+class Sampler(LazyModel):
+    # GoXLR Minis don't have a sampler, the raw dict is None for them
+    processing_state: SamplerProcessState = LazyField(
+        "processing_state", SamplerProcessState
+    )
+    active_bank: SampleBank = LazyField("active_bank", lambda v: SampleBank[v])
+    clear_active: bool = LazyField("clear_active")
+    record_buffer: int = LazyField("record_buffer")
+    banks: Dict[SampleBank, Dict[SampleButton, SampleMetadata]] = LazyField(
+        "banks",
+        lambda banks: {
+            SampleBank[bank]: {
+                SampleButton[button]: SampleMetadata(metadata)
+                for button, metadata in buttons.items()
+            }
+            for bank, buttons in banks.items()
+        },
+    )
 
 
 # -------------------------------------------------------
@@ -637,7 +805,7 @@ class Sampler:
 # -------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class DisplaySettings:
     gate: DisplayMode
     compressor: DisplayMode
@@ -651,7 +819,7 @@ class DisplaySettings:
         self.equaliser_fine = DisplayMode[display.get("equaliser_fine")]
 
 
-@dataclass
+@dataclass(slots=True)
 class MixerSettings:
     display: DisplaySettings
     mute_hold_duration: int
@@ -668,47 +836,57 @@ class MixerSettings:
 # -------------------------------------------------------
 
 
-@dataclass
-class Mixer:
-    hardware: HardwareInfo
-    shutdown_commands: List[Dict[str, List[str] | str]]
-    fader_status: Dict[Fader, FaderStatus]
-    mic_status: MicStatus
-    levels: Levels
-    router: Dict[InputDevice, Dict[OutputDevice, bool]]
-    cough_button: CoughButton
-    lighting: Lighting
-    effects: Effects
-    sampler: Sampler
-    settings: MixerSettings
-    button_down: Dict[Button, bool]
-    profile_name: str
-    mic_profile_name: str
-
-    def __init__(self, mixer: dict):
-        self.hardware = HardwareInfo(mixer.get("hardware"))
-        self.shutdown_commands = mixer.get("shutdown_commands")
-        self.fader_status = {
-            Fader[fader]: FaderStatus(status)
-            for fader, status in mixer.get("fader_status").items()
-        }
-        self.mic_status = MicStatus(mixer.get("mic_status"))
-        self.levels = Levels(mixer.get("levels"))
-        self.router = {
-            InputDevice[k]: {OutputDevice[k]: v for k, v in v.items()}
-            for k, v in mixer.get("router").items()
-        }
-        self.cough_button = CoughButton(mixer.get("cough_button"))
-        self.lighting = Lighting(mixer.get("lighting"))
-        self.effects = Effects(mixer.get("effects"))
-        self.sampler = Sampler(mixer.get("sampler"))
-        self.settings = MixerSettings(mixer.get("settings"))
-        self.button_down = {
-            Button[button]: bool(down)
-            for button, down in mixer.get("button_down").items()
-        }
-        self.profile_name = mixer.get("profile_name")
-        self.mic_profile_name = mixer.get("mic_profile_name")
+@dataclass(init=False)
+class Mixer(LazyModel):
+    hardware: HardwareInfo = LazyField("hardware", HardwareInfo)
+    shutdown_commands: List[Dict[str, List[str] | str]] = LazyField("shutdown_commands")
+    fader_status: Dict[Fader, FaderStatus] = LazyField(
+        "fader_status",
+        lambda faders: {
+            Fader[fader]: FaderStatus(status) for fader, status in faders.items()
+        },
+    )
+    mic_status: MicStatus = LazyField("mic_status", MicStatus)
+    levels: Levels = LazyField("levels", Levels)
+    router: Dict[InputDevice, Dict[OutputDevice, bool]] = LazyField(
+        "router",
+        # skipping devices this version of the library doesn't know
+        lambda router: {
+            InputDevice[k]: {
+                OutputDevice[k]: v
+                for k, v in v.items()
+                if k in OutputDevice.__members__
+            }
+            for k, v in router.items()
+            if k in InputDevice.__members__
+        },
+    )
+    # built on first use, so snapshots that never look it up don't pay for it
+    routing: RoutingIndex = LazyField(
+        "router", lambda mixer: RoutingIndex(mixer.router), derived=True
+    )
+    cough_button: CoughButton = LazyField("cough_button", CoughButton)
+    lighting: Lighting = LazyField("lighting", Lighting)
+    effects: Effects = LazyField("effects", Effects)
+    sampler: Sampler = LazyField("sampler", Sampler)
+    settings: MixerSettings = LazyField("settings", MixerSettings)
+    button_down: Dict[Button, bool] = LazyField(
+        "button_down",
+        lambda buttons: {
+            Button[button]: bool(down) for button, down in buttons.items()
+        },
+    )
+    profile_name: str = LazyField("profile_name")
+    mic_profile_name: str = LazyField("mic_profile_name")
+
+    def invalidate(self, tokens: List[str] = None):
+        routing = self.__dict__.get("routing")
+        super().invalidate(tokens)
+
+        # the routing index is kept up to date instead of built again
+        if routing and tokens and tokens[0] == "router":
+            routing.update(tokens[1:], self.raw.get("router"))
+            self.__dict__["routing"] = routing
 
 
 # -------------------------------------------------------
@@ -716,7 +894,7 @@ class Mixer:
 # -------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Paths:
     profiles: str
     mic_profiles: str
@@ -739,7 +917,7 @@ class Paths:
 # -------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Files:
     profiles: List[str]
     mic_profiles: List[str]
@@ -760,20 +938,36 @@ class Files:
 # -------------------------------------------------------
 
 
-@dataclass
-class Status:
-    config: Config
-    mixers: Dict[str, Mixer]
-    paths: Paths
-    files: Files
+@dataclass(init=False)
+class Status(LazyModel):
+    """
+    The status of the daemon and every mixer connected to it.
+
+    :param status: The raw status, as returned by the daemon.
+    :param lazy: Whether to build each part of the model tree the first time
+                 it is accessed instead of building the whole tree now.
+    :param keep_raw: Whether to keep the raw status, which patches are
+                     applied to (see `goxlr.patch.apply_to_status`). If not,
+                     the status is a read-only snapshot that only holds on
+                     to the model tree, see `LazyModel.detach()`. Always kept
+                     when ``lazy`` is enabled, since the tree is built from
+                     it.
+    """
+
+    config: Config = LazyField("config", Config)
+    mixers: Dict[str, Mixer] = LazyField(
+        "mixers", lambda mixers: {serial: Mixer(m) for serial, m in mixers.items()}
+    )
+    paths: Paths = LazyField("paths", Paths)
+    files: Files = LazyField("files", Files)
+
+    def __init__(self, status: dict, lazy: bool = False, keep_raw: bool = False):
+        super().__init__(status)
 
-    def __init__(self, status: dict):
-        self.config = Config(status.get("config"))
-        self.mixers = {
-            serial: Mixer(mixer) for serial, mixer in status.get("mixers").items()
-        }
-        self.paths = Paths(status.get("paths"))
-        self.files = Files(status.get("files"))
+        if not lazy and not keep_raw:
+            self.detach()
+        elif not lazy:
+            self.materialise()
 
 
 # -------------------------------------------------------
@@ -781,13 +975,15 @@ class Status:
 # -------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Patch:
     operation: PatchOperation
     path: str
     value: Any
+    from_path: Optional[str]
 
     def __init__(self, patch: dict):
         self.operation = PatchOperation[patch.get("op").title()]
         self.path = patch.get("path")
         self.value = patch.get("value")
+        self.from_path = patch.get("from")  # only for move and copy
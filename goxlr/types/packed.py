@@ -0,0 +1,190 @@
+from array import array
+from typing import Dict, List
+
+from .enums import Button, Channel, InputDevice, OutputDevice, PatchOperation
+from .models import Patch
+
+# Bit positions follow the enum order, e.g. Button.Fader1Mute is bit 0.
+BUTTON_BITS: Dict[str, int] = {b.name: 1 << i for i, b in enumerate(Button)}
+ALL_BUTTONS = (1 << len(Button)) - 1
+
+INPUT_INDEX: Dict[str, int] = {d.name: i for i, d in enumerate(InputDevice)}
+OUTPUT_INDEX: Dict[str, int] = {d.name: i for i, d in enumerate(OutputDevice)}
+OUTPUTS = len(OutputDevice)
+ROUTE_ROW = (1 << OUTPUTS) - 1
+
+CHANNEL_INDEX: Dict[str, int] = {c.name: i for i, c in enumerate(Channel)}
+
+
+def button_mask(*buttons: Button) -> int:
+    """
+    :return: The bitmask of the given buttons, for `PackedState` queries.
+    """
+    mask = 0
+    for button in buttons:
+        mask |= BUTTON_BITS[button.name]
+    return mask
+
+
+def route_bit(input: InputDevice, output: OutputDevice) -> int:
+    """
+    :return: The bit of a route in `PackedState.routing`.
+    """
+    return 1 << (INPUT_INDEX[input.name] * OUTPUTS + OUTPUT_INDEX[output.name])
+
+
+class PackedState:
+    """
+    A compact copy of a mixer's button, routing and volume state, for
+    checking them cheaply and often, e.g. on every event.
+
+    - ``buttons`` is an int with a bit set for each button that is down,
+      see `button_mask`.
+    - ``changed`` has a bit set for each button that changed in the last
+      update.
+    - ``routing`` is an `InputDevice` by `OutputDevice` bit matrix, one row
+      of ``len(OutputDevice)`` bits per input, see `route_bit`.
+    - ``volumes`` is an array of volumes in `Channel` order.
+
+    :param mixer: The raw mixer dict from the status to load.
+    """
+
+    __slots__ = ("buttons", "changed", "routing", "volumes")
+
+    def __init__(self, mixer: dict = None):
+        self.buttons = 0
+        self.changed = 0
+        self.routing = 0
+        self.volumes = array("B", bytes(len(Channel)))
+
+        if mixer:
+            self.load(mixer)
+
+    def load(self, mixer: dict):
+        """
+        Loads the state from a raw mixer dict.
+        """
+        self.__load_buttons(mixer.get("button_down") or {})
+        self.__load_router(mixer.get("router") or {})
+        self.__load_volumes(mixer.get("levels", {}).get("volumes") or {})
+
+    def __load_buttons(self, buttons: dict):
+        previous = self.buttons
+        self.buttons = 0
+        for name, down in buttons.items():
+            if down and name in BUTTON_BITS:
+                self.buttons |= BUTTON_BITS[name]
+        self.changed |= previous ^ self.buttons
+
+    def __set_button(self, name: str, down: bool):
+        if bit := BUTTON_BITS.get(name):
+            if bool(self.buttons & bit) != bool(down):
+                self.buttons ^= bit
+                self.changed |= bit
+
+    def __load_router(self, router: dict):
+        for input, outputs in router.items():
+            self.__load_route_row(input, outputs or {})
+
+    def __load_route_row(self, input: str, outputs: dict):
+        if (row := INPUT_INDEX.get(input)) is None:
+            return
+        self.routing &= ~(ROUTE_ROW << (row * OUTPUTS))
+        for output, enabled in outputs.items():
+            self.__set_route(input, output, enabled)
+
+    def __set_route(self, input: str, output: str, enabled: bool):
+        row, column = INPUT_INDEX.get(input), OUTPUT_INDEX.get(output)
+        if row is None or column is None:
+            return
+        bit = 1 << (row * OUTPUTS + column)
+        self.routing = self.routing | bit if enabled else self.routing & ~bit
+
+    def __load_volumes(self, volumes: dict):
+        for channel, volume in volumes.items():
+            self.__set_volume(channel, volume)
+
+    def __set_volume(self, channel: str, volume: int):
+        if (index := CHANNEL_INDEX.get(channel)) is not None:
+            self.volumes[index] = volume or 0
+
+    def apply(self, tokens: List[str], patch: Patch) -> bool:
+        """
+        Updates the state from a patch to the mixer.
+
+        :param tokens: The patch path relative to the mixer, e.g.
+                       ``["button_down", "Bleep"]``.
+        :param patch: The patch.
+
+        :return: False if the patch could not be applied from its value
+                 alone (a move or copy), and the state should be loaded
+                 from the patched mixer again.
+        """
+        if patch.operation in (PatchOperation.Move, PatchOperation.Copy):
+            return False
+        if patch.operation is PatchOperation.Test:
+            return True
+
+        value = None if patch.operation is PatchOperation.Remove else patch.value
+
+        match tokens:
+            case []:
+                self.load(value or {})
+            case ["button_down"]:
+                self.__load_buttons(value or {})
+            case ["button_down", button]:
+                self.__set_button(button, value)
+            case ["router"]:
+                self.__load_router(value or {})
+            case ["router", input]:
+                self.__load_route_row(input, value or {})
+            case ["router", input, output]:
+                self.__set_route(input, output, value)
+            case ["levels"]:
+                self.__load_volumes((value or {}).get("volumes") or {})
+            case ["levels", "volumes"]:
+                self.__load_volumes(value or {})
+            case ["levels", "volumes", channel]:
+                self.__set_volume(channel, value)
+
+        return True
+
+    # Buttons
+
+    def is_down(self, button: Button) -> bool:
+        return bool(self.buttons & BUTTON_BITS[button.name])
+
+    def any_down(self, mask: int) -> bool:
+        """
+        :return: Whether any of the buttons in the mask are down.
+        """
+        return bool(self.buttons & mask)
+
+    def all_down(self, mask: int) -> bool:
+        """
+        :return: Whether all of the buttons in the mask are down.
+        """
+        return self.buttons & mask == mask
+
+    def changed_mask(self, mask: int = ALL_BUTTONS) -> int:
+        """
+        :return: The buttons in the mask that changed in the last update.
+        """
+        return self.changed & mask
+
+    # Routing
+
+    def is_routed(self, input: InputDevice, output: OutputDevice) -> bool:
+        return bool(self.routing & route_bit(input, output))
+
+    def route_row(self, input: InputDevice) -> int:
+        """
+        :return: The outputs an input is routed to, as a bitmask in
+                 `OutputDevice` order.
+        """
+        return (self.routing >> (INPUT_INDEX[input.name] * OUTPUTS)) & ROUTE_ROW
+
+    # Volumes
+
+    def get_volume(self, channel: Channel) -> int:
+        return self.volumes[CHANNEL_INDEX[channel.name]]
@@ -20,8 +20,13 @@ setup(
     author="Sam Carson",
     author_email="sam@samcarson.co.uk",
     license="MIT",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=["asyncio", "websockets==13.1"],
+    extras_require={
+        "orjson": ["orjson"],
+        "msgspec": ["msgspec"],
+        "ujson": ["ujson"],
+    },
     python_requires=">=3.10",
     long_description=open("README.md").read(),
     long_description_content_type="text/markdown",
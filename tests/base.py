@@ -0,0 +1,32 @@
+import unittest
+
+from goxlr import GoXLR
+from goxlr.mock import MockDaemon
+
+
+class DaemonTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Runs each test against its own `MockDaemon`, with a `GoXLR` connected
+    to it as ``self.xlr``. Subclasses change the options either is made
+    with, or set ``client_options`` to None to connect their own clients.
+    """
+
+    daemon_options = {}
+    client_options = {}
+
+    async def asyncSetUp(self):
+        self.daemon = MockDaemon(**self.daemon_options)
+        await self.daemon.start()
+        self.addAsyncCleanup(self.daemon.stop)
+
+        if self.client_options is not None:
+            self.xlr = await self.connect(**self.client_options)
+            self.addAsyncCleanup(self.xlr.close)
+
+    async def connect(self, **options) -> GoXLR:
+        """
+        Opens another client to the daemon. Closing it is up to the caller.
+        """
+        xlr = GoXLR(port=self.daemon.port, **options)
+        await xlr.open()
+        return xlr
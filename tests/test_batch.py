@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+from goxlr.error import BatchError, DaemonError
+from goxlr.types.enums import Channel, Fader, MuteState
+
+from .base import DaemonTestCase
+
+
+class TestBatch(DaemonTestCase):
+    def record_commands(self) -> list:
+        """
+        :return: The names of the commands the daemon processes from now
+                 on, in the order it processes them.
+        """
+        commands = []
+        process = self.daemon._MockDaemon__process
+
+        def record(data):
+            if isinstance(data, dict) and "Command" in data:
+                commands.append(next(iter(data["Command"][1])))
+            return process(data)
+
+        self.daemon._MockDaemon__process = record
+        return commands
+
+    async def test_batch_sends_on_exit_in_order(self):
+        commands = self.record_commands()
+
+        async with self.xlr.batch() as batch:
+            batch.set_scribble_text(Fader.A, "Mic")
+            batch.set_fader(Fader.A, Channel.Mic)
+            batch.set_volume(Channel.Mic, 10)
+            batch.set_fader_mute_state(Fader.B, MuteState.MutedToAll)
+            assert len(batch) == 4
+            assert commands == []
+
+        # results are in the order the commands were queued, on the wire
+        # each lane keeps its order and mutes go first
+        assert batch.results == ["Ok"] * 4
+        assert commands[0] == "SetFaderMuteState"
+        assert [c for c in commands if c != "SetFaderMuteState"] in (
+            ["SetScribbleText", "SetFader", "SetVolume"],
+            ["SetFader", "SetVolume", "SetScribbleText"],
+        )
+        assert len(batch) == 0
+        assert self.xlr.get_volume(Channel.Mic) == 10
+
+    async def test_pipeline_returns_results_in_order(self):
+        commands = self.record_commands()
+
+        results = await self.xlr.pipeline(
+            [self.xlr.set_volume(Channel.Mic, volume) for volume in range(20)]
+            + [self.xlr.ping()]
+        )
+
+        assert results == ["Ok"] * 21
+        assert commands == ["SetVolume"] * 20
+        # the last write wins, as the commands were sent in order
+        assert (
+            self.daemon.status["mixers"][self.xlr.serial]["levels"]["volumes"]["Mic"]
+            == 19
+        )
+
+    async def test_one_failure_does_not_stop_the_rest(self):
+        self.daemon.errors["SetScribbleText"] = "Nope"
+
+        with self.assertRaises(BatchError) as caught:
+            async with self.xlr.batch() as batch:
+                batch.set_volume(Channel.Mic, 10)
+                batch.set_scribble_text(Fader.A, "Mic")
+                batch.set_volume(Channel.Chat, 20)
+
+        error = caught.exception
+        assert len(error.errors) == 1
+        assert isinstance(error.errors[0], DaemonError)
+        assert error.results[0] == "Ok" and error.results[2] == "Ok"
+        assert error.results[1] is error.errors[0]
+        assert self.xlr.get_volume(Channel.Mic) == 10
+        assert self.xlr.get_volume(Channel.Chat) == 20
+
+    async def test_nothing_is_sent_if_the_block_raises(self):
+        commands = self.record_commands()
+
+        with self.assertRaises(RuntimeError):
+            async with self.xlr.batch() as batch:
+                batch.set_volume(Channel.Mic, 10)
+                raise RuntimeError
+
+        await self.xlr.ping()
+        assert commands == []
+        assert len(batch) == 0
+
+    async def test_only_commands_can_be_batched(self):
+        batch = self.xlr.batch()
+        with self.assertRaises(AttributeError):
+            batch.get_volume(Channel.Mic)
+
+
+class TestPipelining(DaemonTestCase):
+    daemon_options = {"latency": 0.05}
+
+    async def test_commands_share_one_round_trip(self):
+        start = time.perf_counter()
+        results = await self.xlr.pipeline(
+            [self.xlr.set_volume(Channel.Mic, volume) for volume in range(10)]
+        )
+        elapsed = time.perf_counter() - start
+
+        assert results == ["Ok"] * 10
+        # one after another they would take 10 round trips, 0.5 seconds
+        assert elapsed < 0.25
+        assert not self.xlr.response_futures
+
+    async def test_in_flight_at_once(self):
+        commands = [self.xlr.set_volume(Channel.Mic, volume) for volume in range(5)]
+        task = asyncio.ensure_future(self.xlr.pipeline(commands))
+        await asyncio.sleep(0.02)
+
+        # every command was sent before the first reply came back
+        assert len(self.xlr.response_futures) == 5
+        assert await task == ["Ok"] * 5
@@ -0,0 +1,48 @@
+import pickle
+import tempfile
+
+from goxlr.cache import cache_path, load_status, save_status
+from goxlr.mock import generate_status
+
+from .base import DaemonTestCase
+
+
+def test_status_round_trip(tmp_path):
+    path = cache_path(tmp_path, "localhost", 14564)
+    status = generate_status()
+
+    save_status(path, status)
+
+    assert load_status(path) == status
+    assert load_status(path, "orjson") == status
+
+
+def test_unusable_files_are_ignored(tmp_path):
+    path = tmp_path / "status.cache"
+    assert load_status(path) is None
+
+    path.write_bytes(pickle.dumps((1, generate_status())))
+    assert load_status(path) is None
+
+    save_status(path, generate_status())
+    path.write_bytes(path.read_bytes()[:-8])
+    assert load_status(path) is None
+
+
+class TestWarmStart(DaemonTestCase):
+    client_options = None
+
+    async def test_cached_status_is_served_until_the_live_one_arrives(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+
+        xlr = await self.connect(status_cache=directory)
+        assert not xlr.status_stale
+        serial = xlr.serial
+        await xlr.close()  # saves the status
+
+        xlr = await self.connect(status_cache=directory)
+        self.addAsyncCleanup(xlr.close)
+        assert xlr.status_stale
+        assert xlr.serial == serial
+        await xlr.ready()
+        assert not xlr.status_stale
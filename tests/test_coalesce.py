@@ -0,0 +1,54 @@
+import asyncio
+import unittest
+
+from goxlr.commands.coalesce import WriteCoalescer, coalesce_key
+
+
+def test_coalesce_key():
+    assert coalesce_key("S1", {"SetVolume": ["Mic", 200]}) == (
+        "S1",
+        "SetVolume",
+        ("Mic",),
+    )
+    assert coalesce_key("S1", {"SetFader": ["A", "Mic"]}) is None
+
+
+class TestWriteCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def test_latest_value_wins(self):
+        sent = []
+        release = asyncio.Event()
+
+        async def send(payload):
+            sent.append(payload)
+            await release.wait()
+            return f"sent {payload}"
+
+        coalescer = WriteCoalescer()
+        key = ("S1", "SetVolume", ("Mic",))
+        first = asyncio.create_task(coalescer.send(key, 1, send))
+        await asyncio.sleep(0)
+        later = [asyncio.create_task(coalescer.send(key, v, send)) for v in (2, 3, 4)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(first, *later)
+
+        assert sent == [1, 4]
+        assert results == ["sent 1", "sent 4", "sent 4", "sent 4"]
+        assert coalescer.coalesced == 2
+        assert not coalescer.pending
+
+    async def test_errors_reach_every_waiter(self):
+        async def send(payload):
+            raise RuntimeError("nope")
+
+        coalescer = WriteCoalescer()
+        key = ("S1", "SetVolume", ("Mic",))
+        results = await asyncio.gather(
+            coalescer.send(key, 1, send),
+            coalescer.send(key, 2, send),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert not coalescer.pending
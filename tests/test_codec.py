@@ -0,0 +1,99 @@
+import importlib
+
+import pytest
+
+from goxlr.codec import CODECS, Codec, JsonCodec, get_codec, pack, unpack
+from goxlr.mock import generate_status
+from goxlr.types.enums import Channel
+
+from .base import DaemonTestCase
+
+DOCUMENT = {
+    "text": "Mic – Ünïcödé ✓",
+    "int": 255,
+    "float": 0.5,
+    "bool": True,
+    "none": None,
+    "list": [1, "two", [3]],
+    "nested": {"empty": {}, "status": generate_status()},
+}
+
+
+def installed(name: str) -> Codec:
+    if name != "json":
+        pytest.importorskip(name)
+    return get_codec(name)
+
+
+@pytest.fixture(params=sorted(CODECS))
+def codec(request) -> Codec:
+    return installed(request.param)
+
+
+def test_round_trip(codec):
+    encoded = codec.encode(DOCUMENT)
+    assert isinstance(encoded, str)
+    assert codec.decode(encoded) == DOCUMENT
+
+
+def test_decode_str_and_bytes(codec):
+    encoded = codec.encode(DOCUMENT)
+    assert codec.decode(encoded.encode()) == DOCUMENT
+
+    # what another codec wrote reads back the same
+    assert codec.decode(JsonCodec().encode(DOCUMENT)) == DOCUMENT
+    assert JsonCodec().decode(encoded) == DOCUMENT
+
+
+def test_pack_round_trip(codec):
+    data = pack(DOCUMENT, b"TEST", 3, codec)
+    assert data[:4] == b"TEST"
+    assert unpack(data, b"TEST", codec) == (3, DOCUMENT)
+
+    with pytest.raises(ValueError):
+        unpack(data, b"ELSE", codec)
+    with pytest.raises(ValueError):
+        unpack(data[:-4], b"TEST", codec)
+
+
+def test_get_codec():
+    assert isinstance(get_codec(), JsonCodec)
+    json = JsonCodec()
+    assert get_codec(json) is json
+
+    with pytest.raises(ValueError):
+        get_codec("pickle")
+
+
+def test_get_codec_falls_back_to_json(monkeypatch):
+    class Missing(Codec):
+        name = "missing"
+
+        def __init__(self):
+            importlib.import_module("a_library_that_is_not_installed")
+
+    monkeypatch.setitem(CODECS, "missing", Missing)
+
+    with pytest.warns(UserWarning, match="missing is not installed"):
+        assert isinstance(get_codec("missing"), JsonCodec)
+
+
+class TestWire(DaemonTestCase):
+    client_options = None
+
+    async def test_each_codec_talks_to_the_daemon(self):
+        for name in sorted(CODECS):
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                continue
+
+            with self.subTest(codec=name):
+                xlr = await self.connect(codec=name)
+                try:
+                    assert type(xlr.codec).name == name
+                    assert await xlr.set_volume(Channel.Mic, 40) == "Ok"
+                    assert xlr.get_volume(Channel.Mic) == 40
+                    assert xlr.serial in xlr.status.mixers
+                finally:
+                    await xlr.close()
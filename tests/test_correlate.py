@@ -0,0 +1,98 @@
+import asyncio
+
+from goxlr.commands.correlate import CommandResult
+from goxlr.types.enums import Channel, Fader
+
+from .base import DaemonTestCase
+
+
+class TestCorrelate(DaemonTestCase):
+    daemon_options = {"patch_delay": 0.01}
+    client_options = {"correlate": True, "correlate_window": 1.0}
+
+    def path(self, path: str) -> str:
+        return f"/mixers/{self.xlr.serial}{path}"
+
+    async def timed(self, command):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await command
+        return result, loop.time() - started
+
+    async def test_result_compares_equal_to_the_reply(self):
+        result = CommandResult("Ok", [])
+        assert result == "Ok"
+
+    async def test_matched_command_returns_its_patches(self):
+        result, elapsed = await self.timed(self.xlr.set_volume(Channel.Mic, 33))
+
+        assert result == "Ok"
+        assert [(p.path, p.value) for p in result.patches] == [
+            (self.path("/levels/volumes/Mic"), 33)
+        ]
+        assert elapsed < 0.5  # returned on the patch, not at the window's end
+
+    async def test_concurrent_commands_get_their_own_patches(self):
+        results = await self.xlr.pipeline(
+            [
+                self.xlr.set_volume(Channel.Chat, 1),
+                self.xlr.set_volume(Channel.Game, 2),
+                self.xlr.set_fader(Fader.C, Channel.Music),
+            ]
+        )
+
+        assert [[p.path for p in r.patches] for r in results] == [
+            [self.path("/levels/volumes/Chat")],
+            [self.path("/levels/volumes/Game")],
+            [self.path("/fader_status/C/channel")],
+        ]
+
+    async def test_no_op_command_returns_at_once(self):
+        volume = self.xlr.get_volume(Channel.Mic)
+        result, elapsed = await self.timed(self.xlr.set_volume(Channel.Mic, volume))
+
+        assert result.patches == []
+        assert elapsed < 0.5
+
+    async def test_matched_command_without_a_patch_waits_the_window(self):
+        # the daemon answers, but never sends the patch
+        process = self.daemon._MockDaemon__process
+        self.daemon._MockDaemon__process = lambda data: (process(data)[0], [])
+        self.xlr.correlate_window = 0.05
+
+        result, elapsed = await self.timed(self.xlr.set_volume(Channel.Mic, 33))
+
+        assert result == "Ok" and result.patches == []
+        assert elapsed >= 0.04
+
+    async def test_unknown_command_returns_at_once(self):
+        async def patch_soon():
+            await asyncio.sleep(0.05)
+            await self.daemon.apply([(self.path("/levels/volumes/Mic"), 9)])
+
+        task = asyncio.ensure_future(patch_soon())
+        result, elapsed = await self.timed(self.xlr.save_profile())
+        await task
+
+        assert result == "Ok" and result.patches == []
+        assert elapsed < 0.05
+        assert not len(self.xlr.subscriptions)
+
+    async def test_unknown_command_waits_the_window_if_asked(self):
+        xlr = await self.connect(
+            correlate=True, correlate_window=0.1, correlate_unknown=True
+        )
+        self.addAsyncCleanup(xlr.close)
+
+        async def patch_soon():
+            await asyncio.sleep(0.02)
+            await self.daemon.apply([(self.path("/levels/volumes/Mic"), 9)])
+
+        task = asyncio.ensure_future(patch_soon())
+        result, elapsed = await self.timed(xlr.save_profile())
+        await task
+
+        assert [(p.path, p.value) for p in result.patches] == [
+            (self.path("/levels/volumes/Mic"), 9)
+        ]
+        assert elapsed >= 0.09
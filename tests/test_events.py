@@ -0,0 +1,225 @@
+import asyncio
+import unittest
+
+import pytest
+
+from goxlr.error import EventOverflowError
+from goxlr.events import (
+    ButtonPressed,
+    ButtonReleased,
+    EffectPresetChanged,
+    EventStream,
+    FaderAssigned,
+    MicProfileLoaded,
+    MixerConnected,
+    MixerDisconnected,
+    MuteStateChanged,
+    ProfileLoaded,
+    SamplePlaying,
+    VolumeChanged,
+    decode,
+    decode_patches,
+)
+from goxlr.types.enums import (
+    Button,
+    Channel,
+    EffectBankPreset,
+    Fader,
+    MuteState,
+    OverflowPolicy,
+    SampleBank,
+    SampleButton,
+)
+from goxlr.types.models import Patch
+
+from .base import DaemonTestCase
+
+
+def patch(path, value=None, op="replace"):
+    return Patch({"op": op, "path": "/mixers/S1" + path, "value": value})
+
+
+@pytest.mark.parametrize(
+    "path, value, event",
+    [
+        ("/button_down/Bleep", True, ButtonPressed("S1", Button.Bleep)),
+        ("/button_down/Fader1Mute", False, ButtonReleased("S1", Button.Fader1Mute)),
+        ("/levels/volumes/Mic", 42, VolumeChanged("S1", Channel.Mic, 42)),
+        ("/fader_status/B/channel", "Chat", FaderAssigned("S1", Fader.B, Channel.Chat)),
+        (
+            "/fader_status/C/mute_state",
+            "MutedToX",
+            MuteStateChanged("S1", Fader.C, MuteState.MutedToX),
+        ),
+        (
+            "/cough_button/state",
+            "MutedToAll",
+            MuteStateChanged("S1", None, MuteState.MutedToAll),
+        ),
+        ("/profile_name", "Stream", ProfileLoaded("S1", "Stream")),
+        ("/mic_profile_name", "Voice", MicProfileLoaded("S1", "Voice")),
+        (
+            "/effects/active_preset",
+            "Preset3",
+            EffectPresetChanged("S1", EffectBankPreset.Preset3),
+        ),
+        (
+            "/sampler/banks/B/TopRight/is_playing",
+            True,
+            SamplePlaying("S1", SampleBank.B, SampleButton.TopRight, True),
+        ),
+    ],
+)
+def test_decode_each_event(path, value, event):
+    assert decode(patch(path, value)) == [event]
+    assert decode(patch(path, value, op="add")) == [event]
+
+
+def test_mixers_connecting_and_disconnecting():
+    assert decode(patch("", {}, op="add")) == [MixerConnected("S1")]
+    assert decode(patch("", op="remove")) == [MixerDisconnected("S1")]
+    assert decode(patch("", {})) == []
+
+
+def test_whole_subtree_replace():
+    events = decode(patch("/levels", {"volumes": {"Mic": 1, "Chat": 2}, "bleep": 0}))
+    assert events == [
+        VolumeChanged("S1", Channel.Mic, 1),
+        VolumeChanged("S1", Channel.Chat, 2),
+    ]
+
+    events = decode(patch("/fader_status/A", {"channel": "Music", "mute_type": "All"}))
+    assert events == [FaderAssigned("S1", Fader.A, Channel.Music)]
+
+
+def test_wildcard_subtree_replace():
+    # every key below a wildcard is matched, and passed on to the decoder
+    events = decode(patch("/button_down", {"Bleep": True, "Cough": False}))
+    assert events == [
+        ButtonPressed("S1", Button.Bleep),
+        ButtonReleased("S1", Button.Cough),
+    ]
+
+    banks = {
+        "A": {"TopLeft": {"is_playing": True, "is_recording": False}},
+        "C": {"BottomRight": {"is_playing": False}},
+    }
+    assert decode(patch("/sampler/banks", banks)) == [
+        SamplePlaying("S1", SampleBank.A, SampleButton.TopLeft, True),
+        SamplePlaying("S1", SampleBank.C, SampleButton.BottomRight, False),
+    ]
+
+    # and from further up, through fixed keys and wildcards alike
+    sampler = {"banks": banks, "record_buffer": 0}
+    assert decode(patch("/sampler", sampler)) == decode(patch("/sampler/banks", banks))
+
+
+def test_patches_without_events():
+    assert decode(patch("/levels/volumes/Mic", op="remove")) == []
+    assert decode(patch("/lighting/buttons/Bleep", {})) == []
+    assert decode(patch("/button_down/Bleep/extra", True)) == []
+    assert (
+        decode(Patch({"op": "replace", "path": "/config/log_level", "value": 1})) == []
+    )
+    assert decode(Patch({"op": "replace", "path": "/mixers", "value": {}})) == []
+
+
+def test_unknown_values_are_skipped():
+    assert decode(patch("/button_down/NewButton", True)) == []
+    assert decode(patch("/fader_status/A/mute_state", "MutedToMoon")) == []
+
+
+def test_decode_patches_keeps_order():
+    events = decode_patches(
+        [
+            patch("/levels/volumes/Mic", 1),
+            patch("/lighting/animation/mode", "None"),
+            patch("/button_down/Bleep", True),
+        ]
+    )
+    assert events == [
+        VolumeChanged("S1", Channel.Mic, 1),
+        ButtonPressed("S1", Button.Bleep),
+    ]
+
+
+def volumes(count, serial="S1"):
+    return [VolumeChanged(serial, Channel.Mic, volume) for volume in range(count)]
+
+
+class TestEventStream(unittest.IsolatedAsyncioTestCase):
+    async def drain(self, stream):
+        stream.close()
+        return [event.volume async for event in stream]
+
+    async def test_filters_by_type_and_serial(self):
+        stream = EventStream((VolumeChanged,), serial="S1")
+        stream.put(volumes(1) + volumes(1, "S2") + [ButtonPressed("S1", Button.Bleep)])
+        assert list(stream.buffer) == volumes(1)
+
+    async def test_drop_oldest(self):
+        stream = EventStream(maxsize=3)
+        stream.put(volumes(5))
+        assert stream.dropped == 2
+        assert await self.drain(stream) == [2, 3, 4]
+
+    async def test_drop_newest(self):
+        stream = EventStream(maxsize=3, overflow=OverflowPolicy.DropNewest)
+        stream.put(volumes(5))
+        assert stream.dropped == 2
+        assert await self.drain(stream) == [0, 1, 2]
+
+    async def test_raise(self):
+        stream = EventStream(maxsize=3, overflow=OverflowPolicy.Raise)
+        stream.put(volumes(5))
+        assert stream.dropped == 2
+
+        with self.assertRaises(EventOverflowError):
+            await anext(stream)
+
+        # the stream carries on with the events it kept
+        assert await self.drain(stream) == [0, 1, 2]
+
+    async def test_waits_for_events_and_ends_when_closed(self):
+        stream = EventStream()
+        task = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        stream.put(volumes(1))
+        assert await asyncio.wait_for(task, 1) == volumes(1)[0]
+
+        closed = []
+        stream.on_close = closed.append
+        stream.close()
+        stream.close()
+        assert closed == [stream]
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+
+
+class TestEvents(DaemonTestCase):
+    async def test_events_from_the_daemon(self):
+        serial = self.xlr.serial
+        async with self.xlr.events(ButtonPressed, VolumeChanged) as events:
+            await self.daemon.apply(
+                [
+                    (f"/mixers/{serial}/button_down/Bleep", True),
+                    (f"/mixers/{serial}/profile_name", "Other"),
+                    (f"/mixers/{serial}/levels/volumes/Mic", 3),
+                ]
+            )
+            received = [await asyncio.wait_for(anext(events), 1) for _ in range(2)]
+
+        assert received == [
+            ButtonPressed(serial, Button.Bleep),
+            VolumeChanged(serial, Channel.Mic, 3),
+        ]
+        assert events not in self.xlr.event_streams
+
+    async def test_streams_end_when_the_connection_closes(self):
+        events = self.xlr.events()
+        await self.xlr.close()
+
+        with self.assertRaises(StopAsyncIteration):
+            await asyncio.wait_for(anext(events), 1)
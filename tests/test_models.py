@@ -0,0 +1,114 @@
+from goxlr.mock import generate_status
+from goxlr.patch import apply_to_status
+from goxlr.types.enums import Channel, InputDevice, OutputDevice
+from goxlr.types.models import Patch, Status
+
+
+def replace(path, value):
+    return Patch({"op": "replace", "path": path, "value": value})
+
+
+def add(path, value):
+    return Patch({"op": "add", "path": path, "value": value})
+
+
+def lazy_status():
+    status = Status(generate_status(), lazy=True)
+    return status, next(iter(status.raw["mixers"]))
+
+
+def test_lazy_fields_are_built_on_access():
+    status, serial = lazy_status()
+    assert "mixers" not in status.__dict__
+
+    mixer = status.mixers[serial]
+    assert "levels" not in mixer.__dict__
+    assert (
+        mixer.levels.volumes[Channel.Mic]
+        == status.raw["mixers"][serial]["levels"]["volumes"]["Mic"]
+    )
+
+
+def test_patch_only_invalidates_what_it_touched():
+    status, serial = lazy_status()
+    mixer = status.mixers[serial]
+    levels, lighting = mixer.levels, mixer.lighting
+
+    apply_to_status(status, replace(f"/mixers/{serial}/levels/volumes/Mic", 3))
+
+    assert status.mixers[serial] is mixer
+    assert mixer.lighting is lighting
+    assert mixer.levels is not levels
+    assert mixer.levels.volumes[Channel.Mic] == 3
+
+
+def test_replacing_a_mixer_rebuilds_it():
+    status, serial = lazy_status()
+    mixer = status.mixers[serial]
+    raw = dict(status.raw["mixers"][serial], profile_name="Other")
+
+    apply_to_status(status, replace(f"/mixers/{serial}", raw))
+
+    assert status.mixers[serial] is not mixer
+    assert status.mixers[serial].profile_name == "Other"
+
+
+def test_materialised_lazy_status_matches_eager():
+    raw = generate_status()
+    lazy = Status(raw, lazy=True)
+    lazy.materialise()
+    eager = Status(raw)
+    serial = next(iter(raw["mixers"]))
+    assert lazy.mixers[serial].levels == eager.mixers[serial].levels
+    assert lazy.mixers[serial].router == eager.mixers[serial].router
+
+
+def test_routing_index_follows_router_patches():
+    status, serial = lazy_status()
+    routing = status.mixers[serial].routing
+    route = f"/mixers/{serial}/router/Music/Headphones"
+
+    for enabled in (False, True, False):
+        apply_to_status(status, replace(route, enabled))
+        assert status.mixers[serial].routing is routing
+        assert (
+            OutputDevice.Headphones in routing.outputs[InputDevice.Music]
+        ) is enabled
+        assert (InputDevice.Music in routing.inputs[OutputDevice.Headphones]) is enabled
+
+
+def test_routing_index_skips_unknown_devices():
+    status, serial = lazy_status()
+    routing = status.mixers[serial].routing
+    router = f"/mixers/{serial}/router"
+    before = {input: set(outputs) for input, outputs in routing.outputs.items()}
+
+    apply_to_status(status, add(f"{router}/NewInput", {"Headphones": True}))
+    apply_to_status(status, add(f"{router}/Music/NewOutput", True))
+
+    assert status.mixers[serial].routing is routing
+    assert routing.outputs == before
+
+
+def test_detached_status_keeps_the_models_only():
+    raw = generate_status()
+    serial = next(iter(raw["mixers"]))
+    status = Status(generate_status(), lazy=True)
+    status.detach()
+
+    assert status.raw is None
+    assert status.mixers[serial].raw is None
+    assert status.mixers[serial].levels == Status(raw).mixers[serial].levels
+
+
+def test_routing_index_is_built_on_first_use_only():
+    status, serial = lazy_status()
+    status.materialise()
+    mixer = status.mixers[serial]
+    assert "routing" not in mixer.__dict__
+
+    status.detach()
+
+    for input, outputs in mixer.router.items():
+        for output, enabled in outputs.items():
+            assert (output in mixer.routing.outputs[input]) is enabled
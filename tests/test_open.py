@@ -0,0 +1,68 @@
+import tempfile
+
+from goxlr.error import MixerNotFoundError, StatusNotReadyError
+from goxlr.mock import generate_status
+from goxlr.types.enums import Channel
+
+from .base import DaemonTestCase
+
+
+class TestBackgroundOpen(DaemonTestCase):
+    daemon_options = {"latency": 0.05}
+    client_options = None
+
+    async def test_open_returns_before_the_status(self):
+        serial = next(iter(self.daemon.status["mixers"]))
+        xlr = await self.connect(serial=serial, background_update=True)
+        self.addAsyncCleanup(xlr.close)
+
+        assert not xlr.status
+        with self.assertRaises(StatusNotReadyError):
+            xlr.get_volume(Channel.Mic)
+
+        assert await xlr.set_volume(Channel.Mic, 17) == "Ok"
+
+        assert await xlr.ready() is xlr.status
+        assert xlr.get_volume(Channel.Mic) == 17
+
+    async def test_ready_returns_at_once_without_background_update(self):
+        xlr = await self.connect()
+        self.addAsyncCleanup(xlr.close)
+
+        assert xlr.ready_task is None
+        assert await xlr.ready() is xlr.status
+
+    async def test_a_failed_first_update_is_raised_by_ready(self):
+        xlr = await self.connect(serial="NOPE", background_update=True)
+        self.addAsyncCleanup(xlr.close)
+
+        with self.assertRaises(MixerNotFoundError):
+            await xlr.ready()
+
+    async def test_a_cached_mixer_that_is_gone_is_picked_again(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        xlr = await self.connect(status_cache=directory)
+        await xlr.close()  # saves the status
+
+        self.daemon.status = generate_status(serials=["S2"])
+        xlr = await self.connect(status_cache=directory)
+        self.addAsyncCleanup(xlr.close)
+        assert xlr.status_stale and xlr.serial != "S2"
+
+        await xlr.ready()
+
+        assert xlr.serial == "S2"
+        assert xlr.mixer is xlr.status.mixers["S2"]
+
+    async def test_a_requested_mixer_that_is_gone_is_not_replaced(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        serial = next(iter(self.daemon.status["mixers"]))
+        xlr = await self.connect(status_cache=directory)
+        await xlr.close()
+
+        self.daemon.status = generate_status(serials=["S2"])
+        xlr = await self.connect(serial=serial, status_cache=directory)
+        self.addAsyncCleanup(xlr.close)
+
+        with self.assertRaises(MixerNotFoundError):
+            await xlr.ready()
@@ -0,0 +1,191 @@
+from goxlr.mock import generate_status
+from goxlr.types.enums import Button, Channel, IDType, InputDevice, OutputDevice
+from goxlr.types.models import Patch
+from goxlr.types.packed import ALL_BUTTONS, PackedState, button_mask, route_bit
+
+from .base import DaemonTestCase
+
+MUTES = button_mask(
+    Button.Fader1Mute, Button.Fader2Mute, Button.Fader3Mute, Button.Fader4Mute
+)
+
+
+def mixer():
+    status = generate_status()
+    return next(iter(status["mixers"].values()))
+
+
+def patch(op, path, value=None, from_path=None):
+    operation = {"op": op, "path": path, "value": value}
+    if from_path is not None:
+        operation["from"] = from_path
+    return Patch(operation)
+
+
+def test_masks_follow_enum_order():
+    assert button_mask(Button.Fader1Mute) == 1
+    assert button_mask() == 0
+    assert MUTES == 0b1111
+    assert route_bit(InputDevice.Microphone, OutputDevice.Headphones) == 1
+
+
+def test_load():
+    raw = mixer()
+    raw["button_down"]["Fader2Mute"] = True
+    raw["button_down"]["Bleep"] = True
+    raw["router"]["Music"]["Headphones"] = False
+    raw["levels"]["volumes"]["Mic"] = 12
+
+    state = PackedState(raw)
+
+    assert state.buttons == button_mask(Button.Fader2Mute, Button.Bleep)
+    assert state.any_down(MUTES)
+    assert not state.all_down(MUTES)
+    assert state.is_down(Button.Bleep) and not state.is_down(Button.Fader1Mute)
+    assert state.changed_mask(MUTES) == button_mask(Button.Fader2Mute)
+    assert not state.is_routed(InputDevice.Music, OutputDevice.Headphones)
+    assert state.is_routed(InputDevice.Music, OutputDevice.BroadcastMix)
+    assert state.route_row(InputDevice.Microphone) == (1 << len(OutputDevice)) - 1
+    assert state.get_volume(Channel.Mic) == 12
+    assert state.get_volume(Channel.Chat) == raw["levels"]["volumes"]["Chat"]
+
+
+def test_load_ignores_unknown_names():
+    raw = mixer()
+    raw["button_down"]["NewButton"] = True
+    raw["router"]["NewInput"] = {"Headphones": True}
+    raw["router"]["Music"]["NewOutput"] = False
+    raw["levels"]["volumes"]["NewChannel"] = 1
+
+    state = PackedState(raw)
+
+    assert state.buttons == 0
+    assert state.route_row(InputDevice.Music) == (1 << len(OutputDevice)) - 1
+
+
+def test_apply_button_patches():
+    state = PackedState(mixer())
+    state.changed = 0
+
+    state.apply(["button_down", "Fader1Mute"], patch("replace", "", True))
+    state.apply(["button_down", "Fader3Mute"], patch("replace", "", True))
+    assert state.all_down(button_mask(Button.Fader1Mute, Button.Fader3Mute))
+    assert state.changed_mask() == button_mask(Button.Fader1Mute, Button.Fader3Mute)
+
+    # setting a button to the state it is in changes nothing
+    state.changed = 0
+    state.apply(["button_down", "Fader1Mute"], patch("replace", "", True))
+    assert state.changed == 0
+
+    # a whole subtree replace reloads every button
+    buttons = {b.name: False for b in Button}
+    buttons["Bleep"] = True
+    state.apply(["button_down"], patch("replace", "", buttons))
+    assert state.buttons == button_mask(Button.Bleep)
+    assert state.changed_mask(MUTES) == button_mask(
+        Button.Fader1Mute, Button.Fader3Mute
+    )
+    assert state.changed_mask(ALL_BUTTONS) == button_mask(
+        Button.Fader1Mute, Button.Fader3Mute, Button.Bleep
+    )
+
+
+def test_apply_routing_and_volume_patches():
+    state = PackedState(mixer())
+
+    state.apply(["router", "Music", "Headphones"], patch("replace", "", False))
+    assert not state.is_routed(InputDevice.Music, OutputDevice.Headphones)
+
+    state.apply(["router", "Chat"], patch("replace", "", {"Headphones": True}))
+    assert state.route_row(InputDevice.Chat) == 1 << list(OutputDevice).index(
+        OutputDevice.Headphones
+    )
+
+    state.apply(["levels", "volumes", "Mic"], patch("replace", "", 50))
+    state.apply(["levels"], patch("replace", "", {"volumes": {"Chat": 60}}))
+    assert state.get_volume(Channel.Mic) == 50
+    assert state.get_volume(Channel.Chat) == 60
+
+
+def test_apply_asks_for_a_reload_on_move_and_copy():
+    state = PackedState(mixer())
+    path = "/mixers/S/button_down/Bleep"
+
+    assert not state.apply(["button_down", "Bleep"], patch("move", path, None, path))
+    assert not state.apply(["button_down", "Bleep"], patch("copy", path, None, path))
+    assert state.apply(["button_down", "Bleep"], patch("test", path, False))
+    assert state.buttons == 0
+
+
+class TestPackedStates(DaemonTestCase):
+    client_options = {"packed": True}
+
+    def button_path(self, button: Button) -> str:
+        return f"/mixers/{self.xlr.serial}/button_down/{button.name}"
+
+    async def test_loaded_with_the_status(self):
+        state = self.xlr.get_packed_state()
+        raw = self.daemon.status["mixers"][self.xlr.serial]
+
+        assert state is self.xlr.packed_states[self.xlr.serial]
+        assert state.buttons == 0
+        assert state.get_volume(Channel.Mic) == raw["levels"]["volumes"]["Mic"]
+        assert state.is_routed(InputDevice.Music, OutputDevice.Headphones)
+
+    async def test_not_kept_unless_asked_for(self):
+        xlr = await self.connect()
+        self.addAsyncCleanup(xlr.close)
+        assert xlr.get_packed_state() is None
+
+    async def test_updated_by_patches(self):
+        state = self.xlr.get_packed_state()
+
+        await self.daemon.apply(
+            [
+                (self.button_path(Button.Fader1Mute), True),
+                (self.button_path(Button.Fader4Mute), True),
+            ]
+        )
+        await self.xlr.settle(quiet_ms=20)
+        assert state.buttons == button_mask(Button.Fader1Mute, Button.Fader4Mute)
+        assert state.changed_mask(MUTES) == state.buttons
+
+        # changed only holds what the last patch message changed
+        await self.daemon.apply([(self.button_path(Button.Fader1Mute), False)])
+        await self.xlr.settle(quiet_ms=20)
+        assert state.buttons == button_mask(Button.Fader4Mute)
+        assert state.changed_mask(MUTES) == button_mask(Button.Fader1Mute)
+
+    async def test_reloaded_after_a_subtree_replace(self):
+        state = self.xlr.get_packed_state()
+        buttons = {b.name: b in (Button.Fader2Mute, Button.Bleep) for b in Button}
+
+        await self.daemon.apply([(f"/mixers/{self.xlr.serial}/button_down", buttons)])
+        await self.xlr.settle(quiet_ms=20)
+
+        assert state.buttons == button_mask(Button.Fader2Mute, Button.Bleep)
+
+    async def test_updated_by_acknowledged_commands(self):
+        state = self.xlr.get_packed_state()
+
+        await self.xlr.set_volume(Channel.Mic, 77)
+        await self.xlr.set_router(InputDevice.Music, OutputDevice.Headphones, False)
+
+        assert state.get_volume(Channel.Mic) == 77
+        assert not state.is_routed(InputDevice.Music, OutputDevice.Headphones)
+
+    async def test_reloaded_from_the_status_after_a_copy(self):
+        state = self.xlr.get_packed_state()
+        await self.daemon.apply([(self.button_path(Button.Fader1Mute), True)])
+        await self.xlr.settle(quiet_ms=20)
+
+        broadcast = self.daemon._MockDaemon__broadcast
+        operation = {
+            "op": "copy",
+            "from": self.button_path(Button.Fader1Mute),
+            "path": self.button_path(Button.Fader2Mute),
+        }
+        await broadcast({"id": IDType.Patch.value, "data": {"Patch": [operation]}})
+        await self.xlr.settle(quiet_ms=20)
+
+        assert state.all_down(button_mask(Button.Fader1Mute, Button.Fader2Mute))
@@ -0,0 +1,103 @@
+import pytest
+
+from goxlr.error import PatchError
+from goxlr.patch import apply_patch, apply_to_status, parse_pointer
+from goxlr.mock import generate_status
+from goxlr.types.enums import Channel
+from goxlr.types.models import Patch, Status
+
+
+def patch(op, path, value=None, from_path=None):
+    operation = {"op": op, "path": path, "value": value}
+    if from_path is not None:
+        operation["from"] = from_path
+    return Patch(operation)
+
+
+def test_parse_pointer():
+    assert parse_pointer("") == []
+    assert parse_pointer("/a/b") == ["a", "b"]
+    assert parse_pointer("/a~1b/c~0d") == ["a/b", "c~d"]
+
+    with pytest.raises(PatchError):
+        parse_pointer("a/b")
+
+
+def test_add_to_object_and_array():
+    document = {"a": {}, "list": [1, 3]}
+    apply_patch(document, patch("add", "/a/b", 1))
+    apply_patch(document, patch("add", "/list/1", 2))
+    apply_patch(document, patch("add", "/list/-", 4))
+    assert document == {"a": {"b": 1}, "list": [1, 2, 3, 4]}
+
+
+def test_add_past_end_of_array_fails():
+    with pytest.raises(PatchError):
+        apply_patch({"list": [1]}, patch("add", "/list/3", 2))
+
+
+def test_remove():
+    document = {"a": 1, "list": [1, 2]}
+    apply_patch(document, patch("remove", "/a"))
+    apply_patch(document, patch("remove", "/list/0"))
+    assert document == {"list": [2]}
+
+    with pytest.raises(PatchError):
+        apply_patch(document, patch("remove", "/missing"))
+
+
+def test_replace_requires_existing_value():
+    document = {"a": 1}
+    apply_patch(document, patch("replace", "/a", 2))
+    assert document == {"a": 2}
+
+    with pytest.raises(PatchError):
+        apply_patch(document, patch("replace", "/b", 2))
+
+
+def test_replace_whole_document():
+    assert apply_patch({"a": 1}, patch("replace", "", {"b": 2})) == {"b": 2}
+
+
+def test_move_and_copy():
+    document = {"a": {"x": 1}, "b": {}}
+    apply_patch(document, patch("copy", "/b/y", from_path="/a/x"))
+    apply_patch(document, patch("move", "/b/z", from_path="/a/x"))
+    assert document == {"a": {}, "b": {"y": 1, "z": 1}}
+
+    with pytest.raises(PatchError):
+        apply_patch(document, patch("move", "/b/y/c", from_path="/b"))
+
+
+def test_test_operation():
+    document = {"a": [1, 2]}
+    apply_patch(document, patch("test", "/a", [1, 2]))
+
+    with pytest.raises(PatchError):
+        apply_patch(document, patch("test", "/a", [1]))
+
+
+def test_copy_is_independent():
+    document = {"a": {"x": [1]}, "b": {}}
+    apply_patch(document, patch("copy", "/b/c", from_path="/a"))
+    document["a"]["x"].append(2)
+    assert document["b"]["c"] == {"x": [1]}
+
+
+def test_apply_to_status_updates_the_model():
+    status = Status(generate_status(), keep_raw=True)
+    serial = next(iter(status.mixers))
+    mixer = status.mixers[serial]
+    assert mixer.levels.volumes[Channel.Mic] != 7
+
+    apply_to_status(status, patch("replace", f"/mixers/{serial}/levels/volumes/Mic", 7))
+
+    assert status.mixers[serial].levels.volumes[Channel.Mic] == 7
+
+
+def test_a_snapshot_without_its_raw_document_is_not_patched():
+    status = Status(generate_status())
+    serial = next(iter(status.mixers))
+
+    with pytest.raises(PatchError):
+        apply_to_status(status, patch("replace", f"/mixers/{serial}/profile_name", "x"))
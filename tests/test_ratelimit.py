@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+
+from goxlr.ratelimit import TokenBucket, calibrate
+from goxlr.types.enums import Channel, Fader, MuteState
+
+from .base import DaemonTestCase
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_then_rate(self):
+        bucket = TokenBucket(20, burst=2)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(4):
+            await bucket.acquire()
+        elapsed = loop.time() - started
+
+        # two go at once, the other two 50 ms apart
+        assert 0.08 < elapsed < 0.5
+        assert bucket.acquired == 4
+        assert bucket.throttled == 2
+        assert bucket.wait_time > 0.07
+
+    async def test_waiters_go_in_order(self):
+        bucket = TokenBucket(20, burst=1)
+        order = []
+
+        async def acquire(i):
+            await bucket.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(acquire(i) for i in range(5)))
+        assert order == list(range(5))
+
+    async def test_burst_defaults_to_one_second(self):
+        assert TokenBucket(20).burst == 20
+        assert TokenBucket(0.5).burst == 1
+
+    async def test_not_adaptive_ignores_round_trips(self):
+        bucket = TokenBucket(100)
+        bucket.observe(0.001)
+        bucket.observe(1.0)
+        assert bucket.rate == 100
+        assert bucket.smoothed_rtt is None
+
+    async def test_adaptive_backs_off_and_recovers(self):
+        bucket = TokenBucket(100, adaptive=True, min_rate=40)
+        bucket.observe(0.001)
+        assert bucket.rate == 100  # already at max_rate
+
+        # round trips well above the fastest one cut the rate, once per
+        # round trip
+        for _ in range(20):
+            bucket.observe(0.1)
+        assert bucket.rate == 70
+        assert bucket.backoffs == 1
+
+        bucket.last_backoff = 0.0
+        for _ in range(5):
+            bucket.observe(0.1)
+            bucket.last_backoff = 0.0
+        assert bucket.rate == 40  # never below min_rate
+        assert bucket.stats()["backoffs"] == 6
+
+        # once the round trips are fast again it grows by one per command
+        bucket.smoothed_rtt = 0.001
+        for _ in range(10):
+            bucket.observe(0.001)
+        assert bucket.rate == 50
+
+        for _ in range(100):
+            bucket.observe(0.001)
+        assert bucket.rate == 100  # never above max_rate
+
+    async def test_set_rate_scales_the_burst(self):
+        bucket = TokenBucket(100, burst=10)
+        bucket.set_rate(300)
+        assert (bucket.rate, bucket.max_rate, bucket.burst) == (300, 300, 30)
+
+        bucket.set_rate(5)
+        assert bucket.burst == 1
+        assert bucket.tokens <= 1
+
+    async def test_calibrate_stops_when_round_trips_grow(self):
+        in_flight = 0
+
+        async def send():
+            # a daemon that slows down with every request it is handling
+            nonlocal in_flight
+            in_flight += 1
+            try:
+                await asyncio.sleep(0.01 * in_flight)
+            finally:
+                in_flight -= 1
+
+        rate = await calibrate(
+            send, start_rate=25, max_rate=1000, step=2, duration=0.2, tolerance=1.5
+        )
+        assert 25 <= rate < 200
+
+
+class TestRateLimit(DaemonTestCase):
+    client_options = {"rate_limit": 20, "rate_limit_burst": 2}
+
+    async def test_limiter_per_mixer(self):
+        limiter = self.xlr.get_rate_limiter()
+        assert limiter is self.xlr.get_rate_limiter(self.xlr.serial)
+        assert limiter is not self.xlr.get_rate_limiter("other")
+        assert (limiter.rate, limiter.burst) == (20, 2)
+
+    async def test_disabled_by_default(self):
+        xlr = await self.connect()
+        self.addAsyncCleanup(xlr.close)
+        assert xlr.get_rate_limiter() is None
+
+    async def test_commands_are_limited_but_mutes_are_not(self):
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for volume in range(4):
+            await self.xlr.set_volume(Channel.Mic, volume)
+        # two go out at once, the other two wait 50 ms each
+        assert loop.time() - started > 0.08
+
+        started = loop.time()
+        for _ in range(4):
+            await self.xlr.set_fader_mute_state(Fader.A, MuteState.MutedToAll)
+        assert loop.time() - started < 0.05
+
+        stats = self.xlr.rate_limit_stats()[self.xlr.serial]
+        assert stats["acquired"] == 4
+        assert stats["throttled"] == 2
+
+    async def test_calibrate_applies_the_rate_and_scales_the_burst(self):
+        limiter = self.xlr.get_rate_limiter()
+
+        rate = await self.xlr.calibrate_rate_limit(
+            start_rate=40, max_rate=80, step=2, duration=0.1
+        )
+
+        assert rate in (40, 80)
+        assert self.xlr.rate_limit == rate
+        assert self.xlr.rate_limit_burst == 2 * rate // 20
+        assert (limiter.rate, limiter.max_rate) == (rate, rate)
+        assert limiter.burst == 2 * rate // 20
+        assert self.xlr.get_rate_limiter("other").burst == limiter.burst
+
+    async def test_calibrate_without_applying(self):
+        rate = await self.xlr.calibrate_rate_limit(
+            apply=False, start_rate=40, max_rate=40, duration=0.1
+        )
+
+        assert rate == 40
+        assert self.xlr.rate_limit == 20
+        assert self.xlr.get_rate_limiter().rate == 20
@@ -0,0 +1,98 @@
+from goxlr.commands.goxlr import COMMAND_PRIORITIES
+from goxlr.commands.reconcile import plan_state
+from goxlr.mock import generate_status
+from goxlr.types.enums import Channel, Fader, MuteState
+
+
+def mixer():
+    status = generate_status()
+    return next(iter(status["mixers"].values()))
+
+
+def plan(current, desired):
+    return plan_state(current, desired, COMMAND_PRIORITIES)
+
+
+def test_equal_state_sends_nothing():
+    current = mixer()
+    report, stages = plan(current, {"levels": current["levels"]})
+    assert report.commands == [] and report.changes == [] and stages == []
+
+
+def test_only_differences_are_sent():
+    current = mixer()
+    report, _ = plan(
+        current,
+        {
+            "levels": {
+                "volumes": {
+                    Channel.Mic: current["levels"]["volumes"]["Mic"],
+                    Channel.Chat: 1,
+                }
+            }
+        },
+    )
+    assert report.commands == [{"SetVolume": ["Chat", 1]}]
+    assert report.changes == [
+        ("/levels/volumes/Chat", current["levels"]["volumes"]["Chat"], 1)
+    ]
+
+
+def test_multi_value_commands_merge_with_current_values():
+    current = mixer()
+    colours = current["lighting"]["faders"]["A"]["colours"]
+    report, _ = plan(
+        current, {"lighting": {"faders": {"A": {"colours": {"colour_two": "123456"}}}}}
+    )
+    assert report.commands == [
+        {"SetFaderColours": ["A", colours["colour_one"], "123456"]}
+    ]
+
+
+def test_stages_order_mutes_first_and_unmutes_late():
+    current = mixer()
+    current["fader_status"]["B"]["mute_state"] = "MutedToAll"
+    report, stages = plan(
+        current,
+        {
+            "fader_status": {
+                Fader.A: {"channel": "Chat", "mute_state": MuteState.MutedToAll},
+                Fader.B: {"mute_state": MuteState.Unmuted},
+            },
+            "levels": {"volumes": {"Mic": 1}},
+            "lighting": {"faders": {"A": {"style": "Meter"}}},
+        },
+    )
+    assert [next(iter(p)) for stage in stages for p in stage] == [
+        "SetFaderMuteState",
+        "SetFader",
+        "SetVolume",
+        "SetFaderMuteState",
+        "SetFaderDisplayStyle",
+    ]
+    assert stages[0] == [{"SetFaderMuteState": ["A", "MutedToAll"]}]
+    assert stages[3] == [{"SetFaderMuteState": ["B", "Unmuted"]}]
+    assert report.commands == [p for stage in stages for p in stage]
+
+
+def test_unsupported_paths_are_reported():
+    current = mixer()
+    report, _ = plan(current, {"profile_name": "Other", "missing": 1})
+    assert sorted(report.unsupported) == ["/missing", "/profile_name"]
+    assert report.commands == []
+
+
+def test_changing_preset_sends_every_wanted_effect_value():
+    current = mixer()
+    reverb = current["effects"]["current"]["reverb"]
+    report, stages = plan(
+        current,
+        {
+            "effects": {
+                "active_preset": "Preset6",
+                "current": {"reverb": {"amount": reverb["amount"]}},
+            }
+        },
+    )
+    assert stages[0] == [{"SetActiveEffectPreset": "Preset6"}]
+    assert {"SetReverbAmount": reverb["amount"]} in stages[1]
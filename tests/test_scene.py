@@ -0,0 +1,51 @@
+import pickle
+
+import pytest
+
+from goxlr.codec import pack
+from goxlr.mock import generate_status
+from goxlr.scene import SCENE_MAGIC, SCENE_VERSION, Scene, capture
+from goxlr.types.enums import SceneSection
+
+
+def mixer():
+    return next(iter(generate_status()["mixers"].values()))
+
+
+@pytest.mark.parametrize("codec", ["json", "orjson"])
+def test_scene_round_trip(codec):
+    scene = capture(mixer(), [SceneSection.Levels, SceneSection.Effects])
+
+    loaded = Scene.loads(scene.dumps(codec), codec)
+
+    assert loaded == scene
+    assert set(loaded.state) == {"levels", "effects"}
+
+
+def test_capture_shares_nothing_with_the_mixer():
+    raw = mixer()
+    scene = capture(raw, [SceneSection.Levels])
+
+    scene.state["levels"]["volumes"]["Mic"] = -1
+
+    assert raw["levels"]["volumes"]["Mic"] != -1
+
+
+def test_pickles_are_not_loaded():
+    data = pickle.dumps((1, ["Levels"], {}))
+
+    with pytest.raises(ValueError):
+        Scene.loads(data)
+
+
+def test_damaged_and_unknown_scenes_are_rejected():
+    data = capture(mixer(), [SceneSection.Router]).dumps()
+
+    with pytest.raises(ValueError):
+        Scene.loads(data[:-8])
+    with pytest.raises(ValueError):
+        Scene.loads(pack({}, SCENE_MAGIC, SCENE_VERSION + 1))
+    with pytest.raises(ValueError):
+        Scene.loads(
+            pack({"sections": ["Nope"], "state": {}}, SCENE_MAGIC, SCENE_VERSION)
+        )
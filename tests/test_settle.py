@@ -0,0 +1,62 @@
+import asyncio
+
+from goxlr.types.enums import Channel
+
+from .base import DaemonTestCase
+
+
+class TestSettle(DaemonTestCase):
+    # the daemon's patch arrives a while after the command is answered
+    daemon_options = {"patch_delay": 0.03}
+    client_options = {"optimistic": False}
+
+    def path(self, channel: Channel) -> str:
+        return f"/mixers/{self.xlr.serial}/levels/volumes/{channel.name}"
+
+    async def test_waits_for_the_patches_of_a_command(self):
+        patches = await self.xlr.settle(
+            quiet_ms=100, command=self.xlr.set_volume(Channel.Mic, 12)
+        )
+
+        assert [(p.path, p.value) for p in patches] == [(self.path(Channel.Mic), 12)]
+        assert self.xlr.get_volume(Channel.Mic) == 12
+        assert not len(self.xlr.subscriptions)
+
+    async def test_waits_for_a_burst_to_end(self):
+        async def burst():
+            for volume in range(5):
+                await self.daemon.apply([(self.path(Channel.Chat), volume)])
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(burst())
+        patches = await self.xlr.settle(quiet_ms=50)
+
+        assert task.done()
+        assert [p.value for p in patches] == list(range(5))
+        assert self.xlr.get_volume(Channel.Chat) == 4
+
+    async def test_returns_after_the_quiet_time_if_nothing_arrives(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        assert await self.xlr.settle(quiet_ms=30) == []
+        assert 0.02 < loop.time() - started < 0.5
+
+    async def test_times_out_while_patches_keep_arriving(self):
+        async def stream():
+            volume = 0
+            while True:
+                volume = (volume + 1) % 100
+                await self.daemon.apply([(self.path(Channel.Chat), volume)])
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(stream())
+        self.addCleanup(task.cancel)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.xlr.settle(quiet_ms=50, timeout=0.2)
+
+        assert 0.15 < loop.time() - started < 1
+        assert not len(self.xlr.subscriptions)
@@ -0,0 +1,54 @@
+import asyncio
+
+from goxlr.types.enums import Channel, Fader
+
+from .base import DaemonTestCase
+
+
+class TestSkipUnchanged(DaemonTestCase):
+    daemon_options = {"latency": 0.01}
+    client_options = {"skip_unchanged": True}
+
+    async def test_writes_of_the_current_value_are_not_sent(self):
+        volume = self.xlr.get_volume(Channel.Mic)
+
+        assert await self.xlr.set_volume(Channel.Mic, volume) == "Ok"
+        assert await self.xlr.set_volume(Channel.Mic, volume + 1) == "Ok"
+
+        assert self.daemon.received["Command"] == 1
+        assert (self.xlr.write_cache_hits, self.xlr.write_cache_misses) == (1, 1)
+
+    async def test_force_sends_anyway(self):
+        with self.xlr.force():
+            await self.xlr.set_volume(Channel.Mic, self.xlr.get_volume(Channel.Mic))
+
+        assert self.daemon.received["Command"] == 1
+        assert (self.xlr.write_cache_hits, self.xlr.write_cache_misses) == (0, 0)
+
+    async def test_a_value_with_a_write_in_flight_is_sent(self):
+        volume = self.xlr.get_volume(Channel.Mic)
+
+        await asyncio.gather(
+            self.xlr.set_volume(Channel.Mic, volume + 1),
+            self.xlr.set_volume(Channel.Mic, volume),
+        )
+
+        assert self.daemon.received["Command"] == 2
+        assert not self.xlr.unanswered_writes
+
+    async def test_a_stale_status_is_not_trusted(self):
+        self.xlr.status_stale = True
+
+        await self.xlr.set_volume(Channel.Mic, self.xlr.get_volume(Channel.Mic))
+
+        assert self.daemon.received["Command"] == 1
+
+    async def test_mutes_are_always_sent(self):
+        # e.g. the button was just pressed and its patch is on the way
+        state = self.xlr.mixer.fader_status[Fader.A].mute_state
+
+        await self.xlr.set_fader_mute_state(Fader.A, state)
+        await self.xlr.set_cough_mute_state(self.xlr.mixer.cough_button.mute_state)
+
+        assert self.daemon.received["Command"] == 2
+        assert (self.xlr.write_cache_hits, self.xlr.write_cache_misses) == (0, 0)
@@ -0,0 +1,156 @@
+import asyncio
+
+from goxlr.error import DaemonError
+from goxlr.socket import OutboundRequest, Socket
+from goxlr.types.enums import (
+    Channel,
+    CommandPriority,
+    IDType,
+    InputDevice,
+    OutputDevice,
+)
+
+from .base import DaemonTestCase
+
+
+def test_ids_skip_reserved_and_in_flight():
+    socket = Socket("localhost", 0)
+    socket.next_id = IDType.Patch.value - 2
+    socket.response_futures[1] = None
+
+    ids = [socket._Socket__allocate_id() for _ in range(3)]
+
+    assert ids == [IDType.Patch.value - 2, IDType.Patch.value - 1, 2]
+
+
+def test_lanes_send_mutes_first_and_only_hold_back_other_lanes():
+    socket = Socket("localhost", 0, max_in_flight=1)
+    for i, priority in enumerate(
+        [CommandPriority.Lighting, CommandPriority.Audio, CommandPriority.Mute]
+    ):
+        socket.lanes[priority].append(OutboundRequest(i, "", priority))
+
+    order = [socket._Socket__next_request().priority]
+    order.append(socket._Socket__next_request().priority)
+    assert socket._Socket__next_request() is None  # the one slot is taken
+
+    socket.in_flight = 0
+    order.append(socket._Socket__next_request().priority)
+
+    assert order == [
+        CommandPriority.Mute,
+        CommandPriority.Audio,
+        CommandPriority.Lighting,
+    ]
+
+
+class TestMockDaemon(DaemonTestCase):
+    async def test_command_updates_daemon_and_client(self):
+        assert await self.xlr.set_volume(Channel.Mic, 12) == "Ok"
+        assert (
+            self.daemon.status["mixers"][self.xlr.serial]["levels"]["volumes"]["Mic"]
+            == 12
+        )
+        assert self.xlr.get_volume(Channel.Mic) == 12
+
+    async def test_daemon_changes_reach_the_client(self):
+        path = f"/mixers/{self.xlr.serial}/levels/volumes/Chat"
+        await self.daemon.apply([(path, 33)])
+        await self.xlr.settle(quiet_ms=20)
+        assert self.xlr.get_volume(Channel.Chat) == 33
+
+    async def test_errors_are_raised(self):
+        self.daemon.errors["SetVolume"] = "Nope"
+        with self.assertRaises(DaemonError):
+            await self.xlr.set_volume(Channel.Mic, 1)
+
+    async def test_concurrent_requests(self):
+        results = await asyncio.gather(*(self.xlr.ping() for _ in range(100)))
+        assert results == ["Ok"] * 100
+        assert not self.xlr.response_futures
+
+    async def test_bad_messages_do_not_stop_the_reader(self):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context["exception"])
+        )
+        broadcast = self.daemon._MockDaemon__broadcast
+        for client in self.daemon.clients:
+            await client.send("not json")
+        await broadcast(
+            {
+                "id": IDType.Patch.value,
+                "data": {"Patch": [{"op": "frobnicate", "path": "/config"}]},
+            }
+        )
+
+        assert await asyncio.wait_for(self.xlr.ping(), 1) == "Ok"
+        assert len(errors) == 2
+
+    async def test_send_fails_once_the_reader_is_gone(self):
+        await self.daemon.stop()
+        await asyncio.wait_for(asyncio.shield(self.xlr.reader_task), 1)
+
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(self.xlr.ping(), 1)
+
+    async def test_patch_right_after_the_status_is_kept(self):
+        path = f"/mixers/{self.xlr.serial}/levels/volumes/Mic"
+        process = self.daemon._MockDaemon__process
+
+        def process_then_patch(data):
+            result, changes = process(data)
+            return result, [(path, 7)] if data == "GetStatus" else changes
+
+        self.daemon._MockDaemon__process = process_then_patch
+        await self.xlr.set_volume(Channel.Mic, 1)
+        await self.xlr.settle(quiet_ms=20, command=self.xlr.update())
+
+        assert self.xlr.get_volume(Channel.Mic) == 7
+
+    async def test_patch_after_the_acknowledgement_wins(self):
+        # the daemon clamps the volume and patches in the value it used
+        process = self.daemon._MockDaemon__process
+
+        def clamp(data):
+            result, changes = process(data)
+            return result, [(path, min(value, 100)) for path, value in changes]
+
+        self.daemon._MockDaemon__process = clamp
+        await self.xlr.settle(
+            quiet_ms=20, command=self.xlr.set_volume(Channel.Mic, 150)
+        )
+
+        assert self.xlr.get_volume(Channel.Mic) == 100
+
+
+class TestSetRouter(DaemonTestCase):
+    # the daemon's patch arrives long after set_router() returns
+    daemon_options = {"patch_delay": 5}
+
+    async def check_set_router_updates_the_router(self, optimistic: bool):
+        xlr = await self.connect(optimistic=optimistic)
+        self.addAsyncCleanup(xlr.close)
+        enabled = not xlr.mixer.router[InputDevice.Music][OutputDevice.Headphones]
+
+        await xlr.set_router(InputDevice.Music, OutputDevice.Headphones, enabled)
+
+        assert xlr.mixer.router[InputDevice.Music][OutputDevice.Headphones] is enabled
+        assert (
+            OutputDevice.Headphones in xlr.mixer.routing.outputs[InputDevice.Music]
+        ) is enabled
+
+    async def test_optimistic(self):
+        await self.check_set_router_updates_the_router(optimistic=True)
+
+    async def test_not_optimistic(self):
+        await self.check_set_router_updates_the_router(optimistic=False)
+
+    async def test_other_commands_wait_for_the_patch_if_not_optimistic(self):
+        xlr = await self.connect(optimistic=False)
+        self.addAsyncCleanup(xlr.close)
+        volume = xlr.get_volume(Channel.Mic)
+
+        await xlr.set_volume(Channel.Mic, volume + 1)
+
+        assert xlr.get_volume(Channel.Mic) == volume
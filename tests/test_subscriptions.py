@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+
+import pytest
+
+from goxlr.subscriptions import PatternTrie, Subscription, Subscriptions
+from goxlr.types.enums import OverflowPolicy
+from goxlr.types.models import Patch
+
+
+def subscription(pattern):
+    return Subscription(pattern, lambda patch: None)
+
+
+def replace(path, value=None):
+    return Patch({"op": "replace", "path": path, "value": value})
+
+
+def test_exact_wildcard_and_deep_patterns():
+    trie = PatternTrie()
+    volume = subscription("/mixers/*/levels/volumes/Mic")
+    any_volume = subscription("/mixers/*/levels/volumes/*")
+    everything = subscription("/mixers/**")
+    buttons = subscription("/mixers/*/button_down/*")
+    for s in (volume, any_volume, everything, buttons):
+        trie.add(s)
+
+    assert trie.match("/mixers/S1/levels/volumes/Mic") == {
+        volume,
+        any_volume,
+        everything,
+    }
+    assert trie.match("/mixers/S1/levels/volumes/Chat") == {any_volume, everything}
+    assert trie.match("/config/log_level") == set()
+
+
+def test_replacing_an_ancestor_matches_patterns_below_it():
+    trie = PatternTrie()
+    volume = subscription("/mixers/*/levels/volumes/Mic")
+    trie.add(volume)
+    assert trie.match("/mixers/S1/levels") == {volume}
+    assert trie.match("/mixers") == {volume}
+
+
+def test_remove():
+    trie = PatternTrie()
+    volume = subscription("/mixers/*/levels/volumes/Mic")
+    trie.add(volume)
+    trie.remove(volume)
+    assert len(trie) == 0
+    assert trie.match("/mixers/S1/levels/volumes/Mic") == set()
+
+
+def test_invalid_patterns():
+    with pytest.raises(ValueError):
+        subscription("/mixers/**/levels")
+
+    with pytest.raises(ValueError):
+        Subscription("/a", print, overflow=OverflowPolicy.Raise)
+
+
+class TestDispatch(unittest.IsolatedAsyncioTestCase):
+    async def test_callbacks_get_matching_patches_in_order(self):
+        received = []
+        subscriptions = Subscriptions()
+        subscriptions.add(Subscription("/mixers/*/levels/**", received.append))
+
+        patches = [replace(f"/mixers/S1/levels/volumes/Mic", i) for i in range(3)]
+        subscriptions.dispatch([replace("/mixers/S1/profile_name", "x"), *patches])
+        await asyncio.sleep(0)
+
+        assert received == patches
+
+    async def test_move_matches_its_source(self):
+        received = []
+        subscriptions = Subscriptions()
+        subscriptions.add(Subscription("/a/b", received.append))
+
+        move = Patch({"op": "move", "path": "/c", "from": "/a/b"})
+        subscriptions.dispatch([move])
+        await asyncio.sleep(0)
+
+        assert received == [move]
+
+    async def test_overflow_drops_oldest(self):
+        received = []
+        subscriptions = Subscriptions()
+        s = subscriptions.add(Subscription("/a", received.append, maxsize=2))
+
+        subscriptions.dispatch([replace("/a", i) for i in range(5)])
+        await asyncio.sleep(0)
+
+        assert [p.value for p in received] == [3, 4]
+        assert s.dropped == 3
@@ -0,0 +1,127 @@
+import asyncio
+
+from goxlr.types.enums import (
+    Button,
+    Channel,
+    Fader,
+    MuteState,
+    SampleBank,
+    SampleButton,
+)
+
+from .base import DaemonTestCase
+
+
+class TestWaiters(DaemonTestCase):
+    def path(self, path: str) -> str:
+        return f"/mixers/{self.xlr.serial}{path}"
+
+    async def press(self, *buttons: Button, down: bool = True):
+        await self.daemon.apply(
+            [(self.path(f"/button_down/{b.name}"), down) for b in buttons]
+        )
+
+    async def started(self, waiter) -> asyncio.Task:
+        """
+        Starts a waiter and returns once it is listening for events.
+        """
+        task = asyncio.ensure_future(waiter)
+        while not self.xlr.event_streams and not task.done():
+            await asyncio.sleep(0)
+        assert not task.done()
+        return task
+
+    async def test_satisfied_immediately(self):
+        await self.press(Button.Bleep)
+        await self.xlr.settle(quiet_ms=20)
+
+        result = await asyncio.wait_for(self.xlr.wait_for_button([Button.Bleep]), 1)
+        assert result == {Button.Bleep: True}
+
+        # waiting for a button to be up, which it already is
+        result = await asyncio.wait_for(
+            self.xlr.wait_for_button({Button.Cough: False}), 1
+        )
+        assert result == {Button.Cough: False}
+
+        volume = self.xlr.get_volume(Channel.Mic)
+        assert await self.xlr.wait_for_volume(Channel.Mic, above=volume) == volume
+        assert not self.xlr.event_streams
+
+    async def test_satisfied_by_a_patch(self):
+        task = await self.started(
+            self.xlr.wait_for_button([Button.Bleep, Button.Cough], all_values=True)
+        )
+
+        await self.press(Button.Bleep)
+        await asyncio.sleep(0.02)
+        assert not task.done()  # both have to be down
+
+        await self.press(Button.Cough)
+        assert await asyncio.wait_for(task, 1) == {
+            Button.Bleep: True,
+            Button.Cough: True,
+        }
+
+        task = await self.started(
+            self.xlr.wait_for_button([Button.Bleep, Button.Cough], invert=True)
+        )
+        await self.press(Button.Cough, down=False)
+        assert await asyncio.wait_for(task, 1) == {
+            Button.Bleep: True,
+            Button.Cough: False,
+        }
+        assert not self.xlr.event_streams
+
+    async def test_other_waiters_satisfied_by_a_patch(self):
+        assert self.xlr.get_volume(Channel.Mic) > 10
+        task = await self.started(self.xlr.wait_for_volume(Channel.Mic, below=10))
+        await self.daemon.apply([(self.path("/levels/volumes/Chat"), 0)])
+        await self.daemon.apply([(self.path("/levels/volumes/Mic"), 5)])
+        assert await asyncio.wait_for(task, 1) == 5
+
+        task = await self.started(
+            self.xlr.wait_for_mute_state(MuteState.MutedToAll, fader=Fader.B)
+        )
+        await self.xlr.set_fader_mute_state(Fader.B, MuteState.MutedToAll)
+        assert await asyncio.wait_for(task, 1) is MuteState.MutedToAll
+
+        task = await self.started(
+            self.xlr.wait_for_sample_playing(SampleBank.A, SampleButton.TopLeft)
+        )
+        await self.daemon.apply(
+            [(self.path("/sampler/banks/A/TopLeft/is_playing"), True)]
+        )
+        assert await asyncio.wait_for(task, 1) is True
+
+    async def test_timeout(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.xlr.wait_for_button([Button.Bleep], timeout=0.05)
+
+        assert loop.time() - started >= 0.04
+        assert not self.xlr.event_streams
+
+    async def test_cancelling_removes_the_waiter(self):
+        task = await self.started(self.xlr.wait_for_button([Button.Bleep]))
+        assert len(self.xlr.event_streams) == 1
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+        assert not self.xlr.event_streams
+
+        # a new waiter still sees the patches
+        task = await self.started(self.xlr.wait_for_button([Button.Bleep]))
+        await self.press(Button.Bleep)
+        assert await asyncio.wait_for(task, 1) == {Button.Bleep: True}
+
+    async def test_closing_the_connection_ends_the_wait(self):
+        task = await self.started(self.xlr.wait_for_button([Button.Bleep]))
+        await self.xlr.close()
+
+        with self.assertRaises(ConnectionError):
+            await asyncio.wait_for(task, 1)